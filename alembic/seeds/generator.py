@@ -0,0 +1,497 @@
+"""
+Generador de datos sintéticos con la forma de producción.
+
+Llena, con volúmenes proporcionales a un factor de escala:
+  - reg_linea_*_entrad / reg_linea_*_salid (lotes, bastidores, parrillas y pesos por turno)
+  - fm_control_lote_asiglinea, fm_planning_fnturno, fm_detalle_produccion
+  - fm_gestion_operarios y fm_movimientos_operarios
+  - auditoria_logs
+
+Las distribuciones están sesgadas como en planta: líneas con distinta carga,
+domingos casi vacíos y volumen creciente hacia las fechas recientes, lotes de
+tamaño log-normal, pocos operarios con la mayoría de movimientos (Zipf) y
+auditoría dominada por UPDATE sobre las tablas de salida.
+
+Todo sale de un único "plan" de lotes (fecha, línea, turno, lote), de modo que
+las tablas son coherentes entre sí. La carga usa INSERT con executemany por
+bloques: en SQL Server los engines de la aplicación ya activan
+`fast_executemany` (DB_FAST_EXECUTEMANY); en SQLite se relaja la durabilidad
+durante la carga.
+
+Uso (desde la raíz del proyecto, con DATABASE_URL / AUTH_DATABASE_URL del destino):
+    python alembic/seeds/generator.py --scale 0.1
+    python alembic/seeds/generator.py --scale 1 --days 365 --truncate
+    python alembic/seeds/generator.py --scale 0.05 --tables salida movimientos
+
+Con --scale 1 se generan ~10M de filas.
+"""
+import argparse
+import bisect
+import itertools
+import os
+import random
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+# Agrega la raíz del proyecto al path para encontrar los módulos
+sys.path.insert(0, os.path.realpath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from sqlalchemy import delete, insert, select  # noqa: E402
+from sqlalchemy.engine import Engine  # noqa: E402
+
+LINEAS = (1, 2, 3, 4, 5, 6)
+TURNOS = (1, 2, 3)
+
+# Volúmenes con --scale 1 (~10M de filas en total)
+BASE_VOLUMES = {
+    "salida": 7_200_000,       # repartidas entre las 6 líneas según LINE_WEIGHTS
+    "entrada": 1_200_000,
+    "operarios": 2_500,
+    "movimientos": 1_000_000,
+    "auditoria": 600_000,
+}
+
+# Carga relativa de cada línea y de cada turno
+LINE_WEIGHTS = {1: 0.27, 2: 0.22, 3: 0.18, 4: 0.14, 5: 0.11, 6: 0.08}
+TURNO_WEIGHTS = {1: 0.45, 2: 0.35, 3: 0.20}
+# Hora de inicio y duración (horas) de cada turno
+TURNO_HORARIO = {1: (6, 8), 2: (14, 8), 3: (22, 8)}
+# Lunes..domingo
+WEEKDAY_WEIGHTS = (1.0, 1.0, 1.0, 1.0, 0.95, 0.6, 0.15)
+# Lotes por línea y día (al menos MIN_LOTES_POR_DIA para que siempre existan)
+MIN_LOTES_POR_DIA = 2
+LOTES_POR_DIA_WEIGHTS = {2: 0.15, 3: 0.35, 4: 0.30, 5: 0.15, 6: 0.05}
+# Peso medio por bastidor (kg) según la especie del lote
+ESPECIES_PESO_MEDIO = {"SKIPJACK": 11.5, "YELLOWFIN": 14.0, "BIGEYE": 15.5, "BONITO": 9.0}
+ESPECIES_WEIGHTS = {"SKIPJACK": 0.55, "YELLOWFIN": 0.25, "BIGEYE": 0.12, "BONITO": 0.08}
+
+BASTIDORES = 400
+PARRILLAS = 60
+MOTIVOS_WEIGHTS = {"BAÑO": 0.45, "HIDRATACION": 0.15, "ENFERMERIA": 0.10, "CAMBIO DE LINEA": 0.12,
+                   "REUNION": 0.08, "PERMISO": 0.06, "OTROS": 0.04}
+DESTINOS = {"ENFERMERIA": "Dispensario", "CAMBIO DE LINEA": "Otra línea", "REUNION": "Oficina de producción"}
+AUDIT_ACCIONES_WEIGHTS = {"UPDATE": 0.62, "CREATE": 0.30, "DELETE": 0.08}
+
+DEFAULT_BATCH_SIZE = 10_000
+
+TABLE_GROUPS = ("plan", "salida", "entrada", "operarios", "movimientos", "auditoria")
+
+
+def lote_code(fecha_p: date, linea: int, index: int) -> str:
+    """Código de lote determinista: L + fecha + línea + número de lote del día (1..n)."""
+    return f"L{fecha_p:%y%m%d}{linea}{index:02d}"
+
+
+def operario_code(index: int) -> str:
+    return f"OP{index:05d}"
+
+
+@dataclass(frozen=True)
+class LotePlan:
+    fecha_p: date
+    linea: int
+    turno: int
+    index: int
+    lote: str
+    especie: str
+    peso_medio: float
+    share: float  # peso relativo del lote dentro de la tabla de su línea
+
+
+@dataclass
+class GeneratorConfig:
+    scale: float = 0.1
+    days: int = 365
+    end_date: date = field(default_factory=date.today)
+    seed: int = 42
+    batch_size: int = DEFAULT_BATCH_SIZE
+    lineas: Sequence[int] = LINEAS
+
+    def volume(self, name: str, minimum: int = 1) -> int:
+        return max(minimum, int(BASE_VOLUMES[name] * self.scale))
+
+    @property
+    def fechas(self) -> List[date]:
+        start = self.end_date - timedelta(days=self.days - 1)
+        return [start + timedelta(days=offset) for offset in range(self.days)]
+
+
+def _weighted(rng: random.Random, weights: Dict, k: Optional[int] = None):
+    population, values = list(weights), list(weights.values())
+    if k is None:
+        return rng.choices(population, values)[0]
+    return rng.choices(population, values, k=k)
+
+
+def _day_weights(fechas: List[date]) -> List[float]:
+    """Más volumen hacia las fechas recientes (x2 en todo el rango) y poco los fines de semana."""
+    total = len(fechas)
+    return [
+        WEEKDAY_WEIGHTS[fecha.weekday()] * (1.0 + index / max(1, total - 1))
+        for index, fecha in enumerate(fechas)
+    ]
+
+
+def build_plan(config: GeneratorConfig, rng: random.Random) -> List[LotePlan]:
+    """Lotes por (fecha, línea): cantidad, turno, especie y tamaño relativo."""
+    plan = []
+    for fecha_p, day_weight in zip(config.fechas, _day_weights(config.fechas)):
+        for linea in config.lineas:
+            lotes = _weighted(rng, LOTES_POR_DIA_WEIGHTS)
+            turnos = sorted(_weighted(rng, TURNO_WEIGHTS, k=lotes))
+            for index, turno in enumerate(turnos, start=1):
+                especie = _weighted(rng, ESPECIES_WEIGHTS)
+                plan.append(LotePlan(
+                    fecha_p=fecha_p, linea=linea, turno=turno, index=index,
+                    lote=lote_code(fecha_p, linea, index), especie=especie,
+                    peso_medio=ESPECIES_PESO_MEDIO[especie],
+                    # Tamaño de lote log-normal: la mayoría medianos, algunos muy grandes
+                    share=day_weight * rng.lognormvariate(0, 0.6),
+                ))
+    return plan
+
+
+def _zipf_cum_weights(size: int, exponent: float = 0.9) -> List[float]:
+    return list(itertools.accumulate(1.0 / (rank ** exponent) for rank in range(1, size + 1)))
+
+
+def _hora_turno(rng: random.Random, fecha_p: date, turno: int) -> datetime:
+    inicio, duracion = TURNO_HORARIO[turno]
+    return datetime.combine(fecha_p, datetime.min.time()) + timedelta(
+        hours=inicio, seconds=rng.randrange(duracion * 3600)
+    )
+
+
+def _guid(rng: random.Random) -> str:
+    value = f"{rng.getrandbits(128):032x}"
+    return f"{value[:8]}-{value[8:12]}-{value[12:16]}-{value[16:20]}-{value[20:]}"
+
+
+def _rows_per_lote(plan: List[LotePlan], total: int, rng: random.Random) -> Iterator[LotePlan]:
+    """Asigna `total` filas a los lotes según su tamaño relativo, en orden cronológico."""
+    cum_weights = list(itertools.accumulate(lote.share for lote in plan))
+    picks = sorted(rng.choices(range(len(plan)), cum_weights=cum_weights, k=total))
+    for index in picks:
+        yield plan[index]
+
+
+class Operarios:
+    """Operarios por línea con actividad Zipf (pocos concentran la mayoría de registros)."""
+
+    def __init__(self, total: int, lineas: Sequence[int], rng: random.Random):
+        self.rows = []
+        self.by_linea: Dict[int, List[str]] = {linea: [] for linea in lineas}
+        line_weights = {linea: LINE_WEIGHTS[linea] for linea in lineas}
+        for index in range(1, total + 1):
+            linea = _weighted(rng, line_weights)
+            codigo = operario_code(index)
+            self.by_linea[linea].append(codigo)
+            self.rows.append({"codigo": codigo, "linea": linea, "turno": _weighted(rng, TURNO_WEIGHTS)})
+        self.codigos = [row["codigo"] for row in self.rows]
+        self.linea_de = {row["codigo"]: row["linea"] for row in self.rows}
+        self._cum_all = _zipf_cum_weights(len(self.codigos))
+        self._cum_by_linea = {linea: _zipf_cum_weights(len(codigos)) for linea, codigos in self.by_linea.items()}
+
+    def pick(self, rng: random.Random, linea: Optional[int] = None) -> str:
+        if linea is not None and self.by_linea.get(linea):
+            codigos, cum = self.by_linea[linea], self._cum_by_linea[linea]
+        else:
+            codigos, cum = self.codigos, self._cum_all
+        return codigos[bisect.bisect_left(cum, rng.random() * cum[-1])]
+
+
+# --- Generadores de filas ---
+
+def salida_rows(plan: List[LotePlan], total: int, operarios: Operarios,
+                rng: random.Random) -> Iterator[dict]:
+    gauss, randrange = rng.gauss, rng.randrange
+    for lote in _rows_per_lote(plan, total, rng):
+        # Cola de pesos anómalos (~1%): bastidores mal pesados o dobles
+        peso = gauss(lote.peso_medio, lote.peso_medio * 0.08)
+        if rng.random() < 0.01:
+            peso *= rng.choice((0.4, 1.9))
+        yield {
+            "fecha_p": lote.fecha_p,
+            "fecha": _hora_turno(rng, lote.fecha_p, lote.turno),
+            "peso_kg": round(max(peso, 0.5), 3),
+            "codigo_bastidor": f"B{randrange(1, BASTIDORES + 1):04d}",
+            "p_lote": lote.lote,
+            "codigo_parrilla": f"P{randrange(1, PARRILLAS + 1):03d}",
+            "codigo_obrero": operarios.pick(rng, lote.linea),
+            "guid": _guid(rng),
+        }
+
+
+def entrada_rows(plan: List[LotePlan], total: int, rng: random.Random) -> Iterator[dict]:
+    randrange = rng.randrange
+    secuencias: Dict[str, int] = {}
+    for lote in _rows_per_lote(plan, total, rng):
+        fecha = _hora_turno(rng, lote.fecha_p, lote.turno)
+        secuencia = secuencias[lote.lote] = secuencias.get(lote.lote, 0) + 1
+        yield {
+            "fecha_p": lote.fecha_p,
+            "fecha": fecha,
+            # Parrilla cargada: ~40 bastidores del peso medio de la especie
+            "peso_kg": round(max(rng.gauss(lote.peso_medio * 40, lote.peso_medio * 4), 1.0), 3),
+            "turno": lote.turno,
+            "codigo_secuencia": f"{lote.lote}-{secuencia:04d}",
+            "codigo_parrilla": f"P{randrange(1, PARRILLAS + 1):03d}",
+            "p_lote": lote.lote,
+            "hora_inicio": fecha.time(),
+            "guid": _guid(rng),
+        }
+
+
+def control_lote_rows(plan: List[LotePlan], config: GeneratorConfig, rng: random.Random) -> Iterator[dict]:
+    for lote in plan:
+        if lote.fecha_p == config.end_date:
+            estado = "PROCESS"
+        else:
+            estado = "STOPPED" if rng.random() < 0.03 else "FINISHED"
+        yield {
+            "fecha_p": lote.fecha_p,
+            "lote": lote.lote,
+            "linea": str(lote.linea),
+            "estado": estado,
+            "fecha_asig": _hora_turno(rng, lote.fecha_p, lote.turno) - timedelta(minutes=rng.randrange(5, 90)),
+            "tipo_limpieza": _weighted(rng, {1: 0.7, 2: 0.25, 3: 0.05}),
+            "turno": lote.turno,
+        }
+
+
+def planning_rows(plan: List[LotePlan], rng: random.Random) -> Iterator[dict]:
+    turnos = sorted({(lote.fecha_p, lote.linea, lote.turno) for lote in plan})
+    for fecha_p, linea, turno in turnos:
+        inicio, duracion = TURNO_HORARIO[turno]
+        # Fin de turno planificado con algo de holgura (horas extra frecuentes)
+        yield {
+            "plnn_fecha_p": fecha_p,
+            "plnn_turno": turno,
+            "plnn_linea": str(linea),
+            "plnn_hora_fin": datetime.combine(fecha_p, datetime.min.time())
+            + timedelta(hours=inicio + duracion, minutes=_weighted(rng, {0: 0.6, 30: 0.25, 60: 0.1, 120: 0.05})),
+        }
+
+
+def detalle_produccion_rows(plan: List[LotePlan], rng: random.Random) -> Iterator[dict]:
+    for lote in plan:
+        base = lote.share * 400
+        yield {
+            "DPRO_FECPROD": lote.fecha_p,
+            "DPRO_LOTE": lote.lote,
+            "DPRO_PMIGA": round(base * rng.uniform(0.04, 0.08), 3),
+            "DPRO_PPANZA": round(base * rng.uniform(0.06, 0.12), 3),
+            "DPRO_PDESPERDICIO": round(base * rng.uniform(0.01, 0.05), 3) if rng.random() > 0.05 else None,
+            "DPRO_LINEA": lote.linea,
+            "DPRO_TURNOX": lote.turno,
+        }
+
+
+def operarios_rows(operarios: Operarios, config: GeneratorConfig, rng: random.Random) -> Iterator[dict]:
+    first_day = datetime.combine(config.fechas[0], datetime.min.time())
+    for row in operarios.rows:
+        yield {
+            "OPER_CODIGO": row["codigo"],
+            "OPER_ESTADO": "INACTIVO" if rng.random() < 0.05 else "ACTIVO",
+            "OPER_FECCRE": first_day - timedelta(days=rng.randrange(0, 1500)),
+            "OPER_TURNO": row["turno"],
+            "OPER_LINEA": row["linea"],
+        }
+
+
+def movimientos_rows(config: GeneratorConfig, total: int, operarios: Operarios,
+                     rng: random.Random) -> Iterator[dict]:
+    """Pares SALIDA/ENTRADA del mismo operario; ~8% cambia de línea al salir."""
+    fechas = config.fechas
+    cum_days = list(itertools.accumulate(_day_weights(fechas)))
+    dias = sorted(rng.choices(range(len(fechas)), cum_weights=cum_days, k=(total + 1) // 2))
+    generated = 0
+    for dia in dias:
+        fecha_p = fechas[dia]
+        codigo = operarios.pick(rng)
+        linea = operarios.linea_de[codigo]
+        if rng.random() < 0.08:
+            linea = rng.choice(config.lineas)
+        motivo = _weighted(rng, MOTIVOS_WEIGHTS)
+        salida = _hora_turno(rng, fecha_p, _weighted(rng, TURNO_WEIGHTS))
+        regreso = salida + timedelta(minutes=max(2, int(rng.expovariate(1 / 12))))
+        for tipo, hora in (("SALIDA", salida), ("ENTRADA", regreso)):
+            if generated == total:
+                return
+            generated += 1
+            yield {
+                "linea": str(linea),
+                "fecha_p": fecha_p,
+                "tipo_movimiento": tipo,
+                "motivo": motivo,
+                "codigo_operario": codigo,
+                "destino": DESTINOS.get(motivo),
+                "hora": hora,
+                "observacion": None,
+            }
+
+
+def auditoria_rows(config: GeneratorConfig, total: int, usuarios: List[Tuple[int, str]],
+                   modelos: Dict[str, float], entidades_max: int, rng: random.Random) -> Iterator[dict]:
+    fechas = config.fechas
+    cum_days = list(itertools.accumulate(_day_weights(fechas)))
+    dias = sorted(rng.choices(range(len(fechas)), cum_weights=cum_days, k=total))
+    usuarios = usuarios or [(None, None)]
+    cum_usuarios = _zipf_cum_weights(len(usuarios), exponent=1.2)
+    for dia in dias:
+        user_id, username = usuarios[bisect.bisect_left(cum_usuarios, rng.random() * cum_usuarios[-1])]
+        accion = _weighted(rng, AUDIT_ACCIONES_WEIGHTS)
+        peso = round(rng.uniform(8, 16), 3)
+        anterior = None if accion == "CREATE" else {"peso_kg": peso}
+        nuevo = None if accion == "DELETE" else {"peso_kg": round(peso + rng.uniform(0.01, 0.5), 3)}
+        yield {
+            "modelo": _weighted(rng, modelos),
+            "entidad_id": str(rng.randrange(1, entidades_max + 1)),
+            "accion": accion,
+            "datos_anteriores": anterior,
+            "datos_nuevos": nuevo,
+            "ejecutado_por_id": user_id,
+            "ejecutado_por_json": {"id_usuario": user_id, "username": username} if user_id else None,
+            "fecha": _hora_turno(rng, fechas[dia], _weighted(rng, TURNO_WEIGHTS)),
+        }
+
+
+# --- Carga ---
+
+def _prepare_engine(engine: Engine) -> None:
+    """En SQLite, durante la carga, se cambia durabilidad por velocidad."""
+    if engine.dialect.name == "sqlite":
+        with engine.begin() as conn:
+            conn.exec_driver_sql("PRAGMA journal_mode=WAL")
+            conn.exec_driver_sql("PRAGMA synchronous=OFF")
+
+
+def bulk_load(engine: Engine, table, rows: Iterable[dict], batch_size: int = DEFAULT_BATCH_SIZE,
+              label: Optional[str] = None) -> int:
+    """INSERT por bloques con executemany (fast_executemany en SQL Server); una transacción por bloque."""
+    label = label or table.name
+    total, started = 0, time.perf_counter()
+    statement = insert(table)
+    iterator = iter(rows)
+    while True:
+        batch = list(itertools.islice(iterator, batch_size))
+        if not batch:
+            break
+        with engine.begin() as conn:
+            conn.execute(statement, batch)
+        total += len(batch)
+    elapsed = time.perf_counter() - started
+    rate = total / elapsed if elapsed else 0
+    print(f"  {label:<28} {total:>11,} filas  {elapsed:7.1f}s  ({rate:,.0f} filas/s)", flush=True)
+    return total
+
+
+def generate(config: GeneratorConfig, tables: Sequence[str] = TABLE_GROUPS,
+             truncate: bool = False) -> Dict[str, int]:
+    """
+    Genera y carga los grupos de tablas indicados. Devuelve las filas
+    insertadas por tabla. Requiere que el esquema ya exista.
+    """
+    import src.shared.models  # noqa: F401  registra todos los modelos en sus bases
+    from src.modules.administracion_service.src.infrastructure.db.models import (
+        ControlLoteAsiglineaORM, DetalleProduccionORM, PlanningTurnoORM,
+    )
+    from src.modules.auth_service.src.infrastructure.db.models import AuditoriaLogORM, Usuario
+    from src.modules.lineas_entrada_salida_service.src.infrastructure.db.repositories.lineas_entrada_repository import \
+        LINEA_ORM_MAPPER as ENTRADA_MODELS
+    from src.modules.lineas_entrada_salida_service.src.infrastructure.db.repositories.lineas_salida_repository import \
+        LINEA_ORM_MAPPER as SALIDA_MODELS
+    from src.modules.management_service.src.infrastructure.db.models import OperariosORM, WorkerMovementORM
+    from src.shared.database import engine_auth, engine_main
+
+    unknown = set(tables) - set(TABLE_GROUPS)
+    if unknown:
+        raise ValueError(f"Grupos de tablas desconocidos: {', '.join(sorted(unknown))}")
+
+    rng = random.Random(config.seed)
+    plan = build_plan(config, rng)
+    # Los operarios se generan siempre: salida y movimientos los referencian
+    operarios = Operarios(config.volume("operarios", minimum=60), config.lineas, random.Random(config.seed + 1))
+    line_weight_total = sum(LINE_WEIGHTS[linea] for linea in config.lineas)
+
+    targets: Dict[str, List[Tuple[Engine, object]]] = {
+        "plan": [(engine_main, model.__table__)
+                 for model in (ControlLoteAsiglineaORM, PlanningTurnoORM, DetalleProduccionORM)],
+        "salida": [(engine_main, SALIDA_MODELS[linea].__table__) for linea in config.lineas],
+        "entrada": [(engine_main, ENTRADA_MODELS[linea].__table__) for linea in config.lineas],
+        "operarios": [(engine_main, OperariosORM.__table__)],
+        "movimientos": [(engine_main, WorkerMovementORM.__table__)],
+        "auditoria": [(engine_auth, AuditoriaLogORM.__table__)],
+    }
+
+    for engine in (engine_main, engine_auth):
+        _prepare_engine(engine)
+    if truncate:
+        for group in tables:
+            for engine, table in targets[group]:
+                with engine.begin() as conn:
+                    conn.execute(delete(table))
+
+    counts: Dict[str, int] = {}
+
+    def load(group: str, table, rows_factory: Callable[[], Iterable[dict]]) -> None:
+        engine = next(engine for engine, target in targets[group] if target is table)
+        counts[table.name] = bulk_load(engine, table, rows_factory(), config.batch_size)
+
+    print(f"Plan: {len(plan):,} lotes en {config.days} días (escala {config.scale})")
+    if "plan" in tables:
+        load("plan", ControlLoteAsiglineaORM.__table__, lambda: control_lote_rows(plan, config, rng))
+        load("plan", PlanningTurnoORM.__table__, lambda: planning_rows(plan, rng))
+        load("plan", DetalleProduccionORM.__table__, lambda: detalle_produccion_rows(plan, rng))
+
+    for linea in config.lineas:
+        share = LINE_WEIGHTS[linea] / line_weight_total
+        plan_linea = [lote for lote in plan if lote.linea == linea]
+        if "salida" in tables:
+            total = max(1, int(config.volume("salida") * share))
+            load("salida", SALIDA_MODELS[linea].__table__,
+                 lambda: salida_rows(plan_linea, total, operarios, rng))
+        if "entrada" in tables:
+            total = max(1, int(config.volume("entrada") * share))
+            load("entrada", ENTRADA_MODELS[linea].__table__, lambda: entrada_rows(plan_linea, total, rng))
+
+    if "operarios" in tables:
+        load("operarios", OperariosORM.__table__, lambda: operarios_rows(operarios, config, rng))
+    if "movimientos" in tables:
+        load("movimientos", WorkerMovementORM.__table__,
+             lambda: movimientos_rows(config, config.volume("movimientos"), operarios, rng))
+
+    if "auditoria" in tables:
+        with engine_auth.connect() as conn:
+            usuarios = [tuple(row) for row in conn.execute(select(Usuario.id_usuario, Usuario.username))]
+        # Las tablas de salida concentran la auditoría (agregar tara/panza, correcciones de peso)
+        modelos = {SALIDA_MODELS[linea].__tablename__: LINE_WEIGHTS[linea] for linea in config.lineas}
+        modelos.update({"fm_movimientos_operarios": 0.15, "fm_control_lote_asiglinea": 0.05, "control_tara": 0.02})
+        entidades_max = max(1, int(config.volume("salida") / len(config.lineas)))
+        load("auditoria", AuditoriaLogORM.__table__,
+             lambda: auditoria_rows(config, config.volume("auditoria"), usuarios, modelos, entidades_max, rng))
+
+    return counts
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Genera datos sintéticos con forma de producción")
+    parser.add_argument("--scale", type=float, default=0.1, help="Factor de escala (1 = ~10M de filas)")
+    parser.add_argument("--days", type=int, default=365, help="Días de producción hacia atrás desde hoy")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--tables", nargs="+", choices=TABLE_GROUPS, default=list(TABLE_GROUPS))
+    parser.add_argument("--truncate", action="store_true", help="Vacía las tablas destino antes de cargar")
+    args = parser.parse_args(argv)
+
+    config = GeneratorConfig(scale=args.scale, days=args.days, seed=args.seed, batch_size=args.batch_size)
+    started = time.perf_counter()
+    counts = generate(config, args.tables, truncate=args.truncate)
+    print(f"Total: {sum(counts.values()):,} filas en {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""indices_reg_linea
+
+Revision ID: 4b7e2d9a1c3f
+Revises: c9564f521dc2
+Create Date: 2026-10-18 21:30:00.000000
+
+Índices (fecha_p, p_lote, id) INCLUDE (peso_kg) en las doce tablas
+reg_linea_*_entrad / reg_linea_*_salid de la base principal.
+"""
+from contextlib import contextmanager
+from typing import Sequence, Union
+
+from alembic import op
+from alembic.operations import Operations
+from alembic.runtime.migration import MigrationContext
+import sqlalchemy as sa
+
+from src.shared.config import settings
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b7e2d9a1c3f'
+down_revision: Union[str, Sequence[str], None] = 'c9564f521dc2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LINEAS = ("uno", "dos", "tres", "cuatro", "cinco", "seis")
+REG_LINEA_TABLES = [f"reg_linea_{linea}_{tipo}" for tipo in ("entrad", "salid") for linea in LINEAS]
+
+
+def _index_name(table: str) -> str:
+    return f"idx_{table}_fecha_p_lote"
+
+
+@contextmanager
+def _main_db_operations():
+    """
+    env.py migra la base de autenticación; las tablas reg_linea viven en la
+    base principal, así que se opera sobre ella con una conexión propia.
+    En modo offline (--sql) se emite el DDL en el script generado.
+    """
+    if op.get_context().as_sql:
+        yield op, None
+        return
+    engine = sa.create_engine(settings.database_url, poolclass=sa.pool.NullPool)
+    try:
+        with engine.begin() as connection:
+            yield Operations(MigrationContext.configure(connection)), sa.inspect(connection)
+    finally:
+        engine.dispose()
+
+
+def _existing_indexes(inspector, table: str) -> Union[set, None]:
+    """Nombres de índices de la tabla; None si la tabla no existe en esta base."""
+    if inspector is None:
+        return set()
+    if not inspector.has_table(table):
+        return None
+    return {index["name"] for index in inspector.get_indexes(table)}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with _main_db_operations() as (main_op, inspector):
+        for table in REG_LINEA_TABLES:
+            existing = _existing_indexes(inspector, table)
+            if existing is None or _index_name(table) in existing:
+                continue
+            main_op.create_index(
+                _index_name(table), table, ["fecha_p", "p_lote", "id"], mssql_include=["peso_kg"]
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with _main_db_operations() as (main_op, inspector):
+        for table in REG_LINEA_TABLES:
+            existing = _existing_indexes(inspector, table)
+            if inspector is not None and (existing is None or _index_name(table) not in existing):
+                continue
+            main_op.drop_index(_index_name(table), table_name=table)
@@ -0,0 +1,81 @@
+"""indices_movimientos_operarios
+
+Revision ID: 8d3f1a6c2b5e
+Revises: 4b7e2d9a1c3f
+Create Date: 2026-10-18 23:10:00.000000
+
+Índices de la consulta paginada de movimientos en la base principal:
+(fecha_p DESC, hora DESC) en fm_movimientos_operarios para el ORDER BY y
+(OPER_CODIGO, OPER_TURNO) en fm_gestion_operarios para el semi-join por turno.
+"""
+from contextlib import contextmanager
+from typing import Sequence, Union
+
+from alembic import op
+from alembic.operations import Operations
+from alembic.runtime.migration import MigrationContext
+import sqlalchemy as sa
+
+from src.shared.config import settings
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d3f1a6c2b5e'
+down_revision: Union[str, Sequence[str], None] = '4b7e2d9a1c3f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (nombre, tabla, columnas, columnas INCLUDE en SQL Server)
+INDEXES = [
+    ("idx_fm_movimientos_operarios_fecha_p_hora", "fm_movimientos_operarios",
+     [sa.text("fecha_p DESC"), sa.text("hora DESC")], ["linea", "codigo_operario"]),
+    ("idx_fm_gestion_operarios_codigo_turno", "fm_gestion_operarios",
+     ["OPER_CODIGO", "OPER_TURNO"], []),
+]
+
+
+@contextmanager
+def _main_db_operations():
+    """
+    env.py migra la base de autenticación; movimientos y operarios viven en
+    la base principal, así que se opera sobre ella con una conexión propia.
+    En modo offline (--sql) se emite el DDL en el script generado.
+    """
+    if op.get_context().as_sql:
+        yield op, None
+        return
+    engine = sa.create_engine(settings.database_url, poolclass=sa.pool.NullPool)
+    try:
+        with engine.begin() as connection:
+            yield Operations(MigrationContext.configure(connection)), sa.inspect(connection)
+    finally:
+        engine.dispose()
+
+
+def _existing_indexes(inspector, table: str) -> Union[set, None]:
+    """Nombres de índices de la tabla; None si la tabla no existe en esta base."""
+    if inspector is None:
+        return set()
+    if not inspector.has_table(table):
+        return None
+    return {index["name"] for index in inspector.get_indexes(table)}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with _main_db_operations() as (main_op, inspector):
+        for name, table, columns, include in INDEXES:
+            existing = _existing_indexes(inspector, table)
+            if existing is None or name in existing:
+                continue
+            main_op.create_index(name, table, columns, mssql_include=include)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with _main_db_operations() as (main_op, inspector):
+        for name, table, _, _ in INDEXES:
+            existing = _existing_indexes(inspector, table)
+            if inspector is not None and (existing is None or name not in existing):
+                continue
+            main_op.drop_index(name, table_name=table)
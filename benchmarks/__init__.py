@@ -0,0 +1 @@
+"""Harness de benchmarks de la API: sembrado SQLite, escenarios y corredor."""
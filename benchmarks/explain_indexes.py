@@ -0,0 +1,186 @@
+"""
+Verifica con planes de ejecución que las consultas calientes hacen seek sobre
+sus índices (y no recorren la tabla).
+
+Las sentencias se construyen con los mismos filtros que los repositorios y
+se explican según el motor: SQLite (EXPLAIN QUERY PLAN), SQL Server
+(SET SHOWPLAN_TEXT ON) o PostgreSQL (EXPLAIN). Nada se ejecuta: los UPDATE
+solo se explican.
+
+Uso:
+    python -m benchmarks.explain_indexes --scale smoke   # base sembrada del benchmark
+    python -m benchmarks.explain_indexes                 # DATABASE_URL del entorno
+    python -m benchmarks.explain_indexes --verbose       # imprime los planes
+"""
+import argparse
+import os
+import sys
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Callable, List, Optional
+
+from sqlalchemy import func, select, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.sql import Executable
+
+
+@dataclass(frozen=True)
+class PlanCheck:
+    name: str
+    statement: Executable
+    expected_index: str
+
+
+def explain(conn: Connection, statement: Executable) -> List[str]:
+    """Líneas del plan estimado de `statement` en el motor de `conn`."""
+    sql = str(statement.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True}))
+    dialect = conn.dialect.name
+    if dialect == "sqlite":
+        return [str(row[-1]) for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}")]
+    if dialect == "postgresql":
+        return [str(row[0]) for row in conn.exec_driver_sql(f"EXPLAIN {sql}")]
+    if dialect == "mssql":
+        # SHOWPLAN_TEXT devuelve dos result sets (sentencia y plan) sin ejecutar la consulta
+        cursor = conn.connection.cursor()
+        try:
+            cursor.execute("SET SHOWPLAN_TEXT ON")
+            cursor.execute(sql)
+            lines = []
+            while True:
+                lines.extend(str(row[0]) for row in cursor.fetchall())
+                if not cursor.nextset():
+                    break
+            return lines
+        finally:
+            cursor.execute("SET SHOWPLAN_TEXT OFF")
+            cursor.close()
+    raise ValueError(f"Motor sin soporte para EXPLAIN: {dialect}")
+
+
+def uses_index_seek(dialect: str, plan: List[str], index_name: str) -> bool:
+    """True si el plan accede por búsqueda (no recorrido completo) al índice esperado."""
+    for line in plan:
+        if index_name not in line:
+            continue
+        if dialect == "sqlite" and line.lstrip().startswith("SEARCH"):
+            return True
+        if dialect == "mssql" and "Index Seek" in line:
+            return True
+        if dialect == "postgresql" and any(
+            marker in line for marker in ("Index Scan using", "Index Only Scan using", "Bitmap Index Scan on")
+        ):
+            return True
+    return False
+
+
+def _sample_fecha_lote(conn: Connection, model):
+    """(fecha_p, p_lote) del registro más reciente, para que los filtros sean realistas."""
+    row = conn.execute(
+        select(model.fecha_p, model.p_lote).order_by(model.fecha_p.desc()).limit(1)
+    ).first()
+    return (row.fecha_p, row.p_lote) if row else (date.today(), "L")
+
+
+def reg_linea_checks(conn: Connection) -> List[PlanCheck]:
+    """Conteo, página y agregar_panza sobre las doce tablas reg_linea."""
+    from src.modules.lineas_entrada_salida_service.src.infrastructure.api.schemas.lineas_shared import LineasFilters
+    from src.modules.lineas_entrada_salida_service.src.infrastructure.db.repositories.lineas_entrada_repository import \
+        LINEA_ORM_MAPPER as ENTRADA_MODELS, LineasEntradaRepository
+    from src.modules.lineas_entrada_salida_service.src.infrastructure.db.repositories.lineas_salida_repository import \
+        LINEA_ORM_MAPPER as SALIDA_MODELS, LineasSalidaRepository
+
+    checks = []
+    for models, repository, tipo in ((SALIDA_MODELS, LineasSalidaRepository(None), "salida"),
+                                     (ENTRADA_MODELS, LineasEntradaRepository(None), "entrada")):
+        for linea_num, model in models.items():
+            index = f"idx_{model.__tablename__}_fecha_p_lote"
+            fecha, lote = _sample_fecha_lote(conn, model)
+            por_fecha = LineasFilters(fecha=fecha)
+            por_lote = LineasFilters(fecha=fecha, lote=lote)
+            apply_filters = repository._apply_filters
+            prefix = f"{tipo}[{linea_num}]"
+
+            checks.append(PlanCheck(
+                f"{prefix} count fecha", apply_filters(select(func.count(model.id)), por_fecha, model), index
+            ))
+            checks.append(PlanCheck(
+                f"{prefix} página fecha",
+                apply_filters(select(model), por_fecha, model).order_by(model.fecha_p.desc()).limit(20), index,
+            ))
+            if tipo == "salida":
+                checks.append(PlanCheck(
+                    f"{prefix} count fecha+lote",
+                    apply_filters(select(func.count(model.id)), por_lote, model), index,
+                ))
+                checks.append(PlanCheck(
+                    f"{prefix} panza lectura",
+                    apply_filters(select(model.id, model.peso_kg).where(model.peso_kg.isnot(None)),
+                                  por_lote, model), index,
+                ))
+                checks.append(PlanCheck(
+                    f"{prefix} panza update",
+                    apply_filters(update(model), por_lote, model)
+                    .where(model.peso_kg.isnot(None))
+                    .values(peso_kg=func.round(model.peso_kg + 1, 3)), index,
+                ))
+    return checks
+
+
+def movimientos_checks(conn: Connection) -> List[PlanCheck]:
+    """Conteo y página de movimientos de operarios con el semi-join por turno."""
+    from src.modules.management_service.src.infrastructure.api.schemas.movimientos_operario import \
+        WorkerMovementFilters
+    from src.modules.management_service.src.infrastructure.db.models import WorkerMovementORM
+    from src.modules.management_service.src.infrastructure.db.repositories.movimientos_operario_async import \
+        AsyncWorkerMovementRepository
+
+    model = WorkerMovementORM
+    fecha_final = conn.execute(select(func.max(model.fecha_p))).scalar() or date.today()
+    filters = WorkerMovementFilters(fecha_inicial=fecha_final - timedelta(days=7), fecha_final=fecha_final)
+    lineas, turnos = [str(linea) for linea in range(1, 7)], [1, 2, 3]
+    apply_filters = AsyncWorkerMovementRepository(None)._apply_filters
+
+    count = apply_filters(select(func.count(model.id)).select_from(model), filters, lineas, turnos)
+    page = apply_filters(select(model), filters, lineas, turnos) \
+        .order_by(model.fecha_p.desc(), model.hora.desc()).limit(50)
+    semi_join = "idx_fm_gestion_operarios_codigo_turno"
+    return [
+        PlanCheck("movimientos count", count, "idx_fecha_p_linea_operario"),
+        PlanCheck("movimientos count turno", count, semi_join),
+        PlanCheck("movimientos página", page, "idx_fm_movimientos_operarios_fecha_p_hora"),
+        PlanCheck("movimientos página turno", page, semi_join),
+    ]
+
+
+CHECK_GROUPS: List[Callable[[Connection], List[PlanCheck]]] = [reg_linea_checks, movimientos_checks]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Verifica el uso de índices con planes de ejecución")
+    parser.add_argument("--scale", help="Usa la base SQLite sembrada del perfil de benchmark indicado")
+    parser.add_argument("--verbose", action="store_true", help="Imprime el plan de cada consulta")
+    args = parser.parse_args(argv)
+
+    if args.scale:
+        from benchmarks.run import bench_env
+        os.environ.update(bench_env(args.scale))
+    from src.shared.database import engine_main
+
+    failures = 0
+    with engine_main.connect() as conn:
+        dialect = conn.dialect.name
+        for group in CHECK_GROUPS:
+            for check in group(conn):
+                plan = explain(conn, check.statement)
+                ok = uses_index_seek(dialect, plan, check.expected_index)
+                failures += not ok
+                print(f"{'OK  ' if ok else 'FAIL'} {check.name:<36} {check.expected_index}")
+                if args.verbose or not ok:
+                    for line in plan:
+                        print(f"       {line}")
+    print(f"{failures} consulta(s) sin seek sobre el índice esperado" if failures else "Todas las consultas usan su índice")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,293 @@
+"""
+Harness de benchmarks de la API.
+
+Levanta `src.main:app` con uvicorn contra una base SQLite sembrada, recorre
+los escenarios con clientes concurrentes y guarda los resultados en JSON
+(throughput, latencias p50/p95/p99, errores y sentencias SQL por petición).
+
+Uso:
+    python -m benchmarks.run --scale smoke
+    python -m benchmarks.run --scale default --concurrency 16 --requests 500
+    python -m benchmarks.run --compare benchmarks/results/anterior.json
+
+Las sentencias SQL por petición salen de la cabecera `X-SQL-Profile` del
+perfilador (SQL_PROFILER_ALLOW_HEADER), así que son exactas también con
+varios workers.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import re
+import shutil
+import socket
+import subprocess
+import sys
+import time
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from benchmarks.scenarios import Scenario, build_scenarios
+from benchmarks.seed import BENCH_PASSWORD, BENCH_USERNAME, SCALES
+
+ROOT = Path(__file__).resolve().parents[1]
+DATA_DIR = ROOT / "benchmarks" / ".data"
+RESULTS_DIR = ROOT / "benchmarks" / "results"
+
+# Valores requeridos por Settings que no se usan con DATABASE_URL explícita
+_DUMMY_SETTINGS = {
+    "DB_HOST": "localhost", "DB_PORT": "1433", "DB_NAME": "bench", "DB_USER": "bench",
+    "DB_PASSWORD": "bench", "DB_DRIVER": "sqlite", "DB_TRUST_CERTIFICATE": "yes",
+    "AUTH_DB_HOST": "localhost", "AUTH_DB_PORT": "1433", "AUTH_DB_NAME": "bench",
+    "AUTH_DB_USER": "bench", "AUTH_DB_PASSWORD": "bench", "AUTH_DB_DRIVER": "sqlite",
+    "AUTH_DB_TRUST_CERTIFICATE": "yes", "JWT_SECRET_KEY": "benchmark-secret", "JWT_EXPIRATION_MINUTES": "120",
+}
+
+_PROFILE_QUERIES = re.compile(r"queries=(\d+)")
+_PROFILE_DB_MS = re.compile(r"db_ms=([\d.]+)")
+
+
+def bench_env(scale: str) -> Dict[str, str]:
+    """Variables de entorno del servidor y del sembrado para un perfil."""
+    data_dir = DATA_DIR / scale
+    env = {key: os.environ.get(key, value) for key, value in _DUMMY_SETTINGS.items()}
+    env.update({
+        "DATABASE_URL": f"sqlite:///{data_dir / 'main.db'}",
+        "AUTH_DATABASE_URL": f"sqlite:///{data_dir / 'auth.db'}",
+        "SQL_PROFILER_ALLOW_HEADER": "true",
+    })
+    return env
+
+
+def ensure_seeded(scale: str, reseed: bool) -> Dict[str, Any]:
+    """Siembra la base del perfil si no existe; devuelve su manifiesto (filas por tabla, lotes de panza)."""
+    data_dir = DATA_DIR / scale
+    manifest_path = data_dir / "manifest.json"
+    if reseed and data_dir.exists():
+        shutil.rmtree(data_dir)
+    if not manifest_path.exists():
+        shutil.rmtree(data_dir, ignore_errors=True)  # restos de un sembrado interrumpido
+        data_dir.mkdir(parents=True)
+        print(f"Sembrando perfil '{scale}' en {data_dir} ...")
+        # Proceso aparte: los engines de src.shared.database se crean al importar
+        subprocess.run(
+            [sys.executable, "-m", "benchmarks.seed", "--scale", scale, "--manifest", str(manifest_path)],
+            cwd=ROOT, env={**os.environ, **bench_env(scale)}, check=True,
+        )
+    return json.loads(manifest_path.read_text(encoding="utf-8"))
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(scale: str, port: int, workers: int, log_path: Path) -> subprocess.Popen:
+    command = [sys.executable, "-m", "uvicorn", "src.main:app", "--host", "127.0.0.1",
+               "--port", str(port), "--workers", str(workers), "--log-level", "warning", "--no-access-log"]
+    log_file = open(log_path, "w", encoding="utf-8")
+    return subprocess.Popen(command, cwd=ROOT, env={**os.environ, **bench_env(scale)},
+                            stdout=log_file, stderr=subprocess.STDOUT)
+
+
+def wait_until_healthy(base_url: str, process: subprocess.Popen, timeout: float = 60.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"El servidor terminó al arrancar (código {process.returncode})")
+        try:
+            if httpx.get(f"{base_url}/health", timeout=2).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.25)
+    raise RuntimeError(f"El servidor no respondió /health en {timeout:.0f}s")
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Percentil por rango más cercano sobre una lista ordenada."""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values) + 0.5) - 1))
+    return sorted_values[index]
+
+
+async def run_scenario(client: httpx.AsyncClient, scenario: Scenario, token: Optional[str],
+                       total: int, warmup: int, concurrency: int, seed: int) -> Dict[str, Any]:
+    concurrency = min(concurrency, scenario.max_concurrency or concurrency)
+    headers = {"X-SQL-Profile": "1"}
+    if scenario.requires_auth:
+        headers["Authorization"] = f"Bearer {token}"
+
+    latencies: List[float] = []
+    statements: List[int] = []
+    db_ms: List[float] = []
+    statuses: Counter = Counter()
+    counter = iter(range(warmup + total))
+
+    async def worker(worker_id: int) -> None:
+        rng = random.Random(seed * 1000 + worker_id)
+        for i in counter:
+            request = scenario.build(i, rng)
+            started = time.perf_counter()
+            try:
+                response = await client.request(request.method, request.path, json=request.json, headers=headers)
+                status = response.status_code
+            except httpx.HTTPError as exc:
+                response, status = None, type(exc).__name__
+            elapsed = time.perf_counter() - started
+            if i < warmup:
+                continue
+            latencies.append(elapsed)
+            statuses[str(status)] += 1
+            profile = response.headers.get("x-sql-profile", "") if response is not None else ""
+            queries = _PROFILE_QUERIES.search(profile)
+            if queries:
+                statements.append(int(queries.group(1)))
+                db_ms.append(float(_PROFILE_DB_MS.search(profile).group(1)))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(n) for n in range(concurrency)))
+    wall = time.perf_counter() - started
+
+    latencies.sort()
+    errors = sum(count for status, count in statuses.items() if not status.startswith("2"))
+    return {
+        "requests": len(latencies),
+        "concurrency": concurrency,
+        "errors": errors,
+        "status_counts": dict(statuses),
+        "wall_seconds": round(wall, 3),
+        "throughput_rps": round(len(latencies) / wall, 2) if wall else 0.0,
+        "latency_ms": {
+            "mean": round(sum(latencies) / len(latencies) * 1000, 2) if latencies else 0.0,
+            "p50": round(percentile(latencies, 50) * 1000, 2),
+            "p95": round(percentile(latencies, 95) * 1000, 2),
+            "p99": round(percentile(latencies, 99) * 1000, 2),
+            "max": round(latencies[-1] * 1000, 2) if latencies else 0.0,
+        },
+        "db": {
+            "statements_per_request": round(sum(statements) / len(statements), 2) if statements else None,
+            "statements_max": max(statements) if statements else None,
+            "db_ms_per_request": round(sum(db_ms) / len(db_ms), 2) if db_ms else None,
+        },
+    }
+
+
+async def run_suite(base_url: str, scenarios: List[Scenario], args: argparse.Namespace) -> Dict[str, Any]:
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=base_url, timeout=args.timeout, limits=limits) as client:
+        login = await client.post("/api/auth/login", json={"username": BENCH_USERNAME, "password": BENCH_PASSWORD})
+        login.raise_for_status()
+        token = login.json()["data"]["token"]
+
+        results = {}
+        for scenario in scenarios:
+            print(f"  {scenario.name} ...", flush=True)
+            results[scenario.name] = await run_scenario(
+                client, scenario, token, args.requests, args.warmup, args.concurrency, args.seed
+            )
+        return results
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, check=True,
+                              capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_report(results: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None) -> None:
+    header = f"{'escenario':<26}{'req/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'err':>6}{'sql/req':>9}"
+    if baseline:
+        header += f"{'Δ req/s':>10}{'Δ p95':>9}"
+    print(header)
+    for name, result in results.items():
+        latency = result["latency_ms"]
+        statements = result["db"]["statements_per_request"]
+        line = (f"{name:<26}{result['throughput_rps']:>9.1f}{latency['p50']:>9.1f}{latency['p95']:>9.1f}"
+                f"{latency['p99']:>9.1f}{result['errors']:>6}{'-' if statements is None else statements:>9}")
+        previous = (baseline or {}).get(name)
+        if previous:
+            rps_delta = (result["throughput_rps"] / previous["throughput_rps"] - 1) * 100 if previous["throughput_rps"] else 0
+            p95_delta = (latency["p95"] / previous["latency_ms"]["p95"] - 1) * 100 if previous["latency_ms"]["p95"] else 0
+            line += f"{rps_delta:>+9.1f}%{p95_delta:>+8.1f}%"
+        print(line)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks de la API sobre SQLite sembrada")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="default")
+    parser.add_argument("--reseed", action="store_true", help="Regenera la base del perfil")
+    parser.add_argument("--concurrency", type=int, default=8, help="Clientes concurrentes por escenario")
+    parser.add_argument("--requests", type=int, default=200, help="Peticiones medidas por escenario")
+    parser.add_argument("--warmup", type=int, default=20, help="Peticiones de calentamiento (no medidas)")
+    parser.add_argument("--workers", type=int, default=1, help="Workers de uvicorn")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--only", nargs="*", help="Limita la corrida a estos escenarios")
+    parser.add_argument("--output", help="Archivo JSON de resultados (por defecto benchmarks/results/<fecha>.json)")
+    parser.add_argument("--compare", help="JSON de una corrida anterior para mostrar diferencias")
+    args = parser.parse_args(argv)
+
+    manifest = ensure_seeded(args.scale, args.reseed)
+    scenarios = build_scenarios(manifest)
+    if args.only:
+        unknown = set(args.only) - {s.name for s in scenarios}
+        if unknown:
+            parser.error(f"Escenarios desconocidos: {', '.join(sorted(unknown))}")
+        scenarios = [s for s in scenarios if s.name in args.only]
+
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    port = _free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    server = start_server(args.scale, port, args.workers, RESULTS_DIR / "server.log")
+    try:
+        wait_until_healthy(base_url, server)
+        print(f"Servidor listo en {base_url} (perfil '{args.scale}', {args.workers} worker(s))")
+        results = asyncio.run(run_suite(base_url, scenarios, args))
+    finally:
+        server.terminate()
+        try:
+            server.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "database": "sqlite",
+            "scale": args.scale,
+            "rows": manifest["rows"],
+            "concurrency": args.concurrency,
+            "requests_per_scenario": args.requests,
+            "warmup": args.warmup,
+            "workers": args.workers,
+        },
+        "scenarios": results,
+    }
+    output = Path(args.output) if args.output else RESULTS_DIR / f"{datetime.now():%Y%m%d-%H%M%S}-{args.scale}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    baseline = None
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))["scenarios"]
+    print_report(results, baseline)
+    print(f"Resultados: {output}")
+    return 1 if any(r["errors"] for r in results.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
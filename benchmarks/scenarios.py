@@ -0,0 +1,81 @@
+"""
+Escenarios de carga: cada uno describe cómo construir una petición a partir
+del número de iteración, para que la mezcla sea reproducible entre corridas.
+"""
+import random
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.seed import BENCH_PASSWORD, LINEAS, login_usernames
+
+
+@dataclass(frozen=True)
+class Request:
+    method: str
+    path: str
+    json: Optional[Dict[str, Any]] = None
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    build: Callable[[int, random.Random], Request]
+    requires_auth: bool = True
+    # Tope de concurrencia propio (p. ej. escrituras sobre SQLite); None = el global
+    max_concurrency: Optional[int] = None
+
+
+def _fecha(rng: random.Random, dias: int) -> date:
+    return date.today() - timedelta(days=rng.randrange(dias))
+
+
+def build_scenarios(manifest: Dict[str, Any]) -> List[Scenario]:
+    """Escenarios de la suite a partir del manifiesto del sembrado (rango de fechas y lotes existentes)."""
+    dias = manifest["dias"]
+    panza_targets = manifest["panza_targets"]
+    usernames = login_usernames()
+
+    def login(i: int, rng: random.Random) -> Request:
+        # Rotación de usuarios: cada uno repite login cada LOGIN_USERS peticiones
+        username = usernames[i % len(usernames)]
+        return Request("POST", "/api/auth/login", {"username": username, "password": BENCH_PASSWORD})
+
+    def lineas_salida(i: int, rng: random.Random) -> Request:
+        body = {"page": 1 + rng.randrange(5), "page_size": 50}
+        if i % 2 == 0:
+            body["fecha"] = _fecha(rng, dias).isoformat()
+        return Request("POST", f"/api/lineas-salida/{rng.choice(LINEAS)}/paginated", body)
+
+    def lineas_salida_cursor(i: int, rng: random.Random) -> Request:
+        return Request("POST", f"/api/lineas-salida/{rng.choice(LINEAS)}/paginated",
+                       {"page_size": 50, "use_cursor": True, "include_total": False})
+
+    def movimientos(i: int, rng: random.Random) -> Request:
+        inicio = _fecha(rng, dias)
+        body = {"fecha_inicial": inicio.isoformat(), "fecha_final": (inicio + timedelta(days=7)).isoformat(),
+                "page": 1 + rng.randrange(3), "page_size": 50}
+        if i % 3 == 0:
+            body["linea"] = str(rng.choice(LINEAS))
+        return Request("POST", "/api/movimientos-empleado/paginated", body)
+
+    def agregar_panza(i: int, rng: random.Random) -> Request:
+        # El peso debe ser positivo: cada corrida suma poco (--reseed restaura los datos)
+        target = rng.choice(panza_targets)
+        body = {"fecha": target["fecha"], "lote": target["lote"], "peso_kg": 0.001}
+        return Request("PUT", f"/api/lineas-salida/{target['linea']}/agregar_panza", body)
+
+    def auditoria(i: int, rng: random.Random) -> Request:
+        body = {"page": 1 + rng.randrange(5), "page_size": 50}
+        if i % 2 == 0:
+            body["accion"] = rng.choice(("CREATE", "UPDATE", "DELETE"))
+        return Request("POST", "/api/auditoria/paginated", body)
+
+    return [
+        Scenario("login", login, requires_auth=False),
+        Scenario("lineas_salida_paginated", lineas_salida, requires_auth=False),
+        Scenario("lineas_salida_cursor", lineas_salida_cursor, requires_auth=False),
+        Scenario("movimientos_paginated", movimientos),
+        Scenario("agregar_panza", agregar_panza, max_concurrency=2),
+        Scenario("auditoria_paginated", auditoria),
+    ]
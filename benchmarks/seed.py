@@ -0,0 +1,153 @@
+"""
+Base de datos SQLite sembrada para los benchmarks.
+
+Crea el esquema de ambas bases (main y auth), el usuario de benchmark con
+todas las líneas y turnos asignados, y delega el volumen de datos al
+generador sintético de alembic/seeds/generator.py.
+"""
+import importlib.util
+import random
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+from sqlalchemy import BigInteger, insert, select
+from sqlalchemy.ext.compiler import compiles
+
+BENCH_USERNAME = "bench"
+BENCH_PASSWORD = "Bench12345!"
+# Usuarios extra para el escenario de login: dos logins del mismo usuario en el
+# mismo segundo generan el mismo JWT (choca con el UNIQUE de sesiones_usuario)
+LOGIN_USERS = 64
+LINEAS = (1, 2, 3, 4, 5, 6)
+TURNOS = (1, 2, 3)
+# Lotes (línea, fecha, lote) con filas de salida que usa el escenario agregar_panza
+PANZA_TARGETS = 200
+
+# Perfiles: factor de escala del generador (1 = ~10M de filas) y días de producción
+SCALES: Dict[str, Dict[str, Any]] = {
+    "smoke": {"scale": 0.005, "dias": 60},
+    "default": {"scale": 0.05, "dias": 180},
+    "full": {"scale": 1.0, "dias": 365},
+}
+
+_GENERATOR_PATH = Path(__file__).resolve().parents[1] / "alembic" / "seeds" / "generator.py"
+
+
+@compiles(BigInteger, "sqlite")
+def _sqlite_bigint(type_, compiler, **kw):
+    # En SQLite solo INTEGER PRIMARY KEY es alias de rowid (autoincremental)
+    return "INTEGER"
+
+
+def login_usernames() -> List[str]:
+    return [f"{BENCH_USERNAME}_{index:02d}" for index in range(1, LOGIN_USERS + 1)]
+
+
+def load_generator():
+    """Carga alembic/seeds/generator.py por ruta: el directorio `alembic` tapa al paquete instalado."""
+    spec = importlib.util.spec_from_file_location("seeds_generator", _GENERATOR_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _seed_auth_and_catalogs(now: datetime) -> None:
+    from src.modules.auth_service.src.domain.entities import ModuloEnum
+    from src.modules.auth_service.src.domain.value_objects import Password
+    from src.modules.auth_service.src.infrastructure.db.models import (
+        LineaORM, PermisoModulo, PlantaORM, Rol, TurnoORM, Usuario, UsuarioLineaAsignada, UsuarioTurnoAsignado,
+    )
+    from src.shared.database import engine_auth, engine_main
+
+    with engine_auth.begin() as conn:
+        conn.execute(insert(Rol.__table__), [{
+            "id_rol": 1, "nombre": "Benchmark", "descripcion": "Rol de benchmark",
+            "created_at": now, "updated_at": now, "is_active": True,
+        }])
+        conn.execute(insert(PermisoModulo.__table__), [
+            {"id_rol": 1, "modulo": modulo.name, "permisos": ["read", "write"],
+             "created_at": now, "updated_at": now, "is_active": True}
+            for modulo in ModuloEnum
+        ])
+        password_hash = Password(BENCH_PASSWORD).hash()
+        conn.execute(insert(Usuario.__table__), [
+            {"id_usuario": index + 1, "username": username, "password_hash": password_hash,
+             "id_rol": 1, "is_superuser": True, "created_at": now, "updated_at": now, "is_active": True}
+            for index, username in enumerate([BENCH_USERNAME] + login_usernames())
+        ])
+        conn.execute(insert(UsuarioLineaAsignada.__table__), [
+            {"id_usuario": 1, "id_linea_externa": linea, "created_at": now} for linea in LINEAS
+        ])
+        conn.execute(insert(UsuarioTurnoAsignado.__table__), [
+            {"id_usuario": 1, "id_turno_externo": turno, "created_at": now} for turno in TURNOS
+        ])
+
+    with engine_main.begin() as conn:
+        conn.execute(insert(PlantaORM.__table__), [{"PLAN_ID": 1, "PLAN_NOMBRE": "Planta 1", "PLAN_ESTADO": "ACTIVO"}])
+        conn.execute(insert(LineaORM.__table__), [
+            {"LINE_ID": linea, "LINE_NOMBRE": f"Linea {linea}", "LINE_ESTADO": "ACTIVO", "LINE_PLANTA": 1}
+            for linea in LINEAS
+        ])
+        conn.execute(insert(TurnoORM.__table__), [
+            {"TURN_ID": turno, "TURN_NOMBRE": f"Turno {turno}", "TURN_ESTADO": "ACTIVO"} for turno in TURNOS
+        ])
+
+
+def _panza_targets(seed_value: int) -> List[Dict[str, Any]]:
+    """Muestra de (línea, fecha, lote) que sí tienen filas de salida."""
+    from src.modules.lineas_entrada_salida_service.src.infrastructure.db.repositories.lineas_salida_repository import \
+        LINEA_ORM_MAPPER as SALIDA_MODELS
+    from src.shared.database import engine_main
+
+    targets = []
+    with engine_main.connect() as conn:
+        for linea in LINEAS:
+            model = SALIDA_MODELS[linea]
+            rows = conn.execute(select(model.fecha_p, model.p_lote).distinct()).all()
+            targets.extend({"linea": linea, "fecha": fecha.isoformat(), "lote": lote} for fecha, lote in rows)
+    random.Random(seed_value).shuffle(targets)
+    return targets[:PANZA_TARGETS]
+
+
+def seed(scale: str = "default", seed_value: int = 42) -> Dict[str, Any]:
+    """
+    Crea el esquema y siembra los datos. Requiere que DATABASE_URL y
+    AUTH_DATABASE_URL ya apunten a los archivos SQLite del benchmark.
+    Devuelve el manifiesto: filas por tabla y lotes para agregar_panza.
+    """
+    import src.main  # noqa: F401  registra todos los modelos en sus bases
+    from src.shared.database import BaseAuth, BaseMain, engine_auth, engine_main
+
+    for engine, base in ((engine_main, BaseMain), (engine_auth, BaseAuth)):
+        base.metadata.create_all(engine)
+    _seed_auth_and_catalogs(datetime.now())
+
+    generator = load_generator()
+    profile = SCALES[scale]
+    config = generator.GeneratorConfig(scale=profile["scale"], days=profile["dias"], seed=seed_value)
+    rows = generator.generate(config)
+    return {"scale": scale, "seed": seed_value, "dias": profile["dias"], "rows": rows,
+            "panza_targets": _panza_targets(seed_value)}
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+    import time
+
+    parser = argparse.ArgumentParser(description="Siembra la base SQLite de benchmarks")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="default")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--manifest", help="Ruta donde escribir el manifiesto (JSON)")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    manifest = seed(args.scale, args.seed)
+    manifest["seconds"] = round(time.perf_counter() - started, 1)
+    output = json.dumps(manifest, indent=2)
+    if args.manifest:
+        with open(args.manifest, "w", encoding="utf-8") as fh:
+            fh.write(output)
+    else:
+        print(output)
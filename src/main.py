@@ -1,4 +1,5 @@
 from fastapi import FastAPI, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.exceptions import RequestValidationError
 
 from src.modules.administracion_service.src.infrastructure.api.routers.detalle_produccion_router import router as detalle_produccion_router
@@ -11,10 +12,16 @@ from src.modules.administracion_service.src.infrastructure.api.routers.control_l
 from src.modules.lineas_entrada_salida_service.src.infrastructure.api.routers.control_tara_router import router as control_tara_router
 from src.modules.lineas_entrada_salida_service.src.infrastructure.api.routers.lineas_salida_router import router as lineas_salida_router
 from src.modules.lineas_entrada_salida_service.src.infrastructure.api.routers.lineas_entrada_router import router as lineas_entrada_router
-from src.shared.common.responses import validation_error_response
+from src.shared.common.auditoria import audit_writer
+from src.shared.common.responses import FastJSONResponse, validation_error_response
 from src.shared.exceptions import DomainError
 from src.shared.common.exception_handlers import domain_exception_handler
+from src.shared.compression import configure_compression
 from src.shared.cors_config import configure_cors
+from src.shared.metrics import configure_metrics
+from src.shared.sql_profiler import configure_sql_profiler
+from src.shared.config import settings
+from src.shared.database import dispose_async_engines
 from datetime import datetime
 
 from src.modules.management_service.src.infrastructure.api.routers.movimientos_empleado import (
@@ -43,12 +50,39 @@ app = FastAPI(
     title="Administracion API Gateway -- CIESA",
     description="API Gateway que expone todos los servicios de manera unificada (modo monolítico para compatibilidad)",
     version="1.0.0",
+    default_response_class=FastJSONResponse,
 )
 
 # --- INICIO: CONFIGURACIÓN DE CORS ---
 configure_cors(app, "API Gateway")
 # --- FIN: CONFIGURACIÓN DE CORS ---
 
+# Compresión negociada (brotli / gzip), también para StreamingResponse
+configure_compression(app, "API Gateway")
+
+# Métricas Prometheus (/metrics); se instala al final para medir también la compresión
+configure_metrics(app, "API Gateway")
+
+# Perfilador SQL / detección de N+1 (deshabilitado por defecto)
+configure_sql_profiler(app, "API Gateway")
+
+
+@app.on_event("startup")
+async def start_audit_writer():
+    if settings.AUDIT_ASYNC_ENABLED:
+        audit_writer.start()
+
+
+@app.on_event("shutdown")
+async def shutdown_async_engines():
+    await dispose_async_engines()
+
+
+@app.on_event("shutdown")
+async def stop_audit_writer():
+    # Persiste los logs que sigan en cola antes de terminar
+    await run_in_threadpool(audit_writer.stop, settings.AUDIT_SHUTDOWN_TIMEOUT_SECONDS)
+
 
 # Manejador global de excepciones de validación
 @app.exception_handler(RequestValidationError)
@@ -120,6 +154,17 @@ async def detailed_health_check():
     return health_status
 
 
+@app.get("/health/pool")
+async def pool_health_check():
+    """Métricas de los pools de conexiones (espera de checkout, en uso, overflow)"""
+    from src.shared.database import get_pool_metrics
+
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "pools": get_pool_metrics(),
+    }
+
+
 @app.get("/services")
 async def get_services():
     """Endpoint que muestra los servicios disponibles"""
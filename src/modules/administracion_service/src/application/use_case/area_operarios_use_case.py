@@ -5,6 +5,7 @@ from src.modules.administracion_service.src.domain.entities import AreaOperarios
 from src.modules.administracion_service.src.infrastructure.api.schemas.area_operarios import AreaOperariosRequest, \
     AreaOperariosResponse
 from src.modules.auth_service.src.application.use_cases.audit_use_case import AuditUseCase
+from src.shared.common.reference_cache import reference_cache, AREAS_OPERARIOS
 from src.shared.exceptions import ValidationError, AlreadyExistsError, NotFoundError
 
 
@@ -31,6 +32,7 @@ class AreaOperariosUseCase:
             raise AlreadyExistsError("Ya existe un area con este nombre")
 
         nueva_area= self.area_operarios_repository.create(data)
+        reference_cache.invalidate(AREAS_OPERARIOS)
         self.audit_use_case.log_action(
             accion="CREATE",
             user_id=user_data.get("user_id"),
@@ -51,6 +53,7 @@ class AreaOperariosUseCase:
             raise AlreadyExistsError("Ya existe un area con este nombre")
 
         updated_area = self.area_operarios_repository.update(data, id)
+        reference_cache.invalidate(AREAS_OPERARIOS)
         self.audit_use_case.log_action(
             accion="UPDATE",
             user_id=user_data.get("user_id"),
@@ -76,4 +79,6 @@ class AreaOperariosUseCase:
             datos_anteriores=AreaOperariosResponse.model_validate(area).model_dump(mode="json")
         )
 
-        return self.area_operarios_repository.soft_delete(id)
\ No newline at end of file
+        eliminado = self.area_operarios_repository.soft_delete(id)
+        reference_cache.invalidate(AREAS_OPERARIOS)
+        return eliminado
\ No newline at end of file
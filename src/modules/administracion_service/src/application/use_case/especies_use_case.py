@@ -5,6 +5,7 @@ from src.modules.administracion_service.src.application.ports.especies import IE
 from src.modules.administracion_service.src.infrastructure.api.schemas.especies import EspeciesResponse, \
     EspeciesRequest, EspeciesPaginated
 from src.modules.auth_service.src.application.use_cases.audit_use_case import AuditUseCase
+from src.shared.common.reference_cache import reference_cache, ESPECIES
 from src.shared.exceptions import NotFoundError, AlreadyExistsError, ValidationError
 
 
@@ -54,6 +55,7 @@ class EspeciesUseCase:
         if exists:
             raise AlreadyExistsError("Ya existe una especie con este nombre")
         especie = self.especies_repository.create(data)
+        reference_cache.invalidate(ESPECIES)
 
         response = EspeciesResponse(
             especie_id=especie.especie_id,
@@ -93,6 +95,7 @@ class EspeciesUseCase:
         )
 
         updated_especie = self.especies_repository.update(data, id)
+        reference_cache.invalidate(ESPECIES)
         updated_especie_response = EspeciesResponse(
             especie_id=updated_especie.especie_id,
             especie_nombre=updated_especie.especie_nombre,
@@ -5,6 +5,7 @@ from src.modules.administracion_service.src.application.ports.planta import IPla
 from src.modules.administracion_service.src.infrastructure.api.schemas.linea import LineaCreate, LineaResponse, \
     LineaUpdate
 from src.modules.auth_service.src.application.use_cases.audit_use_case import AuditUseCase
+from src.shared.common.reference_cache import reference_cache, LINEAS
 from src.shared.exceptions import NotFoundError, AlreadyExistsError, ValidationError
 
 
@@ -23,6 +24,7 @@ class LineaUseCase:
             raise AlreadyExistsError("Ya existe una linea con este nombre")
 
         linea = self.lineas_repository.create(data)
+        reference_cache.invalidate(LINEAS)
         planta = self.planta_repository.get_by_id(linea.line_planta)
 
         response = LineaResponse(
@@ -55,6 +57,7 @@ class LineaUseCase:
         linea_anterior = self.lineas_repository.get_by_id(id)
 
         linea = self.lineas_repository.update(data, id)
+        reference_cache.invalidate(LINEAS)
         planta = self.planta_repository.get_by_id(linea.line_planta)
 
         response = LineaResponse(
@@ -133,4 +136,6 @@ class LineaUseCase:
             datos_anteriores=LineaResponse.model_validate(linea_response).model_dump(mode="json")
         )
 
-        return self.lineas_repository.soft_delete(id)
+        eliminado = self.lineas_repository.soft_delete(id)
+        reference_cache.invalidate(LINEAS)
+        return eliminado
@@ -1,6 +1,6 @@
 from typing import Dict, Any
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Request, status
 from fastapi.params import Depends
 from sqlalchemy.orm import Session
 
@@ -12,6 +12,8 @@ from src.modules.administracion_service.src.infrastructure.db.repositories.area_
 from src.modules.auth_service.src.application.use_cases.audit_use_case import AuditUseCase
 from src.shared.base import get_db
 from src.shared.common.auditoria import get_audit_use_case
+from src.shared.common.http_cache import cached_success_response
+from src.shared.common.reference_cache import AREAS_OPERARIOS
 from src.shared.common.responses import success_response, error_response
 from src.shared.exceptions import RepositoryError
 from src.shared.security import get_current_user_data
@@ -29,11 +31,12 @@ def get_area_operarios_use_case(
 
 @router.get("/", status_code=status.HTTP_200_OK)
 def get_all_area_operarios(
+        request: Request,
         use_case: AreaOperariosUseCase = Depends(get_area_operarios_use_case)
 ):
-    response = use_case.get_all_areas_operarios()
-    return success_response(
-        data=response,
+    return cached_success_response(
+        request, AREAS_OPERARIOS, "activas",
+        use_case.get_all_areas_operarios,
         message="Areas Operarios Obtenidas"
     )
 
@@ -1,6 +1,6 @@
 from typing import Dict, Any
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Request, status
 from fastapi.params import Depends
 from sqlalchemy.orm import Session
 
@@ -11,6 +11,8 @@ from src.modules.administracion_service.src.infrastructure.db.repositories.espec
 from src.modules.auth_service.src.application.use_cases.audit_use_case import AuditUseCase
 from src.shared.base import get_db
 from src.shared.common.auditoria import get_audit_use_case
+from src.shared.common.http_cache import cached_success_response
+from src.shared.common.reference_cache import ESPECIES
 from src.shared.common.responses import success_response
 from src.shared.security import get_current_user_data
 
@@ -55,11 +57,12 @@ def get_all_especies_paginated(
 @router.get("/{especie_id}", status_code=status.HTTP_200_OK, response_model=EspeciesResponse)
 def get_especie_by_id(
         especie_id: int,
+        request: Request,
         use_case: EspeciesUseCase = Depends(get_especies_use_case)
 ):
-    response = use_case.get_especie_by_id(especie_id)
-    return success_response(
-        data=EspeciesResponse.model_validate(response).model_dump(mode="json"),
+    return cached_success_response(
+        request, ESPECIES, ("id", especie_id),
+        lambda: EspeciesResponse.model_validate(use_case.get_especie_by_id(especie_id)).model_dump(mode="json"),
         message="Especie obtenida",
     )
 
@@ -1,6 +1,6 @@
 from typing import Dict, Any
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Request, status
 from fastapi.params import Depends
 from sqlalchemy.orm import Session
 
@@ -12,6 +12,8 @@ from src.modules.administracion_service.src.infrastructure.db.repositories.plant
 from src.modules.auth_service.src.application.use_cases.audit_use_case import AuditUseCase
 from src.shared.base import get_db
 from src.shared.common.auditoria import get_audit_use_case
+from src.shared.common.http_cache import cached_success_response
+from src.shared.common.reference_cache import LINEAS
 from src.shared.common.responses import success_response
 from src.shared.security import get_current_user_data
 
@@ -30,11 +32,12 @@ def get_lineas_use_case(
 
 @router.get("/", status_code=status.HTTP_200_OK, response_model=LineaResponse)
 def get_all_lineas(
+        request: Request,
         use_case: LineaUseCase = Depends(get_lineas_use_case)
 ):
-    lineas = use_case.get_all_lineas()
-    return success_response(
-        data=[LineaResponse.model_validate(l).model_dump(mode="json") for l in lineas],
+    return cached_success_response(
+        request, LINEAS, "activas",
+        lambda: [LineaResponse.model_validate(l).model_dump(mode="json") for l in use_case.get_all_lineas()],
         message="Lineas encontradas"
     )
 
@@ -1,5 +1,5 @@
 from fastapi.params import Depends
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Request, status
 from sqlalchemy.orm import Session
 
 from src.modules.administracion_service.src.application.use_case.planta_use_case import PlantaUseCase
@@ -7,7 +7,8 @@ from src.modules.administracion_service.src.infrastructure.api.schemas.planta im
 from src.modules.administracion_service.src.infrastructure.db.repositories import planta_repository
 from src.modules.administracion_service.src.infrastructure.db.repositories.planta_repository import PlantaRepository
 from src.shared.base import get_db
-from src.shared.common.responses import success_response
+from src.shared.common.http_cache import cached_success_response
+from src.shared.common.reference_cache import PLANTAS
 
 router = APIRouter()
 
@@ -20,10 +21,11 @@ def get_planta_use_case(
 
 @router.get("/", status_code=status.HTTP_200_OK)
 def get_all_plantas(
+        request: Request,
         use_case: PlantaUseCase = Depends(get_planta_use_case)
 ):
-    plantas = use_case.get_all_plantas()
-    return success_response(
-        data=[PlantaResponse.model_validate(p).model_dump(mode="json") for p in plantas],
+    return cached_success_response(
+        request, PLANTAS, "activas",
+        lambda: [PlantaResponse.model_validate(p).model_dump(mode="json") for p in use_case.get_all_plantas()],
         message="Plantas obtenidas"
     )
@@ -8,6 +8,7 @@ from src.modules.administracion_service.src.application.ports.area_operarios imp
 from src.modules.administracion_service.src.domain.entities import AreaOperarios
 from src.modules.administracion_service.src.infrastructure.api.schemas.area_operarios import AreaOperariosRequest
 from src.modules.administracion_service.src.infrastructure.db.models import AreaOperariosORM
+from src.shared.common.reference_cache import reference_cache, AREAS_OPERARIOS
 from src.shared.exceptions import RepositoryError, NotFoundError
 
 
@@ -17,6 +18,12 @@ class AreaOperariosRepository(IAreaOperarioRepository):
         self.db = db
 
     def get_all(self) -> list[AreaOperarios]:
+        return list(reference_cache.get_or_load(AREAS_OPERARIOS, "activas", self._get_all))
+
+    def get_by_id(self, id: int) -> Optional[AreaOperarios]:
+        return reference_cache.get_or_load(AREAS_OPERARIOS, ("id", id), lambda: self._get_by_id(id))
+
+    def _get_all(self) -> list[AreaOperarios]:
         try:
             areas_orm = (
                 self.db.query(AreaOperariosORM)
@@ -38,7 +45,7 @@ class AreaOperariosRepository(IAreaOperarioRepository):
         except SQLAlchemyError as e:
             raise RepositoryError("Error al obtener las areas de operarios") from e
 
-    def get_by_id(self, id: int) -> Optional[AreaOperarios]:
+    def _get_by_id(self, id: int) -> Optional[AreaOperarios]:
         try:
             area_orm = (
                 self.db.query(AreaOperariosORM)
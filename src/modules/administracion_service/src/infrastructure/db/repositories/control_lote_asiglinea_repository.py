@@ -1,7 +1,7 @@
 import logging
 from typing import Tuple, List, Optional
 
-from sqlalchemy import func, and_
+from sqlalchemy import and_
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
@@ -11,6 +11,7 @@ from src.modules.administracion_service.src.domain.entities import ControlLoteAs
 from src.modules.administracion_service.src.infrastructure.api.schemas.control_lote_asiglinea import \
     ControlLoteAsiglineaFilters, ControlLoteAsiglineaPagination, ControlLoteAsiglineaUpdate
 from src.modules.administracion_service.src.infrastructure.db.models import ControlLoteAsiglineaORM
+from src.shared.common.pagination import paginate
 from src.shared.exceptions import RepositoryError, NotFoundError
 
 
@@ -36,16 +37,6 @@ class ControlLoteAsiglineaRepository(IControlLoteAsiglineaRepository):
 
         return query
 
-    def _count_by_filters(self, filters: ControlLoteAsiglineaFilters) -> int:
-        try:
-            query = self.db.query(func.count(ControlLoteAsiglineaORM.id))
-
-            query = self._apply_filters(query, filters)
-
-            return query.scalar() or 0
-        except SQLAlchemyError as e:
-            raise RepositoryError(f"Error al contar .") from e
-
     def exists_by_id(self, id: int) -> bool:
         try:
             lote_orm = (
@@ -89,21 +80,15 @@ class ControlLoteAsiglineaRepository(IControlLoteAsiglineaRepository):
             linea=paginated_filters.linea
         )
         try:
-            total_records = self._count_by_filters(filters)
-
-            if total_records == 0:
-                return [], 0
-
             base_query = self.db.query(ControlLoteAsiglineaORM)
             data_query = self._apply_filters(base_query, filters)
 
             data_query = data_query.order_by(ControlLoteAsiglineaORM.fecha_p.desc(),
                                              ControlLoteAsiglineaORM.fecha_asig.desc())
 
-            offset = (paginated_filters.page - 1) * paginated_filters.page_size
-            data_query = data_query.limit(paginated_filters.page_size).offset(offset)
-
-            lote_asiglineas = data_query.all()
+            lote_asiglineas, total_records = paginate(
+                data_query, paginated_filters.page, paginated_filters.page_size
+            )
 
             domain_entities = [
                 ControlLoteAsiglinea(
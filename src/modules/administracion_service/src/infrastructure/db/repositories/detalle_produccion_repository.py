@@ -1,6 +1,6 @@
 from typing import Tuple, List, Optional
 
-from sqlalchemy import func, and_
+from sqlalchemy import and_
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
@@ -10,6 +10,7 @@ from src.modules.administracion_service.src.infrastructure.api.schemas.detalle_p
     DetalleProduccionUpdate, DetalleProduccionPagination, DetalleProduccionFilters
 )
 from src.modules.administracion_service.src.infrastructure.db.models import DetalleProduccionORM
+from src.shared.common.pagination import paginate
 from src.shared.exceptions import RepositoryError, NotFoundError
 
 
@@ -33,14 +34,6 @@ class DetalleProduccionRepository(IDetalleProduccionRepository):
             query = query.filter(and_(*conditions))
         return query
 
-    def _count_by_filters(self, filters: DetalleProduccionFilters) -> int:
-        try:
-            query = self.db.query(func.count(DetalleProduccionORM.DPRO_ID))
-            query = self._apply_filters(query, filters)
-            return query.scalar() or 0
-        except SQLAlchemyError as e:
-            raise RepositoryError("Error al contar registros.") from e
-
     def exists_by_id(self, id: int) -> bool:
         try:
             return (
@@ -80,10 +73,6 @@ class DetalleProduccionRepository(IDetalleProduccionRepository):
         )
 
         try:
-            total_records = self._count_by_filters(filters)
-            if total_records == 0:
-                return [], 0
-
             query = self.db.query(DetalleProduccionORM)
             query = self._apply_filters(query, filters)
 
@@ -92,8 +81,7 @@ class DetalleProduccionRepository(IDetalleProduccionRepository):
                 DetalleProduccionORM.DPRO_LINEA.asc()
             )
 
-            offset = (paginated_filters.page - 1) * paginated_filters.page_size
-            rows = query.limit(paginated_filters.page_size).offset(offset).all()
+            rows, total_records = paginate(query, paginated_filters.page, paginated_filters.page_size)
 
             entities = [
                 DetalleProduccion(
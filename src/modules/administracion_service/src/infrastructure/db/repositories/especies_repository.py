@@ -1,6 +1,5 @@
 from typing import Optional, List, Tuple
 
-from sqlalchemy import func
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
@@ -9,6 +8,8 @@ from src.modules.administracion_service.src.domain.entities import Especie
 from src.modules.administracion_service.src.infrastructure.api.schemas.especies import EspeciesRequest, \
     EspeciesPaginated
 from src.modules.administracion_service.src.infrastructure.db.models import EspeciesORM
+from src.shared.common.pagination import paginate
+from src.shared.common.reference_cache import reference_cache, ESPECIES
 from src.shared.exceptions import RepositoryError, NotFoundError
 
 
@@ -16,28 +17,23 @@ class EspeciesRepository(IEspeciesRepository):
     def __init__(self, db: Session):
         self.db = db
 
-    def _count(self) -> int:
-        try:
-            query = self.db.query(func.count(EspeciesORM.especie_id))
-
-            return query.scalar() or 0
-        except SQLAlchemyError as e:
-            raise RepositoryError(f"Error al contar .") from e
-
     def get_all_paginated(self, pagination: EspeciesPaginated) -> Tuple[
         List[Especie], int]:
-        try:
-            total_records = self._count()
-            if total_records == 0:
-                return [], 0
+        key = ("pagina", pagination.page, pagination.page_size)
+        especies, total_records = reference_cache.get_or_load(
+            ESPECIES, key, lambda: self._get_all_paginated(pagination)
+        )
+        return list(especies), total_records
 
+    def get_by_id(self, id: int) -> Optional[Especie]:
+        return reference_cache.get_or_load(ESPECIES, ("id", id), lambda: self._get_by_id(id))
+
+    def _get_all_paginated(self, pagination: EspeciesPaginated) -> Tuple[List[Especie], int]:
+        try:
             base_query = self.db.query(EspeciesORM)
             base_query = base_query.order_by(EspeciesORM.especie_id.desc())
 
-            offset = (pagination.page - 1) * pagination.page_size
-            data_query = base_query.limit(pagination.page_size).offset(offset)
-
-            especies_orm = data_query.all()
+            especies_orm, total_records = paginate(base_query, pagination.page, pagination.page_size)
 
             domain_entities =[
                 Especie(
@@ -62,7 +58,7 @@ class EspeciesRepository(IEspeciesRepository):
         except SQLAlchemyError as e:
             raise RepositoryError("Error al obtener las especies") from e
 
-    def get_by_id(self, id: int) -> Optional[Especie]:
+    def _get_by_id(self, id: int) -> Optional[Especie]:
         try:
             especie_orm = (
                 self.db.query(EspeciesORM)
@@ -9,6 +9,7 @@ from src.modules.administracion_service.src.domain.entities import Linea
 from src.modules.administracion_service.src.infrastructure.api.schemas.linea import LineaCreate, LineaUpdate, \
     EstadoLineaEnum
 from src.modules.auth_service.src.infrastructure.db.models import LineaORM
+from src.shared.common.reference_cache import reference_cache, LINEAS
 from src.shared.exceptions import RepositoryError, NotFoundError
 
 
@@ -17,6 +18,12 @@ class LineaRepository(ILineaRepository):
         self.db = db
 
     def get_all(self) -> List[Linea]:
+        return list(reference_cache.get_or_load(LINEAS, "activas", self._get_all))
+
+    def get_by_id(self, id: int) -> Optional[Linea]:
+        return reference_cache.get_or_load(LINEAS, ("id", id), lambda: self._get_by_id(id))
+
+    def _get_all(self) -> List[Linea]:
         try:
             linea_orm = (
                 self.db.query(LineaORM)
@@ -38,7 +45,7 @@ class LineaRepository(ILineaRepository):
         except SQLAlchemyError as e:
             raise RepositoryError("Error al obtener las lineas") from e
 
-    def get_by_id(self, id: int) -> Optional[Linea]:
+    def _get_by_id(self, id: int) -> Optional[Linea]:
         try:
             linea_orm = (
                 self.db.query(LineaORM)
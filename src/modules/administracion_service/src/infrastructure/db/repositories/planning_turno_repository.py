@@ -1,7 +1,7 @@
 from typing import List, Tuple, Optional
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import func, and_
+from sqlalchemy import and_
 
 from src.modules.administracion_service.src.application.ports.planning_turno import IPlanningTurnoRepository
 from src.modules.administracion_service.src.domain.entities import PlanningTurno
@@ -9,6 +9,7 @@ from src.modules.administracion_service.src.infrastructure.api.schemas.planning_
     PlanningTurnoFilters, PlanningTurnoPagination, PlanningTurnoUpdate
 )
 from src.modules.administracion_service.src.infrastructure.db.models import PlanningTurnoORM
+from src.shared.common.pagination import paginate
 from src.shared.exceptions import RepositoryError, NotFoundError
 
 
@@ -33,14 +34,6 @@ class PlanningTurnoRepository(IPlanningTurnoRepository):
 
         return query
 
-    def _count_by_filters(self, filters: PlanningTurnoFilters) -> int:
-        try:
-            query = self.db.query(func.count(PlanningTurnoORM.plnn_id))
-            query = self._apply_filters(query, filters)
-            return query.scalar() or 0
-        except SQLAlchemyError as e:
-            raise RepositoryError("Error al contar registros.") from e
-
     def exists_by_id(self, id: int) -> bool:
         try:
             return (
@@ -79,10 +72,6 @@ class PlanningTurnoRepository(IPlanningTurnoRepository):
         )
 
         try:
-            total_records = self._count_by_filters(filters)
-            if total_records == 0:
-                return [], 0
-
             query = self.db.query(PlanningTurnoORM)
             query = self._apply_filters(query, filters)
 
@@ -91,9 +80,7 @@ class PlanningTurnoRepository(IPlanningTurnoRepository):
                 PlanningTurnoORM.plnn_turno.asc()
             )
 
-            offset = (paginated_filters.page - 1) * paginated_filters.page_size
-
-            rows = query.limit(paginated_filters.page_size).offset(offset).all()
+            rows, total_records = paginate(query, paginated_filters.page, paginated_filters.page_size)
 
             entities = [
                 PlanningTurno(
@@ -6,6 +6,7 @@ from sqlalchemy.orm import Session
 from src.modules.administracion_service.src.application.ports.planta import IPlantaRepository
 from src.modules.administracion_service.src.domain.entities import Planta
 from src.modules.auth_service.src.infrastructure.db.models import PlantaORM
+from src.shared.common.reference_cache import reference_cache, PLANTAS
 from src.shared.exceptions import NotFoundError, RepositoryError
 
 
@@ -16,7 +17,12 @@ class PlantaRepository(IPlantaRepository):
     def get_by_id(self, id: Optional[int]) -> Optional[Planta]:
         if id is None:
             return None
+        return reference_cache.get_or_load(PLANTAS, ("id", id), lambda: self._get_by_id(id))
 
+    def get_all(self) -> List[Planta]:
+        return list(reference_cache.get_or_load(PLANTAS, "activas", self._get_all))
+
+    def _get_by_id(self, id: int) -> Optional[Planta]:
         try:
             planta_orm = (
                 self.db.query(PlantaORM)
@@ -37,7 +43,7 @@ class PlantaRepository(IPlantaRepository):
         except SQLAlchemyError:
             raise RepositoryError("Error al consultar la existencia de la planta")
 
-    def get_all(self) -> List[Planta]:
+    def _get_all(self) -> List[Planta]:
         try:
             planta_orm = (
                 self.db.query(PlantaORM)
@@ -13,12 +13,17 @@ class IAuditoriaLogRepository(ABC):
     def count_by_filters(self, filters: AuditoriaLogFilters) -> int:
         """Cuenta logs según los filtros proporcionados."""
         pass
+
+    @abstractmethod
+    def count_by_filters_cached(self, filters: AuditoriaLogFilters) -> Tuple[int, bool]:
+        """Total y si es exacto (False cuando proviene de la caché de conteos)."""
+        pass
         
     @abstractmethod
     def get_paginated_by_filters(
         self, filters: AuditoriaLogFilters, page: int, page_size: int
-    ) -> Tuple[List[AuditoriaLogORM], int]:
-        """Obtiene logs paginados según filtros y devuelve ORMs y conteo."""
+    ) -> Tuple[List[AuditoriaLogORM], int, bool]:
+        """Obtiene logs paginados según filtros y devuelve ORMs, conteo y si el conteo es exacto."""
         pass
 
     @abstractmethod
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import List, Optional
 from src.modules.auth_service.src.infrastructure.api.schemas.usuarios import (
     UsuarioCreate,
@@ -17,6 +18,11 @@ class IUsuarioRepository(ABC):
     def get_by_id(self, usuario_id: int) -> Optional[Usuario]:
         pass
 
+    @abstractmethod
+    def get_updated_at(self, usuario_id: int) -> Optional[datetime]:
+        """Solo la columna updated_at (versión del usuario), sin cargar relaciones."""
+        pass
+
     @abstractmethod
     def get_by_username(self, username: str) -> Optional[Usuario]:
         pass
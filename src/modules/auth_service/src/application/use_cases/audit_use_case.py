@@ -1,9 +1,12 @@
+from datetime import datetime
 from typing import Dict, Any, Optional, List, Tuple
 from math import ceil
 from src.modules.auth_service.src.application.ports.auditoria_log_repository import IAuditoriaLogRepository
 from src.modules.auth_service.src.application.ports.usuarios import IUsuarioRepository
 from src.modules.auth_service.src.infrastructure.api.schemas.usuarios import UsuarioResponse
 from src.modules.auth_service.src.infrastructure.api.schemas.auditoria import AuditoriaLogFilters, AuditoriaLogPagination
+from src.modules.auth_service.src.infrastructure.audit.audit_writer import AuditLogWriter
+from src.modules.auth_service.src.infrastructure.cache.user_snapshot_cache import user_snapshot_cache
 from src.modules.auth_service.src.infrastructure.db.models import AuditoriaLogORM
 
 class AuditUseCase:
@@ -11,23 +14,40 @@ class AuditUseCase:
     def __init__(
         self, 
         log_repository: IAuditoriaLogRepository,
-        user_repository: IUsuarioRepository
+        user_repository: IUsuarioRepository,
+        log_writer: Optional[AuditLogWriter] = None
     ):
         self.log_repository = log_repository
         self.user_repository = user_repository
+        # Con log_writer los logs se encolan y se escriben en segundo plano
+        self.log_writer = log_writer
 
     def _get_user_snapshot(self, user_id: int) -> Optional[Dict[str, Any]]:
-        """Obtiene un snapshot JSON simple del usuario que realiza la acción."""
+        """
+        Obtiene un snapshot JSON simple del usuario que realiza la acción.
+
+        Se reutiliza el snapshot en caché mientras `updated_at` no cambie; solo
+        se consulta esa columna en lugar del grafo completo del usuario.
+        """
         try:
+            updated_at = self.user_repository.get_updated_at(user_id)
+            if updated_at is None:
+                return None
+            snapshot = user_snapshot_cache.get(user_id, updated_at)
+            if snapshot is not None:
+                return snapshot
+
             # Usamos el repositorio de usuarios para obtener el objeto
             usuario = self.user_repository.get_by_id(user_id)
             if usuario:
                 # Usamos el schema 'UsuarioResponse' para convertirlo a un JSON limpio
-                return UsuarioResponse.model_validate(usuario).model_dump(mode="json")
+                snapshot = UsuarioResponse.model_validate(usuario).model_dump(mode="json")
+                user_snapshot_cache.set(user_id, usuario.updated_at, snapshot)
+                return snapshot
         except Exception:
             return None # No fallar si el usuario no se encuentra
 
-    def log_action(
+    def _build_log(
         self,
         accion: str,
         user_id: int,
@@ -35,25 +55,39 @@ class AuditUseCase:
         entidad_id: str,
         datos_nuevos: Optional[Dict[str, Any]] = None,
         datos_anteriores: Optional[Dict[str, Any]] = None
-    ):
-        """
-        Método principal para registrar una acción de auditoría.
-        """
-        # Obtenemos el snapshot del usuario
-        user_snapshot = self._get_user_snapshot(user_id)
-        
-        log_data = {
+    ) -> Dict[str, Any]:
+        # La fecha se fija aquí: el registro puede persistirse más tarde
+        return {
             "modelo": modelo,
             "entidad_id": str(entidad_id),
             "accion": accion,
             "datos_anteriores": datos_anteriores,
             "datos_nuevos": datos_nuevos,
             "ejecutado_por_id": user_id,
-            "ejecutado_por_json": user_snapshot
+            "fecha": datetime.now()
         }
-        
-        # Enviamos a la base de datos
-        self.log_repository.create_log(log_data)
+
+    def _dispatch(self, logs: List[Dict[str, Any]]):
+        if self.log_writer is not None:
+            self.log_writer.enqueue(logs)
+        else:
+            self.persist_logs(logs)
+
+    def log_action(
+        self,
+        accion: str,
+        user_id: int,
+        modelo: str,
+        entidad_id: str,
+        datos_nuevos: Optional[Dict[str, Any]] = None,
+        datos_anteriores: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Método principal para registrar una acción de auditoría.
+        """
+        self._dispatch([
+            self._build_log(accion, user_id, modelo, entidad_id, datos_nuevos, datos_anteriores)
+        ])
 
     def log_actions_batch(
             self,
@@ -69,33 +103,53 @@ class AuditUseCase:
           - datos_nuevos
           - datos_anteriores
         """
+        self._dispatch([
+            self._build_log(
+                accion=entry["accion"],
+                user_id=user_id,
+                modelo=entry["modelo"],
+                entidad_id=entry["entidad_id"],
+                datos_nuevos=entry.get("datos_nuevos"),
+                datos_anteriores=entry.get("datos_anteriores")
+            )
+            for entry in logs
+        ])
 
-        user_snapshot = self._get_user_snapshot(user_id)
-
+    def persist_logs(self, logs: List[Dict[str, Any]]) -> bool:
+        """
+        Completa el snapshot del usuario (una consulta por usuario distinto) y
+        escribe los logs con un único INSERT multi-fila.
+        """
+        snapshots: Dict[Optional[int], Optional[Dict[str, Any]]] = {}
         logs_preparados = []
-        for entry in logs:
+        for log in logs:
+            user_id = log.get("ejecutado_por_id")
+            if user_id not in snapshots:
+                snapshots[user_id] = self._get_user_snapshot(user_id) if user_id is not None else None
+
+            fecha = log.get("fecha")
+            if isinstance(fecha, str):
+                # Registros recuperados del archivo de respaldo
+                fecha = datetime.fromisoformat(fecha)
+
             logs_preparados.append({
-                "modelo": entry["modelo"],
-                "entidad_id": str(entry["entidad_id"]),
-                "accion": entry["accion"],
-                "datos_anteriores": entry.get("datos_anteriores"),
-                "datos_nuevos": entry.get("datos_nuevos"),
-                "ejecutado_por_id": user_id,
-                "ejecutado_por_json": user_snapshot
+                **log,
+                "fecha": fecha or datetime.now(),
+                "ejecutado_por_json": snapshots[user_id]
             })
 
-        self.log_repository.create_logs_batch(logs_preparados)
+        return self.log_repository.create_logs_batch(logs_preparados)
 
-    def count_logs_by_filters(self, filters: AuditoriaLogFilters) -> int:
-        """Obtiene el conteo total de logs según filtros."""
-        return self.log_repository.count_by_filters(filters)
+    def count_logs_by_filters(self, filters: AuditoriaLogFilters) -> Tuple[int, bool]:
+        """Obtiene el conteo total de logs según filtros y si es exacto (False si viene de la caché)."""
+        return self.log_repository.count_by_filters_cached(filters)
 
     def get_logs_paginated_by_filters(
         self, pagination_params: AuditoriaLogPagination
     ) -> Dict[str, Any]:
         """Obtiene logs paginados según filtros."""
         
-        orm_list, total_records = self.log_repository.get_paginated_by_filters(
+        orm_list, total_records, total_is_exact = self.log_repository.get_paginated_by_filters(
             filters=pagination_params, # Pasamos el objeto completo que incluye los filtros
             page=pagination_params.page,
             page_size=pagination_params.page_size
@@ -110,5 +164,6 @@ class AuditUseCase:
             "total_pages": total_pages,
             "page": pagination_params.page,
             "page_size": pagination_params.page_size,
+            "total_is_exact": total_is_exact,
             "data": orm_list, 
         }
\ No newline at end of file
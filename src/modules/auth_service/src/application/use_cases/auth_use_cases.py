@@ -6,7 +6,9 @@ from src.modules.auth_service.src.application.ports.permisos_modulo import IPerm
 from src.modules.auth_service.src.application.ports.sesiones import ISesionRepository
 from src.modules.auth_service.src.infrastructure.api.schemas.auth import LoginRequest
 from src.modules.auth_service.src.infrastructure.api.schemas.sesiones import SesionCreate
-from src.modules.auth_service.src.domain.value_objects import Password, Token, UserSession, ModuloInfo, PermisosList
+from src.modules.auth_service.src.domain.value_objects import Password, Token, UserSession, ModuloInfo, PermisosList, PermisosBitmask
+from src.modules.auth_service.src.infrastructure.cache.session_cache import session_cache
+from src.shared.config import settings
 from src.shared.exceptions import NotFoundError, ValidationError, RepositoryError
 
 
@@ -81,7 +83,8 @@ class AuthUseCase:
                     "user_id": usuario.id_usuario,  # Mantener para compatibilidad
                     "session_id": sesion.id_sesion,
                     "lineas": lineas_permitidas,
-                    "turnos": turnos_permitidos
+                    "turnos": turnos_permitidos,
+                    **self._permission_claims(rol)
                 }
             )
             
@@ -123,13 +126,42 @@ class AuthUseCase:
             print("Error al autenticar usuario:", e)
             raise RepositoryError("Error al autenticar usuario.") from e
 
+    @staticmethod
+    def _permission_claims(rol) -> Dict[str, Any]:
+        """
+        Claims para autorizar sin consultar la BD (AUTH_PERMISSION_CLAIMS_ENABLED).
+        'pv' permite detectar tokens emitidos antes de un cambio en los permisos del rol.
+        """
+        if not settings.AUTH_PERMISSION_CLAIMS_ENABLED:
+            return {}
+
+        permisos_modulo = rol.permisos_modulo or []
+        modulos = [
+            {
+                "nombre": p.modulo.value if hasattr(p.modulo, "value") else p.modulo,
+                "permisos": [x.value if hasattr(x, "value") else x for x in p.permisos],
+            }
+            for p in permisos_modulo
+            if p.is_active
+        ]
+        return {
+            "rol_id": rol.id_rol,
+            "perms": PermisosBitmask.from_modulos(modulos).value,
+            "pv": PermisosBitmask.version([rol.updated_at] + [p.updated_at for p in permisos_modulo]),
+        }
+
     def logout(self, token: str) -> bool:
         """Cierra sesión invalidando el token"""
         sesion = self.sesion_repository.invalidate_by_token(token)
+        session_cache.invalidate_token(token)
         return sesion is not None
 
     def verify_token(self, token: str) -> Optional[Dict[str, Any]]:
         """Verifica si un token es válido y retorna información del usuario"""
+        cached = session_cache.get(token)
+        if cached is not None:
+            return cached
+
         sesion = self.sesion_repository.get_by_token(token)
         if not sesion or not sesion.is_active:
             return None
@@ -177,7 +209,7 @@ class AuthUseCase:
                 })
 
 
-        return {
+        user_info = {
             "user_id": usuario.id_usuario,
             "username": usuario.username,
             "is_superuser": usuario.is_superuser,
@@ -189,6 +221,8 @@ class AuthUseCase:
             "lineas": lineas_permitidas,
             "turnos": turnos_permitidos
         }
+        session_cache.set(token, user_info, expires_at=sesion.fecha_expiracion)
+        return user_info
 
     def refresh_token(self, token: str) -> Optional[Dict[str, Any]]:
         """Renueva un token válido"""
@@ -198,6 +232,7 @@ class AuthUseCase:
 
         # Invalidar token actual
         self.sesion_repository.invalidate_by_token(token)
+        session_cache.invalidate_token(token)
 
         # Crear nueva sesión
         new_token = Token.generate(
@@ -219,13 +254,19 @@ class AuthUseCase:
         # Guardar la nueva sesión
         new_sesion = self.sesion_repository.create(sesion_data)
         
+        permission_claims = {}
+        if settings.AUTH_PERMISSION_CLAIMS_ENABLED:
+            rol = self.rol_repository.get_with_permisos(user_info["rol"]["id"])
+            permission_claims = self._permission_claims(rol) if rol else {}
+
         token_with_session = Token.generate(
              payload={
                 "sub": str(user_info["user_id"]),
                 "username": user_info["username"],
                 "user_id": user_info["user_id"],
                 "lineas": user_info.get("lineas", []),
-                "session_id": new_sesion.id_sesion 
+                "session_id": new_sesion.id_sesion,
+                **permission_claims
             }
         )
 
@@ -240,7 +281,9 @@ class AuthUseCase:
 
     def logout_all_sessions(self, user_id: int) -> bool:
         """Cierra todas las sesiones de un usuario"""
-        return self.sesion_repository.invalidate_all_by_usuario_id(user_id)
+        result = self.sesion_repository.invalidate_all_by_usuario_id(user_id)
+        session_cache.invalidate_user(user_id)
+        return result
 
     def cleanup_expired_sessions(self) -> int:
         """Limpia sesiones expiradas"""
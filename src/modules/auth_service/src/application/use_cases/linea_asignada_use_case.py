@@ -5,6 +5,8 @@ from src.modules.auth_service.src.infrastructure.api.schemas.usuarios import Usu
 from src.modules.auth_service.src.infrastructure.db.repositories.linea_externa_repository import ILineaExternaRepository
 from src.modules.auth_service.src.infrastructure.db.models import UsuarioLineaAsignada
 from src.shared.exceptions import NotFoundError, ValidationError, AlreadyExistsError
+from src.modules.auth_service.src.infrastructure.cache.session_cache import session_cache
+from src.modules.auth_service.src.infrastructure.cache.user_snapshot_cache import user_snapshot_cache
 from src.modules.auth_service.src.application.use_cases.audit_use_case import AuditUseCase
 
 class LineaAsignadaUseCase:
@@ -37,6 +39,8 @@ class LineaAsignadaUseCase:
         if not self.linea_externa_repository.exists_by_id(id_linea_externa):
             raise NotFoundError(f"Línea externa con id={id_linea_externa} no existe.")
         nueva_asignacion = self.linea_asignada_repository.asignar(id_usuario, id_linea_externa)
+        session_cache.invalidate_user(id_usuario)
+        user_snapshot_cache.invalidate_user(id_usuario)
         self.audit_use_case.log_action(
             accion="CREATE",
             user_id=user_data.get("user_id"),
@@ -64,4 +68,7 @@ class LineaAsignadaUseCase:
             datos_anteriores=datos_anteriores
         )
 
-        return self.linea_asignada_repository.remover(id_usuario, id_linea_externa)
\ No newline at end of file
+        resultado = self.linea_asignada_repository.remover(id_usuario, id_linea_externa)
+        session_cache.invalidate_user(id_usuario)
+        user_snapshot_cache.invalidate_user(id_usuario)
+        return resultado
\ No newline at end of file
@@ -5,6 +5,8 @@ from src.modules.auth_service.src.infrastructure.api.schemas.roles import RolCre
 from src.modules.auth_service.src.infrastructure.api.schemas.permisos_modulo import PermisoModuloCreate
 from src.modules.auth_service.src.infrastructure.db.models import Rol
 from src.modules.auth_service.src.domain.entities import ModuloEnum, PermisoEnum
+from src.modules.auth_service.src.infrastructure.cache.session_cache import session_cache
+from src.modules.auth_service.src.infrastructure.cache.user_snapshot_cache import user_snapshot_cache
 from src.shared.exceptions import AlreadyExistsError, NotFoundError, ValidationError
 
 from src.modules.auth_service.src.application.use_cases.audit_use_case import AuditUseCase
@@ -74,6 +76,8 @@ class RolUseCase:
             raise ValidationError("El nombre del rol debe tener al menos 2 caracteres.")
 
         updated_rol = self.rol_repository.update(rol_id, rol_data)
+        session_cache.invalidate_rol(rol_id)
+        user_snapshot_cache.invalidate_rol(rol_id)
         self.audit_use_case.log_action(
             accion="UPDATE",
             user_id=user_data.get("user_id"),
@@ -92,6 +96,8 @@ class RolUseCase:
             raise NotFoundError(f"Rol con id={rol_id} no encontrado.")
         datos_anteriores = RolResponse.model_validate(rol).model_dump(mode="json")
         deleted_rol = self.rol_repository.soft_delete(rol_id)
+        session_cache.invalidate_rol(rol_id)
+        user_snapshot_cache.invalidate_rol(rol_id)
         self.audit_use_case.log_action(
             accion="DELETE",
             user_id=user_data.get("user_id"),
@@ -163,7 +169,9 @@ class RolUseCase:
         # Desactivar los permisos que no están en la nueva lista
         for permiso_sobrante in modulos_existentes.values():
             self.permiso_repository.soft_delete(permiso_sobrante.id_permiso_modulo)
-        
+        session_cache.invalidate_rol(rol_id)
+        user_snapshot_cache.invalidate_rol(rol_id)
+
         datos_nuevos_summary = self.get_rol_permisos_summary(rol_id)
         datos_nuevos = datos_nuevos_summary.get("modulos", [])
         self.audit_use_case.log_action(
@@ -5,6 +5,8 @@ from src.modules.auth_service.src.application.ports.turno_externo_repository imp
 from src.modules.auth_service.src.application.use_cases.audit_use_case import AuditUseCase
 from src.modules.auth_service.src.infrastructure.db.models import UsuarioTurnoAsignado
 from src.shared.exceptions import NotFoundError, ValidationError, AlreadyExistsError
+from src.modules.auth_service.src.infrastructure.cache.session_cache import session_cache
+from src.modules.auth_service.src.infrastructure.cache.user_snapshot_cache import user_snapshot_cache
 
 class TurnoAsignadoUseCase:
     
@@ -44,6 +46,8 @@ class TurnoAsignadoUseCase:
 
         # 3. Asignar el turno
         nueva_asignacion = self.turno_asignado_repository.asignar(id_usuario, id_turno_externo)
+        session_cache.invalidate_user(id_usuario)
+        user_snapshot_cache.invalidate_user(id_usuario)
 
         # 4. Registrar en auditoría
         try:
@@ -74,6 +78,8 @@ class TurnoAsignadoUseCase:
 
         # 2. Remover el turno
         resultado = self.turno_asignado_repository.remover(id_usuario, id_turno_externo)
+        session_cache.invalidate_user(id_usuario)
+        user_snapshot_cache.invalidate_user(id_usuario)
 
         # 3. Registrar en auditoría
         try:
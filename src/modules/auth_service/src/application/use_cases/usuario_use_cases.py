@@ -4,6 +4,8 @@ from src.modules.auth_service.src.application.ports.roles import IRolRepository
 from src.modules.auth_service.src.infrastructure.api.schemas.usuarios import UsuarioCreate, UsuarioUpdate, UsuarioResponse
 from src.modules.auth_service.src.infrastructure.db.models import Usuario
 from src.modules.auth_service.src.domain.value_objects import Password, Username
+from src.modules.auth_service.src.infrastructure.cache.session_cache import session_cache
+from src.modules.auth_service.src.infrastructure.cache.user_snapshot_cache import user_snapshot_cache
 from src.shared.exceptions import AlreadyExistsError, NotFoundError, ValidationError
 
 #Auditoria
@@ -102,6 +104,8 @@ class UsuarioUseCase:
                 raise NotFoundError(f"Rol con id={usuario_data.id_rol} no encontrado o inactivo.")
 
         updated_user_orm = self.usuario_repository.update(usuario_id, usuario_data)
+        session_cache.invalidate_user(usuario_id)
+        user_snapshot_cache.invalidate_user(usuario_id)
         # 3. Registrar en auditoría
         self.audit_use_case.log_action(
             accion="UPDATE",
@@ -120,6 +124,8 @@ class UsuarioUseCase:
             raise NotFoundError(f"Usuario con id={usuario_id} no encontrado.")
         datos_anteriores = UsuarioResponse.model_validate(usuario).model_dump(mode="json")
         updated_user = self.usuario_repository.soft_delete(usuario_id)
+        session_cache.invalidate_user(usuario_id)
+        user_snapshot_cache.invalidate_user(usuario_id)
         # 3. Registrar en auditoría
         self.audit_use_case.log_action(
             accion="DELETE",
@@ -144,6 +150,8 @@ class UsuarioUseCase:
         # Crear datos de actualización para activar
         update_data = UsuarioUpdate(is_active=True)
         updated_user = self.usuario_repository.update(usuario_id, update_data)
+        session_cache.invalidate_user(usuario_id)
+        user_snapshot_cache.invalidate_user(usuario_id)
         # 3. Registrar en auditoría
         self.audit_use_case.log_action(
             accion="UPDATE",
@@ -1,9 +1,14 @@
 from dataclasses import dataclass
-from typing import List
+from typing import List, Iterable, Optional
 import re
 import hashlib
 import secrets
 from datetime import datetime, timedelta
+from src.modules.auth_service.src.domain.entities import ModuloEnum
+
+# Bits de cada permiso dentro del bloque de 2 bits que ocupa un módulo
+_PERMISO_BITS = {"read": 1, "write": 2}
+_MODULO_INDEX = {modulo.value: index for index, modulo in enumerate(ModuloEnum)}
 
 @dataclass(frozen=True)
 class Username:
@@ -141,6 +146,65 @@ class PermisosList:
         return self.has_read() and self.has_write()
 
 
+@dataclass(frozen=True)
+class PermisosBitmask:
+    """
+    Value object con los permisos de todos los módulos codificados en un entero.
+    Cada módulo ocupa 2 bits según su posición en ModuloEnum (read=1, write=2),
+    por lo que los módulos nuevos deben agregarse siempre al final del enum.
+    """
+    value: int
+
+    def __post_init__(self):
+        if not isinstance(self.value, int) or self.value < 0:
+            raise ValueError("Bitmask de permisos inválido")
+
+    @classmethod
+    def from_modulos(cls, modulos: Iterable[dict]) -> "PermisosBitmask":
+        """Construye el bitmask a partir de [{"nombre": ..., "permisos": [...]}]"""
+        value = 0
+        for modulo in modulos:
+            index = _MODULO_INDEX.get(modulo["nombre"])
+            if index is None:
+                continue
+            for permiso in modulo["permisos"]:
+                value |= _PERMISO_BITS.get(permiso, 0) << (index * 2)
+        return cls(value=value)
+
+    def has(self, modulo: str, permisos: Optional[List[str]] = None) -> bool:
+        """Verifica acceso al módulo y, si se indican, los permisos requeridos"""
+        index = _MODULO_INDEX.get(modulo)
+        if index is None:
+            return False
+        bits = (self.value >> (index * 2)) & 0b11
+        if not permisos:
+            return bits != 0
+        required = 0
+        for permiso in permisos:
+            required |= _PERMISO_BITS.get(permiso, 0)
+        return required != 0 and bits & required == required
+
+    def to_modulos(self) -> List[dict]:
+        """Inverso de from_modulos: [{"nombre": ..., "permisos": [...]}] de los módulos con algún permiso"""
+        modulos = []
+        for nombre, index in _MODULO_INDEX.items():
+            bits = (self.value >> (index * 2)) & 0b11
+            if bits:
+                modulos.append({
+                    "nombre": nombre,
+                    "permisos": [permiso for permiso, bit in _PERMISO_BITS.items() if bits & bit],
+                })
+        return modulos
+
+    @staticmethod
+    def version(fechas: Iterable[Optional[datetime]]) -> int:
+        """Versión de los permisos de un rol: última modificación en milisegundos"""
+        fechas = [f for f in fechas if f is not None]
+        if not fechas:
+            return 0
+        return int(max(fechas).timestamp() * 1000)
+
+
 @dataclass(frozen=True)
 class ModuloInfo:
     """Value object para información de módulo"""
@@ -2,12 +2,14 @@ from fastapi import APIRouter, Depends, status
 from sqlalchemy.orm import Session
 from typing import List, Dict, Any
 from src.shared.base import get_auth_db # Usamos la DB de autenticación
+from src.shared.common.count_cache import TOTAL_SOURCE_HEADER, total_source
 from src.shared.common.responses import success_response, error_response
 from src.shared.exceptions import RepositoryError
 import traceback
 
 # proteger estos endpoints)
-from src.shared.security import get_current_user_data 
+from src.modules.auth_service.src.domain.entities import ModuloEnum
+from src.modules.auth_service.src.infrastructure.middleware import require_read_access
 
 # Importar dependencia del AuditUseCase
 from src.modules.auth_service.src.infrastructure.api.routers.lineas_asignadas_router import get_audit_use_case
@@ -25,15 +27,17 @@ router = APIRouter()
 def get_total_logs_by_filters(
     filters: AuditoriaLogFilters,
     use_case: AuditUseCase = Depends(get_audit_use_case),
-    user_data: Dict[str, Any] = Depends(get_current_user_data)
+    user_data: Dict[str, Any] = Depends(require_read_access(ModuloEnum.AUDITORIA))
 ):
     """Obtiene el número total de logs de auditoría según los filtros."""
     try:
-        total_records = use_case.count_logs_by_filters(filters)
-        return success_response(
+        total_records, total_is_exact = use_case.count_logs_by_filters(filters)
+        response = success_response(
             data=total_records,
             message="Total de logs obtenido",
         )
+        response.headers[TOTAL_SOURCE_HEADER] = total_source(total_is_exact)
+        return response
     except RepositoryError as e:
         return error_response(
             message=str(e), status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -46,7 +50,7 @@ def get_total_logs_by_filters(
 def get_logs_paginated(
     pagination_params: AuditoriaLogPagination,
     use_case: AuditUseCase = Depends(get_audit_use_case),
-    user_data: Dict[str, Any] = Depends(get_current_user_data)
+    user_data: Dict[str, Any] = Depends(require_read_access(ModuloEnum.AUDITORIA))
 ):
     """Obtiene los logs de auditoría paginados según los filtros."""
     try:
@@ -63,6 +67,7 @@ def get_logs_paginated(
             "total_pages": pagination_result["total_pages"],
             "page": pagination_result["page"],
             "page_size": pagination_result["page_size"],
+            "total_is_exact": pagination_result["total_is_exact"],
             "data": response_data,
         }
         
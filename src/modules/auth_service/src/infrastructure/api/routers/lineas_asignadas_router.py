@@ -1,9 +1,11 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, status
 from sqlalchemy.orm import Session
 from typing import List, Dict, Any
 from src.shared.base import get_auth_db, get_db
 # Necesitarás una dependencia similar para tu DB externa
 from src.shared.common.responses import success_response
+from src.shared.common.http_cache import cached_success_response
+from src.shared.common.reference_cache import LINEAS
 from src.modules.auth_service.src.infrastructure.db.repositories.usuario_repository import UsuarioRepository
 from src.modules.auth_service.src.infrastructure.db.repositories.linea_asignada_repository import LineaAsignadaRepository
 # Repo externo
@@ -90,22 +92,22 @@ def get_linea_externa_use_case(
     status_code=status.HTTP_200_OK
 )
 def get_all_active_lines(
+    request: Request,
     use_case: LineaExternaUseCase = Depends(get_linea_externa_use_case)
 ):
     """
     Obtiene una lista de todas las líneas de trabajo externas
     que se encuentran activas.
     """
-    # El caso de uso devuelve entidades de dominio
-    lineas_entities = use_case.get_all_active_lines()
-    
-    # Mapeamos las entidades a los Schemas de Respuesta Pydantic
-    response_data = [
-        LineaExternaResponse.model_validate(linea).model_dump() 
-        for linea in lineas_entities
-    ]
-    
-    return success_response(
-        data=response_data,
+    # El caso de uso devuelve entidades de dominio; se mapean a los Schemas de
+    # Respuesta solo si el cuerpo no está ya en la caché HTTP
+    def build_data():
+        return [
+            LineaExternaResponse.model_validate(linea).model_dump()
+            for linea in use_case.get_all_active_lines()
+        ]
+
+    return cached_success_response(
+        request, LINEAS, "externas_activas", build_data,
         message="Líneas activas obtenidas"
     )
\ No newline at end of file
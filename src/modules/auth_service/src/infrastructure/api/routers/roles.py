@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, status
 from typing import List, Dict, Any
 from src.modules.auth_service.src.application.use_cases.rol_use_cases import RolUseCase
 from src.modules.auth_service.src.infrastructure.api.schemas.roles import (
@@ -13,11 +13,13 @@ from src.modules.auth_service.src.infrastructure.db.repositories.rol_repository
 from src.modules.auth_service.src.infrastructure.db.repositories.permiso_modulo_repository import PermisoModuloRepository
 from src.shared.exceptions import DomainError
 from src.shared.common.responses import success_response, error_response
+from src.shared.common.http_cache import cached_success_response
 from sqlalchemy.orm import Session
 from src.shared.base import get_auth_db
 #Auditoria
 from src.modules.auth_service.src.application.use_cases.audit_use_case import AuditUseCase
-from src.shared.security import get_current_user_data
+from src.modules.auth_service.src.domain.entities import ModuloEnum
+from src.modules.auth_service.src.infrastructure.middleware import require_write_access
 from src.shared.common.auditoria import get_audit_use_case
 
 router = APIRouter()
@@ -82,7 +84,7 @@ def get_rol_with_permisos(
 def create_rol(
     rol_data: RolCreate,
     rol_use_case: RolUseCase = Depends(get_rol_use_case),
-    user_data: Dict[str, Any] = Depends(get_current_user_data)
+    user_data: Dict[str, Any] = Depends(require_write_access(ModuloEnum.ROLES))
 ):
     """Crea un nuevo rol"""
     new_data = rol_use_case.create_rol(rol_data, user_data)
@@ -98,7 +100,7 @@ def update_rol(
     rol_id: int,
     rol_data: RolUpdate,
     rol_use_case: RolUseCase = Depends(get_rol_use_case),
-    user_data: Dict[str, Any] = Depends(get_current_user_data)
+    user_data: Dict[str, Any] = Depends(require_write_access(ModuloEnum.ROLES))
 ):
     """Actualiza un rol existente"""
     updated_data = rol_use_case.update_rol(rol_id, rol_data, user_data)
@@ -117,7 +119,7 @@ def update_rol(
 def delete_rol(
     rol_id: int, 
     rol_use_case: RolUseCase = Depends(get_rol_use_case),
-    user_data: Dict[str, Any] = Depends(get_current_user_data)
+    user_data: Dict[str, Any] = Depends(require_write_access(ModuloEnum.ROLES))
 ):
     """Elimina (desactiva) un rol"""
     deleted_data = rol_use_case.delete_rol(rol_id, user_data)
@@ -137,7 +139,7 @@ def assign_permisos_to_rol(
     rol_id: int,
     permisos_data: AsignPermisosRequest,
     rol_use_case: RolUseCase = Depends(get_rol_use_case),
-    user_data: Dict[str, Any] = Depends(get_current_user_data)
+    user_data: Dict[str, Any] = Depends(require_write_access(ModuloEnum.ROLES))
 ):
     """Asigna permisos a un rol"""
     # Convertir los objetos Pydantic a diccionarios
@@ -150,10 +152,11 @@ def assign_permisos_to_rol(
 
 
 @router.get("/modulos/disponibles", response_model=ModulosDisponiblesResponse, status_code=status.HTTP_200_OK)
-def get_modulos_disponibles(rol_use_case: RolUseCase = Depends(get_rol_use_case)):
+def get_modulos_disponibles(request: Request, rol_use_case: RolUseCase = Depends(get_rol_use_case)):
     """Obtiene la lista de módulos disponibles"""
-    modulos = rol_use_case.get_available_modulos()
-    return success_response(
-        data={"modulos": modulos},
+    # Lista estática (enums): sin entidad de referencia, el ETag se calcula por contenido
+    return cached_success_response(
+        request, None, "modulos_disponibles",
+        lambda: {"modulos": rol_use_case.get_available_modulos()},
         message="Módulos disponibles obtenidos"
     )
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, status
 from sqlalchemy.orm import Session
 from typing import List, Dict, Any
 
@@ -7,6 +7,8 @@ from src.shared.base import get_auth_db, get_db
 
 # Respuestas y seguridad
 from src.shared.common.responses import success_response
+from src.shared.common.http_cache import cached_success_response
+from src.shared.common.reference_cache import TURNOS
 from src.shared.security import get_current_user_data
 
 # Repositorios (Usuario es necesario para los casos de uso)
@@ -103,22 +105,22 @@ def remover_turno_de_usuario(
     status_code=status.HTTP_200_OK
 )
 def get_all_active_turnos(
+    request: Request,
     use_case: TurnoExternaUseCase = Depends(get_turno_externo_use_case)
 ):
     """
     Obtiene una lista de todos los turnos de trabajo externos
     que se encuentran activos.
     """
-    # El caso de uso devuelve entidades de dominio
-    turnos_entities = use_case.get_all_active_turnos()
-    
-    # Mapeamos las entidades a los Schemas de Respuesta Pydantic
-    response_data = [
-        TurnoExternoResponse.model_validate(turno).model_dump() 
-        for turno in turnos_entities
-    ]
-    
-    return success_response(
-        data=response_data,
+    # El caso de uso devuelve entidades de dominio; se mapean a los Schemas de
+    # Respuesta solo si el cuerpo no está ya en la caché HTTP
+    def build_data():
+        return [
+            TurnoExternoResponse.model_validate(turno).model_dump()
+            for turno in use_case.get_all_active_turnos()
+        ]
+
+    return cached_success_response(
+        request, TURNOS, "externos_activos", build_data,
         message="Turnos activos obtenidos"
     )
\ No newline at end of file
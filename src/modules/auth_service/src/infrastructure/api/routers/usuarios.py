@@ -2,7 +2,8 @@ from fastapi import APIRouter, Depends, status
 from sqlalchemy.orm import Session
 from typing import List
 from src.shared.base import get_auth_db
-from src.shared.security import get_current_user_data
+from src.modules.auth_service.src.domain.entities import ModuloEnum
+from src.modules.auth_service.src.infrastructure.middleware import require_write_access
 from typing import List, Dict, Any
 from src.shared.common.responses import success_response, error_response
 from src.modules.auth_service.src.infrastructure.db.repositories.usuario_repository import UsuarioRepository
@@ -61,7 +62,7 @@ def get_usuario(
 def create_usuario(
     usuario_data: UsuarioCreate,
     usuario_use_case: UsuarioUseCase = Depends(get_usuario_use_case),
-    user_data: Dict[str, Any] = Depends(get_current_user_data)
+    user_data: Dict[str, Any] = Depends(require_write_access(ModuloEnum.USUARIOS))
 ):
     """Crea un nuevo usuario con permisos por módulo"""
     new_data = usuario_use_case.create_usuario(usuario_data, user_data)
@@ -77,7 +78,7 @@ def update_usuario(
     usuario_id: int,
     usuario_data: UsuarioUpdate,
     usuario_use_case: UsuarioUseCase = Depends(get_usuario_use_case),
-    user_data: Dict[str, Any] = Depends(get_current_user_data)
+    user_data: Dict[str, Any] = Depends(require_write_access(ModuloEnum.USUARIOS))
 ):
     """Actualiza un usuario existente con permisos por módulo"""
     updated_data = usuario_use_case.update_usuario(usuario_id, usuario_data, user_data)
@@ -96,7 +97,7 @@ def update_usuario(
 def delete_usuario(
     usuario_id: int, 
     usuario_use_case: UsuarioUseCase = Depends(get_usuario_use_case),
-    user_data: Dict[str, Any] = Depends(get_current_user_data)
+    user_data: Dict[str, Any] = Depends(require_write_access(ModuloEnum.USUARIOS))
 ):
     """Elimina (desactiva) un usuario"""
     deleted_data = usuario_use_case.delete_usuario(usuario_id, user_data)
@@ -115,7 +116,7 @@ def delete_usuario(
 def activate_usuario(
     usuario_id: int,
     usuario_use_case: UsuarioUseCase = Depends(get_usuario_use_case),
-    user_data: Dict[str, Any] = Depends(get_current_user_data)
+    user_data: Dict[str, Any] = Depends(require_write_access(ModuloEnum.USUARIOS))
 ):
     """Activa un usuario"""
     activated_data = usuario_use_case.activate_usuario(usuario_id, user_data)
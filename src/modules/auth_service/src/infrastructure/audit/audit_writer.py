@@ -0,0 +1,251 @@
+import glob
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Un archivo de respaldo ajeno sin modificar durante tantos intervalos de
+# reintento se considera huérfano (su proceso ya no existe) y se adopta
+STALE_SPILL_INTERVALS = 5
+
+
+class AuditLogWriter:
+    """
+    Escritor de logs de auditoría en segundo plano.
+
+    Las peticiones encolan los registros y continúan; un hilo los agrupa y los
+    persiste en lotes con `persist_batch` (un INSERT multi-fila por lote).
+
+    - La cola está acotada: si está llena, `enqueue` espera hasta
+      `put_timeout_seconds` (backpressure) y, si sigue llena, el registro se
+      vuelca al archivo de respaldo en lugar de perderse.
+    - Si `persist_batch` falla (p. ej. la base de datos no responde) el lote se
+      vuelca al archivo de respaldo (JSON lines) y se reintenta más tarde.
+    - Cada proceso escribe su propio archivo de respaldo (`spill_path` con el
+      pid como sufijo); los de procesos terminados se adoptan al reintentar.
+    - `stop` vacía la cola antes de terminar (shutdown de la aplicación).
+    """
+
+    def __init__(
+        self,
+        persist_batch: Callable[[List[Dict[str, Any]]], bool],
+        max_queue_size: int,
+        batch_size: int,
+        flush_interval_seconds: float,
+        put_timeout_seconds: float,
+        spill_path: str,
+        spill_replay_interval_seconds: float = 60,
+    ):
+        self._persist_batch = persist_batch
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=max_queue_size)
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.put_timeout_seconds = put_timeout_seconds
+        self.spill_path = spill_path
+        self.spill_replay_interval_seconds = spill_replay_interval_seconds
+
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._start_lock = threading.Lock()
+        self._spill_lock = threading.Lock()
+        self._last_replay = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        with self._start_lock:
+            if self.running:
+                return
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name="audit-log-writer", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Detiene el hilo tras persistir todo lo que quede en la cola."""
+        thread = self._thread
+        if thread is None:
+            return
+        self._stop_event.set()
+        thread.join(timeout)
+        self._thread = None
+
+    def enqueue(self, records: List[Dict[str, Any]]) -> None:
+        """Encola registros ya preparados (columnas de AuditoriaLogORM)."""
+        if not self.running:
+            self.start()
+
+        overflow: List[Dict[str, Any]] = []
+        for record in records:
+            if overflow:
+                overflow.append(record)
+                continue
+            try:
+                self._queue.put(record, timeout=self.put_timeout_seconds)
+            except queue.Full:
+                overflow.append(record)
+
+        if overflow:
+            logger.warning("Cola de auditoría llena: %s registros enviados al archivo de respaldo.", len(overflow))
+            self._spill(overflow)
+
+    def qsize(self) -> int:
+        return self._queue.qsize()
+
+    def _run(self) -> None:
+        self._replay_spill()
+        while not self._stop_event.is_set():
+            batch = self._next_batch(block=True)
+            if batch:
+                self._flush(batch)
+            if time.monotonic() - self._last_replay >= self.spill_replay_interval_seconds:
+                self._replay_spill()
+
+        # Flush final: vaciar la cola antes de salir
+        while True:
+            batch = self._next_batch(block=False)
+            if not batch:
+                break
+            self._flush(batch)
+
+    def _next_batch(self, block: bool) -> List[Dict[str, Any]]:
+        batch: List[Dict[str, Any]] = []
+        if block:
+            try:
+                batch.append(self._queue.get(timeout=self.flush_interval_seconds))
+            except queue.Empty:
+                return batch
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _flush(self, batch: List[Dict[str, Any]]) -> bool:
+        try:
+            ok = self._persist_batch(batch)
+        except Exception:
+            logger.exception("Error al persistir el lote de auditoría.")
+            ok = False
+        if not ok:
+            self._spill(batch)
+        return ok
+
+    @property
+    def process_spill_path(self) -> str:
+        """Archivo de respaldo de este proceso: `spill_path` con el pid (p. ej. audit_spill.1234.jsonl)."""
+        root, ext = os.path.splitext(self.spill_path)
+        return f"{root}.{os.getpid()}{ext}"
+
+    def _spill(self, records: List[Dict[str, Any]]) -> None:
+        if not records:
+            return
+        spill_path = self.process_spill_path
+        directory = os.path.dirname(spill_path)
+        with self._spill_lock:
+            try:
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                with open(spill_path, "a", encoding="utf-8") as spill_file:
+                    for record in records:
+                        spill_file.write(json.dumps(record, default=str, ensure_ascii=False) + "\n")
+            except OSError:
+                logger.exception("No se pudieron volcar %s registros de auditoría a %s.", len(records), spill_path)
+
+    def _claim_spill_files(self) -> List[str]:
+        """
+        Renombra a un nombre único (`*.replay`) los archivos a reintentar: el
+        respaldo de este proceso, sus reintentos pendientes y los archivos
+        huérfanos de otros procesos. Los reintentos pendientes propios se
+        devuelven tal cual (ya están reclamados).
+        """
+        root, ext = os.path.splitext(self.spill_path)
+        own_spill = self.process_spill_path
+        own_prefix = f"{root}.{os.getpid()}."
+        stale_before = time.time() - STALE_SPILL_INTERVALS * self.spill_replay_interval_seconds
+
+        claimed = []
+        with self._spill_lock:
+            # El archivo compartido de versiones anteriores se trata como uno ajeno más
+            candidates = sorted(set(glob.glob(f"{glob.escape(root)}.*{ext}")) | {self.spill_path})
+            candidates += sorted(glob.glob(f"{glob.escape(root)}.*{ext}.replay"))
+            for path in candidates:
+                try:
+                    if path.startswith(own_prefix) and path.endswith(".replay"):
+                        os.utime(path)
+                        claimed.append(path)
+                        continue
+                    if path != own_spill and os.path.getmtime(path) > stale_before:
+                        continue  # De otro proceso que sigue activo
+                    target = f"{own_prefix}{time.time_ns()}{ext}.replay"
+                    os.replace(path, target)
+                    # mtime actual: los demás procesos no lo adoptan mientras se reintenta
+                    os.utime(target)
+                    claimed.append(target)
+                except FileNotFoundError:
+                    continue  # Otro proceso lo reclamó primero
+                except OSError:
+                    logger.exception("No se pudo reclamar el archivo de respaldo de auditoría %s.", path)
+        return claimed
+
+    def _read_spill_file(self, path: str) -> List[Dict[str, Any]]:
+        """Lee un archivo de respaldo línea a línea; las líneas ilegibles se apartan en `<archivo>.corrupt`."""
+        records: List[Dict[str, Any]] = []
+        corrupt: List[str] = []
+        with open(path, encoding="utf-8", errors="replace") as replay_file:
+            for line in replay_file:
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    record = None
+                if isinstance(record, dict):
+                    records.append(record)
+                else:
+                    corrupt.append(line.rstrip("\n") + "\n")
+
+        if corrupt:
+            # Típicamente la última línea de un volcado interrumpido por una caída
+            logger.warning(
+                "%s líneas ilegibles en el respaldo de auditoría %s; se apartan en %s.corrupt.",
+                len(corrupt), path, path,
+            )
+            with open(f"{path}.corrupt", "a", encoding="utf-8") as corrupt_file:
+                corrupt_file.writelines(corrupt)
+        return records
+
+    def _replay_spill(self) -> None:
+        """Reintenta los registros de los archivos de respaldo (se ejecuta en el hilo escritor)."""
+        self._last_replay = time.monotonic()
+        for replay_path in self._claim_spill_files():
+            try:
+                records = self._read_spill_file(replay_path)
+            except OSError:
+                logger.exception("No se pudo leer el respaldo de auditoría %s; se reintentará.", replay_path)
+                continue
+
+            persisted = True
+            for start in range(0, len(records), self.batch_size):
+                if not self._flush(records[start:start + self.batch_size]):
+                    # La base de datos sigue sin responder: el resto vuelve al respaldo
+                    self._spill(records[start + self.batch_size:])
+                    persisted = False
+                    break
+
+            # Se borra una vez persistido o devuelto al respaldo: una caída en medio
+            # repite registros en el siguiente reintento en lugar de perderlos
+            try:
+                os.remove(replay_path)
+            except OSError:
+                logger.exception("No se pudo borrar el respaldo de auditoría ya reintentado %s.", replay_path)
+            if not persisted:
+                # Los demás archivos reclamados quedan para el siguiente reintento
+                return
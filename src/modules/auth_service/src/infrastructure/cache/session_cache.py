@@ -0,0 +1,69 @@
+import hashlib
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from src.shared.common.cache import TTLCache
+from src.shared.config import settings
+
+
+class SessionCache:
+    """
+    Caché de sesiones verificadas para `AuthUseCase.verify_token`.
+
+    Guarda el diccionario de usuario ya construido indexado por el hash SHA-256
+    del token (nunca el token en claro). La caché es por proceso: con varios
+    workers, el TTL acota el tiempo que una sesión revocada en otro proceso
+    puede seguir siendo aceptada.
+    """
+
+    def __init__(self, ttl_seconds: float, max_size: int, revocation_ttl_seconds: float = 0):
+        self._cache = TTLCache(ttl_seconds=ttl_seconds, max_size=max_size)
+        # Resultado del chequeo de revocación usado por la autorización por claims
+        self._revocations = TTLCache(ttl_seconds=revocation_ttl_seconds, max_size=max_size)
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        return self._cache.get(self._key(token))
+
+    def set(self, token: str, user_data: Dict[str, Any], expires_at: Optional[datetime] = None) -> None:
+        """Guarda la sesión sin sobrepasar la fecha de expiración del token."""
+        ttl = None
+        if expires_at:
+            ttl = (expires_at - datetime.now()).total_seconds()
+        self._cache.set(self._key(token), user_data, ttl=ttl)
+
+    def get_revocation(self, token: str) -> Optional[Dict[str, Any]]:
+        return self._revocations.get(self._key(token))
+
+    def set_revocation(self, token: str, estado: Dict[str, Any], expires_at: Optional[datetime] = None) -> None:
+        """Guarda el estado de la sesión ({"user_id", "rol": {"id"}, "valid"})"""
+        ttl = None
+        if expires_at:
+            ttl = (expires_at - datetime.now()).total_seconds()
+        self._revocations.set(self._key(token), estado, ttl=ttl)
+
+    def invalidate_token(self, token: str) -> None:
+        self._cache.delete(self._key(token))
+        self._revocations.delete(self._key(token))
+
+    def invalidate_user(self, user_id: int) -> None:
+        for cache in (self._cache, self._revocations):
+            cache.delete_where(lambda _, data: data.get("user_id") == user_id)
+
+    def invalidate_rol(self, rol_id: int) -> None:
+        for cache in (self._cache, self._revocations):
+            cache.delete_where(lambda _, data: (data.get("rol") or {}).get("id") == rol_id)
+
+    def clear(self) -> None:
+        self._cache.clear()
+        self._revocations.clear()
+
+
+session_cache = SessionCache(
+    ttl_seconds=settings.AUTH_SESSION_CACHE_TTL_SECONDS,
+    max_size=settings.AUTH_SESSION_CACHE_MAX_SIZE,
+    revocation_ttl_seconds=settings.AUTH_REVOCATION_CACHE_TTL_SECONDS,
+)
@@ -0,0 +1,44 @@
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from src.shared.common.cache import TTLCache
+from src.shared.config import settings
+
+
+class UserSnapshotCache:
+    """
+    Caché del snapshot JSON del usuario que usa la auditoría (`ejecutado_por_json`).
+
+    Cada entrada guarda el `updated_at` del usuario con el que se construyó: si
+    el usuario cambia, la versión deja de coincidir y el snapshot se reconstruye.
+    Los cambios de rol y de líneas/turnos asignados no tocan `updated_at`, por
+    eso sus casos de uso invalidan explícitamente.
+    """
+
+    def __init__(self, ttl_seconds: float, max_size: int):
+        self._cache = TTLCache(ttl_seconds=ttl_seconds, max_size=max_size)
+
+    def get(self, user_id: int, updated_at: Optional[datetime]) -> Optional[Dict[str, Any]]:
+        item = self._cache.get(user_id)
+        if item is None:
+            return None
+        version, snapshot = item
+        return snapshot if version == updated_at else None
+
+    def set(self, user_id: int, updated_at: Optional[datetime], snapshot: Dict[str, Any]) -> None:
+        self._cache.set(user_id, (updated_at, snapshot))
+
+    def invalidate_user(self, user_id: int) -> None:
+        self._cache.delete(user_id)
+
+    def invalidate_rol(self, rol_id: int) -> None:
+        self._cache.delete_where(lambda _, item: (item[1].get("rol") or {}).get("id_rol") == rol_id)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+user_snapshot_cache = UserSnapshotCache(
+    ttl_seconds=settings.USER_SNAPSHOT_CACHE_TTL_SECONDS,
+    max_size=settings.USER_SNAPSHOT_CACHE_MAX_SIZE,
+)
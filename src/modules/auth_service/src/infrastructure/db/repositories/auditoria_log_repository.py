@@ -1,10 +1,12 @@
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import func, cast, Date
+from sqlalchemy import func, cast, Date, insert
 from typing import Dict, Any, List, Tuple
 from src.modules.auth_service.src.application.ports.auditoria_log_repository import IAuditoriaLogRepository
 from src.modules.auth_service.src.infrastructure.api.schemas.auditoria import AuditoriaLogFilters
 from src.modules.auth_service.src.infrastructure.db.models import AuditoriaLogORM
+from src.shared.common.count_cache import count_cache
+from src.shared.common.pagination import paginate
 from src.shared.exceptions import RepositoryError
 
 class AuditoriaLogRepository(IAuditoriaLogRepository):
@@ -21,6 +23,7 @@ class AuditoriaLogRepository(IAuditoriaLogRepository):
             db_log = AuditoriaLogORM(**log_data)
             self.db.add(db_log)
             self.db.commit()
+            count_cache.invalidate(AuditoriaLogORM.__tablename__)
             return True
         except SQLAlchemyError as e:
             self.db.rollback()
@@ -31,13 +34,15 @@ class AuditoriaLogRepository(IAuditoriaLogRepository):
 
     def create_logs_batch(self, logs_data: list[dict]) -> bool:
         """
-        Inserta múltiples registros de auditoría en un solo commit.
+        Inserta múltiples registros de auditoría en un solo commit
+        (INSERT multi-fila, sin instanciar objetos ORM).
         """
+        if not logs_data:
+            return True
         try:
-            logs = [AuditoriaLogORM(**log) for log in logs_data]
-
-            self.db.bulk_save_objects(logs)
+            self.db.execute(insert(AuditoriaLogORM), logs_data)
             self.db.commit()
+            count_cache.invalidate(AuditoriaLogORM.__tablename__)
 
             return True
 
@@ -69,32 +74,41 @@ class AuditoriaLogRepository(IAuditoriaLogRepository):
             return query.scalar() or 0
         except SQLAlchemyError as e:
             raise RepositoryError("Error al contar los logs de auditoría.") from e
+
+    def _count_cache_filters(self, filters: AuditoriaLogFilters) -> Dict[str, Any]:
+        return filters.model_dump(include=set(AuditoriaLogFilters.model_fields))
+
+    def count_by_filters_cached(self, filters: AuditoriaLogFilters) -> Tuple[int, bool]:
+        """Igual que count_by_filters, pero reutiliza el total de la caché de conteos si existe."""
+        cache_filters = self._count_cache_filters(filters)
+        cached_total = count_cache.get(AuditoriaLogORM.__tablename__, cache_filters)
+        if cached_total is not None:
+            return cached_total, False
+
+        total_records = self.count_by_filters(filters)
+        count_cache.set(AuditoriaLogORM.__tablename__, cache_filters, total_records)
+        return total_records, True
         
     def get_paginated_by_filters(
         self, filters: AuditoriaLogFilters, page: int, page_size: int
-    ) -> Tuple[List[AuditoriaLogORM], int]:
-        """Obtiene logs paginados según filtros y devuelve ORMs y conteo."""
+    ) -> Tuple[List[AuditoriaLogORM], int, bool]:
+        """Obtiene logs paginados según filtros y devuelve ORMs, conteo y si el conteo es exacto."""
+        cache_filters = self._count_cache_filters(filters)
+        cached_total = count_cache.get(AuditoriaLogORM.__tablename__, cache_filters)
         try:
-            # 1. Obtener conteo total
-            total_records = self.count_by_filters(filters)
-            
-            if total_records == 0:
-                return [], 0
-                
-            # 2. Obtener datos paginados
             query = self.db.query(AuditoriaLogORM)
             query = self._apply_filters(query, filters)
             
             # Ordenar (ej. por fecha descendente)
             query = query.order_by(AuditoriaLogORM.fecha.desc())
             
-            # Paginación
-            offset = (page - 1) * page_size
-            query = query.limit(page_size).offset(offset)
-            
-            orm_list = query.all()
-            
-            return orm_list, total_records
+            # Datos paginados y conteo total en una sola consulta (o solo datos si el total está en caché)
+            orm_list, total_records = paginate(query, page, page_size, with_total=cached_total is None)
+            if cached_total is not None:
+                return orm_list, cached_total, False
+
+            count_cache.set(AuditoriaLogORM.__tablename__, cache_filters, total_records)
+            return orm_list, total_records, True
             
         except SQLAlchemyError as e:
             raise RepositoryError("Error al obtener logs de auditoría paginados.") from e
\ No newline at end of file
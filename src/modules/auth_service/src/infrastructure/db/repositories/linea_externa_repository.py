@@ -9,6 +9,7 @@ from src.modules.auth_service.src.domain.entities import LineaExterna
 # Importa el modelo ORM de la DB externa
 from src.modules.auth_service.src.infrastructure.db.models import LineaORM 
 
+from src.shared.common.reference_cache import reference_cache, LINEAS
 from src.shared.exceptions import RepositoryError
 
 class LineaExternaRepository(ILineaExternaRepository):
@@ -16,6 +17,10 @@ class LineaExternaRepository(ILineaExternaRepository):
     def __init__(self, db: Session):
         self.db = db
 
+    def get_all_active(self) -> List[LineaExterna]:
+        """Líneas activas desde la caché de referencia (la invalida LineaUseCase)."""
+        return list(reference_cache.get_or_load(LINEAS, "externas_activas", self._get_all_active))
+
     def _get_orm_by_id(self, id_linea: int) -> Optional[LineaORM]:
         """Helper para obtener el modelo ORM crudo"""
         try:
@@ -60,7 +65,7 @@ class LineaExternaRepository(ILineaExternaRepository):
             return linea_encontrada is not None
         except SQLAlchemyError as e:
             raise RepositoryError(f"Error al verificar línea externa con id={id_linea}") from e
-    def get_all_active(self) -> List[LineaExterna]:
+    def _get_all_active(self) -> List[LineaExterna]:
         """
         Obtiene todas las líneas de trabajo externas que están activas,
         ordenadas por nombre.
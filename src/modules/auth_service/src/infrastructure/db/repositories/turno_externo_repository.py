@@ -10,6 +10,7 @@ from src.modules.auth_service.src.domain.entities import TurnoExterno
 from src.modules.auth_service.src.infrastructure.db.models import TurnoORM
 # (Ajusta la ruta a TurnoORM si es diferente)
 
+from src.shared.common.reference_cache import reference_cache, TURNOS
 from src.shared.exceptions import RepositoryError
 
 class TurnoExternaRepository(ITurnoExternaRepository):
@@ -18,6 +19,10 @@ class TurnoExternaRepository(ITurnoExternaRepository):
         # ¡Importante! Esta 'db' es la sesión de la DB externa (main)
         self.db = db
 
+    def get_all_active(self) -> List[TurnoExterno]:
+        """Turnos activos desde la caché de referencia (solo expiran por TTL)."""
+        return list(reference_cache.get_or_load(TURNOS, "externos_activos", self._get_all_active))
+
     def get_by_id(self, id_turno: int) -> Optional[TurnoExterno]:
         """
         Busca un turno por ID y lo mapea a la entidad de dominio.
@@ -58,7 +63,7 @@ class TurnoExternaRepository(ITurnoExternaRepository):
         except SQLAlchemyError as e:
             raise RepositoryError(f"Error al verificar turno externo con id={id_turno}") from e
 
-    def get_all_active(self) -> List[TurnoExterno]:
+    def _get_all_active(self) -> List[TurnoExterno]:
         """
         Obtiene todos los turnos externos que están activos, ordenados por nombre.
         """
@@ -47,6 +47,16 @@ class UsuarioRepository(IUsuarioRepository):
         except SQLAlchemyError as e:
             raise RepositoryError("Error al consultar el usuario.") from e
 
+    def get_updated_at(self, usuario_id: int) -> Optional[datetime]:
+        try:
+            return (
+                self.db.query(Usuario.updated_at)
+                .filter(Usuario.id_usuario == usuario_id)
+                .scalar()
+            )
+        except SQLAlchemyError as e:
+            raise RepositoryError("Error al consultar el usuario.") from e
+
     def get_by_username(self, username: str) -> Optional[Usuario]:
         try:
             return (
@@ -5,6 +5,7 @@ Middleware de autorización para el servicio de autenticación
 from .auth_middleware import (
     AuthMiddleware,
     auth_middleware,
+    get_token_claims,
     get_current_user,
     get_optional_user,
     require_module_access,
@@ -33,7 +34,7 @@ from .exceptions import (
     SessionInvalidException
 )
 
-from .jwt_utils import JWTUtils
+from .jwt_utils import JWTUtils, TokenClaims
 
 from .exception_handlers import register_auth_exception_handlers
 
@@ -43,6 +44,7 @@ __all__ = [
     'auth_middleware',
     
     # Dependencias de FastAPI
+    'get_token_claims',
     'get_current_user',
     'get_optional_user',
     'require_module_access',
@@ -70,6 +72,7 @@ __all__ = [
     
     # Utilidades JWT
     'JWTUtils',
+    'TokenClaims',
     
     # Manejadores de excepciones
     'register_auth_exception_handlers'
@@ -1,22 +1,33 @@
 """
 Middleware de autorización para verificar permisos y módulos
 """
-from typing import Optional, List
+from datetime import datetime
+from typing import Optional, List, Dict, Any
 from fastapi import Request, Depends
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy import select, func
 from sqlalchemy.orm import Session
 
 from src.shared.base import get_auth_db
-from src.modules.auth_service.src.infrastructure.db.models import Usuario, SesionUsuario
+from src.shared.config import settings
+from src.shared.database import SessionLocalAuth
+from src.modules.auth_service.src.infrastructure.api.routers.auth import get_auth_use_case
+from src.modules.auth_service.src.infrastructure.cache.session_cache import session_cache
+from src.modules.auth_service.src.infrastructure.db.models import (
+    Usuario, SesionUsuario, Rol, PermisoModulo, UsuarioLineaAsignada, UsuarioTurnoAsignado
+)
 from src.modules.auth_service.src.domain.entities import ModuloEnum, PermisoEnum
+from src.modules.auth_service.src.domain.value_objects import PermisosBitmask
 from .exceptions import (
     TokenMissingException,
     TokenInvalidException,
+    TokenExpiredException,
     UserInactiveException,
     SessionInvalidException,
     InsufficientPermissionsException
 )
-from .jwt_utils import JWTUtils
+from .jwt_utils import JWTUtils, TokenClaims
 from .decorators import get_endpoint_requirements
 
 
@@ -26,8 +37,33 @@ class AuthMiddleware:
     def __init__(self):
         self.security = HTTPBearer(auto_error=False)
     
+    def get_token_claims(
+        self,
+        request: Request,
+        credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False))
+    ) -> TokenClaims:
+        """
+        Obtiene los claims del token, decodificado una única vez por request
+        
+        Args:
+            request: Request actual
+            credentials: Credenciales HTTP Bearer
+            
+        Returns:
+            Claims verificados del token
+            
+        Raises:
+            TokenMissingException: Si no se proporciona token
+            TokenInvalidException: Si el token es inválido
+            TokenExpiredException: Si el token ha expirado
+        """
+        if not credentials:
+            raise TokenMissingException()
+        return JWTUtils.get_request_claims(request, credentials.credentials)
+
     async def get_current_user(
         self,
+        request: Request,
         credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False)),
         db: Session = Depends(get_auth_db)
     ) -> Usuario:
@@ -35,6 +71,7 @@ class AuthMiddleware:
         Obtiene el usuario actual basado en el token JWT
         
         Args:
+            request: Request actual
             credentials: Credenciales HTTP Bearer
             db: Sesión de base de datos
             
@@ -47,12 +84,10 @@ class AuthMiddleware:
             UserInactiveException: Si el usuario está inactivo
             SessionInvalidException: Si la sesión es inválida
         """
-        if not credentials:
-            raise TokenMissingException()
-        
-        # Validar y decodificar token
-        user_id = JWTUtils.extract_user_id(credentials.credentials)
-        session_id = JWTUtils.extract_session_id(credentials.credentials)
+        # Validar y decodificar token (una sola vez por request)
+        claims = self.get_token_claims(request, credentials)
+        user_id = claims.user_id
+        session_id = claims.session_id
         
         # Buscar usuario en base de datos
         usuario = db.query(Usuario).filter(
@@ -80,7 +115,6 @@ class AuthMiddleware:
                 raise SessionInvalidException()
             
             # Verificar si la sesión es válida manualmente
-            from datetime import datetime
             if (not sesion.is_active or 
                 sesion.deleted_at is not None or
                 (sesion.fecha_expiracion and datetime.now() > sesion.fecha_expiracion)):
@@ -90,6 +124,7 @@ class AuthMiddleware:
     
     async def get_optional_user(
         self,
+        request: Request,
         credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False)),
         db: Session = Depends(get_auth_db)
     ) -> Optional[Usuario]:
@@ -97,6 +132,7 @@ class AuthMiddleware:
         Obtiene el usuario actual si está autenticado, None en caso contrario
         
         Args:
+            request: Request actual
             credentials: Credenciales HTTP Bearer
             db: Sesión de base de datos
             
@@ -104,8 +140,8 @@ class AuthMiddleware:
             Usuario autenticado o None
         """
         try:
-            return await self.get_current_user(credentials, db)
-        except (TokenMissingException, TokenInvalidException, UserInactiveException, SessionInvalidException):
+            return await self.get_current_user(request, credentials, db)
+        except (TokenMissingException, TokenInvalidException, TokenExpiredException, UserInactiveException, SessionInvalidException):
             return None
     
     def verify_permissions(
@@ -150,8 +186,172 @@ class AuthMiddleware:
         
         return False
     
+    def verify_claims_permissions(
+        self,
+        claims: TokenClaims,
+        required_module: Optional[ModuloEnum] = None,
+        required_permissions: Optional[List[PermisoEnum]] = None
+    ) -> bool:
+        """
+        Verifica los permisos usando únicamente el bitmask firmado del token
+        
+        Args:
+            claims: Claims verificados del token (deben incluir 'perms')
+            required_module: Módulo requerido
+            required_permissions: Lista de permisos requeridos
+            
+        Returns:
+            True si tiene los permisos, False en caso contrario
+        """
+        if not required_module:
+            return True
+        
+        bitmask = PermisosBitmask(claims.payload.get("perms", 0))
+        return bitmask.has(
+            required_module.value,
+            [p.value for p in required_permissions] if required_permissions else None
+        )
+    
+    def verify_user_data_permissions(
+        self,
+        user_data: Dict[str, Any],
+        required_module: Optional[ModuloEnum] = None,
+        required_permissions: Optional[List[PermisoEnum]] = None
+    ) -> bool:
+        """
+        Igual que verify_permissions, sobre los datos de usuario de
+        `AuthUseCase.verify_token` (rol.modulos), que ya están en la caché de sesiones
+        
+        Args:
+            user_data: Datos del usuario verificado
+            required_module: Módulo requerido
+            required_permissions: Lista de permisos requeridos
+            
+        Returns:
+            True si tiene los permisos, False en caso contrario
+        """
+        if not required_module:
+            return True
+        
+        for modulo_info in (user_data.get("rol") or {}).get("modulos", []):
+            if modulo_info["nombre"] == required_module.value:
+                if not required_permissions:
+                    return True
+                permisos_usuario = modulo_info.get("permisos", [])
+                return all(p.value in permisos_usuario for p in required_permissions)
+        
+        return False
+    
+    def check_revocation(self, claims: TokenClaims, db: Session) -> Dict[str, Any]:
+        """
+        Verifica que la sesión del token siga vigente y que sus permisos no hayan
+        cambiado desde que se emitió. El resultado se guarda en caché, por lo que
+        en el caso común no se consulta la base de datos.
+        
+        Args:
+            claims: Claims verificados del token
+            db: Sesión de base de datos
+            
+        Returns:
+            Estado de la sesión: datos del usuario vigentes y 'valid'
+            
+        Raises:
+            SessionInvalidException: Si la sesión fue revocada o sus permisos están desactualizados
+        """
+        estado = session_cache.get_revocation(claims.token)
+        if estado is None:
+            estado, expires_at = self._load_revocation_state(claims, db)
+            session_cache.set_revocation(claims.token, estado, expires_at=expires_at)
+        
+        if not estado["valid"]:
+            raise SessionInvalidException()
+        return estado
+    
+    def _check_revocation_with_own_session(self, claims: TokenClaims) -> Dict[str, Any]:
+        """check_revocation con una sesión propia (se ejecuta en el threadpool)"""
+        db = SessionLocalAuth()
+        try:
+            return self.check_revocation(claims, db)
+        finally:
+            db.close()
+    
+    def _verify_token_with_own_session(self, token: str) -> Optional[Dict[str, Any]]:
+        """AuthUseCase.verify_token con una sesión propia (se ejecuta en el threadpool)"""
+        db = SessionLocalAuth()
+        try:
+            return get_auth_use_case(db).verify_token(token)
+        finally:
+            db.close()
+    
+    def _load_revocation_state(self, claims: TokenClaims, db: Session) -> tuple[Dict[str, Any], Optional[datetime]]:
+        """
+        Consulta en una sola query el estado de la sesión, el usuario y el rol; si
+        la sesión es válida, también las líneas y turnos asignados vigentes. El
+        estado tiene la forma de los datos de `verify_token` (user_id, rol.id) para
+        que las invalidaciones por usuario y por rol de la caché lo alcancen.
+        """
+        permisos_updated_at = (
+            select(func.max(PermisoModulo.updated_at))
+            .where(PermisoModulo.id_rol == Rol.id_rol)
+            .correlate(Rol)
+            .scalar_subquery()
+        )
+        row = (
+            db.query(
+                SesionUsuario.fecha_expiracion,
+                Usuario.username,
+                Usuario.is_superuser,
+                Usuario.is_active.label("usuario_activo"),
+                Usuario.id_rol,
+                Rol.nombre.label("rol_nombre"),
+                Rol.is_active.label("rol_activo"),
+                Rol.updated_at.label("rol_updated_at"),
+                permisos_updated_at.label("permisos_updated_at"),
+            )
+            .join(Usuario, Usuario.id_usuario == SesionUsuario.id_usuario)
+            .join(Rol, Rol.id_rol == Usuario.id_rol)
+            .filter(
+                SesionUsuario.id_sesion == claims.session_id,
+                SesionUsuario.id_usuario == claims.user_id,
+                SesionUsuario.token == claims.token,
+                SesionUsuario.is_active == True,
+                SesionUsuario.deleted_at.is_(None),
+                Usuario.deleted_at.is_(None)
+            )
+            .first()
+        )
+        
+        estado = {"user_id": claims.user_id, "rol": {"id": claims.payload.get("rol_id")}, "valid": False}
+        if not row:
+            return estado, None
+        
+        version = PermisosBitmask.version([row.rol_updated_at, row.permisos_updated_at])
+        estado["valid"] = bool(
+            row.usuario_activo
+            and row.rol_activo
+            and row.id_rol == claims.payload.get("rol_id")
+            and version == claims.payload.get("pv")
+            and not (row.fecha_expiracion and datetime.now() > row.fecha_expiracion)
+        )
+        if estado["valid"]:
+            estado.update({
+                "username": row.username,
+                "is_superuser": row.is_superuser,
+                "rol": {"id": row.id_rol, "nombre": row.rol_nombre},
+                "lineas": [
+                    linea for (linea,) in db.query(UsuarioLineaAsignada.id_linea_externa)
+                    .filter(UsuarioLineaAsignada.id_usuario == claims.user_id)
+                ],
+                "turnos": [
+                    turno for (turno,) in db.query(UsuarioTurnoAsignado.id_turno_externo)
+                    .filter(UsuarioTurnoAsignado.id_usuario == claims.user_id)
+                ],
+            })
+        return estado, row.fecha_expiracion
+    
     async def require_authentication(
         self,
+        request: Request,
         credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False)),
         db: Session = Depends(get_auth_db)
     ) -> Usuario:
@@ -159,13 +359,14 @@ class AuthMiddleware:
         Dependencia que requiere autenticación
         
         Args:
+            request: Request actual
             credentials: Credenciales HTTP Bearer
             db: Sesión de base de datos
             
         Returns:
             Usuario autenticado
         """
-        return await self.get_current_user(credentials, db)
+        return await self.get_current_user(request, credentials, db)
     
     async def require_permissions_dependency(
         self,
@@ -202,22 +403,53 @@ class AuthMiddleware:
         """
         Crea una dependencia de FastAPI para verificar permisos
         
+        Con AUTH_PERMISSION_CLAIMS_ENABLED y un token con bitmask ('perms')
+        autoriza solo con el bitmask firmado y el chequeo de revocación en caché;
+        en otro caso usa la sesión verificada de `AuthUseCase.verify_token`
+        (también en caché). En el caso común no se consulta la base de datos.
+        
         Args:
             modulo: Módulo requerido
             permisos: Lista de permisos requeridos
             
         Returns:
-            Dependencia de FastAPI
+            Dependencia de FastAPI que devuelve los datos del usuario con la misma
+            forma que `get_current_user_data` (user_id, username, rol, lineas, turnos)
         """
         async def permission_dependency(
-            usuario: Usuario = Depends(self.require_authentication)
-        ) -> Usuario:
-            if not self.verify_permissions(usuario, modulo, permisos):
+            request: Request,
+            credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False))
+        ) -> Dict[str, Any]:
+            claims = self.get_token_claims(request, credentials)
+            
+            if settings.AUTH_PERMISSION_CLAIMS_ENABLED and "perms" in claims.payload:
+                estado = session_cache.get_revocation(claims.token)
+                if estado is None:
+                    estado = await run_in_threadpool(self._check_revocation_with_own_session, claims)
+                elif not estado["valid"]:
+                    raise SessionInvalidException()
+                
+                authorized = self.verify_claims_permissions(claims, modulo, permisos)
+                user_data = {key: value for key, value in estado.items() if key != "valid"}
+                user_data["rol"] = {
+                    **estado["rol"],
+                    "modulos": PermisosBitmask(claims.payload["perms"]).to_modulos(),
+                }
+            else:
+                # Flag desactivado o token emitido sin bitmask: permisos de la sesión verificada
+                user_data = session_cache.get(claims.token)
+                if user_data is None:
+                    user_data = await run_in_threadpool(self._verify_token_with_own_session, claims.token)
+                if not user_data:
+                    raise SessionInvalidException()
+                authorized = self.verify_user_data_permissions(user_data, modulo, permisos)
+            
+            if not authorized:
                 raise InsufficientPermissionsException(
                     modulo=modulo.value,
                     permiso=", ".join([p.value for p in permisos]) if permisos else None
                 )
-            return usuario
+            return user_data
         
         return permission_dependency
 
@@ -227,20 +459,30 @@ auth_middleware = AuthMiddleware()
 
 
 # Dependencias comunes
+def get_token_claims(
+    request: Request,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False))
+) -> TokenClaims:
+    """Dependencia para obtener los claims del token de la request"""
+    return auth_middleware.get_token_claims(request, credentials)
+
+
 async def get_current_user(
+    request: Request,
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False)),
     db: Session = Depends(get_auth_db)
 ) -> Usuario:
     """Dependencia para obtener el usuario actual"""
-    return await auth_middleware.get_current_user(credentials, db)
+    return await auth_middleware.get_current_user(request, credentials, db)
 
 
 async def get_optional_user(
+    request: Request,
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False)),
     db: Session = Depends(get_auth_db)
 ) -> Optional[Usuario]:
     """Dependencia para obtener el usuario actual opcional"""
-    return await auth_middleware.get_optional_user(credentials, db)
+    return await auth_middleware.get_optional_user(request, credentials, db)
 
 
 def require_module_access(modulo: ModuloEnum):
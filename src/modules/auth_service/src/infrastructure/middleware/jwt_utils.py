@@ -1,13 +1,60 @@
 """
 Utilidades para manejo y validación de tokens JWT
 """
+import hashlib
+import time
 import jwt
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
+from fastapi import Request
+from src.shared.common.cache import TTLCache
 from src.shared.config import settings
 from .exceptions import TokenInvalidException, TokenExpiredException
 
 
+# Payloads de tokens cuya firma ya fue verificada, indexados por digest del token.
+# Cada entrada vive como máximo hasta el 'exp' del token.
+_verified_tokens = TTLCache(
+    ttl_seconds=settings.JWT_VERIFIED_CACHE_TTL_SECONDS,
+    max_size=settings.JWT_VERIFIED_CACHE_MAX_SIZE,
+)
+
+
+@dataclass(frozen=True)
+class TokenClaims:
+    """Claims de un token ya decodificado y verificado, compartidos durante la request"""
+    token: str
+    payload: Dict[str, Any]
+
+    @property
+    def user_id(self) -> int:
+        user_id = self.payload.get('sub')
+        if not user_id:
+            raise TokenInvalidException("Token no contiene ID de usuario válido")
+        try:
+            return int(user_id)
+        except (ValueError, TypeError):
+            raise TokenInvalidException("ID de usuario inválido en token")
+
+    @property
+    def username(self) -> str:
+        username = self.payload.get('username')
+        if not username:
+            raise TokenInvalidException("Token no contiene username válido")
+        return username
+
+    @property
+    def session_id(self) -> Optional[int]:
+        session_id = self.payload.get('session_id')
+        if session_id:
+            try:
+                return int(session_id)
+            except (ValueError, TypeError):
+                return None
+        return None
+
+
 class JWTUtils:
     """Clase para manejo de tokens JWT"""
     
@@ -26,29 +73,48 @@ class JWTUtils:
             TokenInvalidException: Si el token es inválido
             TokenExpiredException: Si el token ha expirado
         """
+        # Remover el prefijo 'Bearer ' si está presente
+        if token.startswith('Bearer '):
+            token = token[7:]
+
+        digest = hashlib.sha256(token.encode('utf-8')).digest()
+        payload = _verified_tokens.get(digest)
+        if payload is not None:
+            return payload
+
         try:
-            # Remover el prefijo 'Bearer ' si está presente
-            if token.startswith('Bearer '):
-                token = token[7:]
-            
-            # Decodificar el token
+            # Decodificar el token (PyJWT valida firma y 'exp')
             payload = jwt.decode(
                 token,
                 settings.JWT_SECRET_KEY,
                 algorithms=[settings.JWT_ALGORITHM]
             )
-            
-            # Verificar expiración
-            exp = payload.get('exp')
-            if exp and datetime.fromtimestamp(exp) < datetime.now():
-                raise TokenExpiredException()
-            
-            return payload
-            
         except jwt.ExpiredSignatureError:
             raise TokenExpiredException()
         except jwt.InvalidTokenError:
             raise TokenInvalidException()
+
+        exp = payload.get('exp')
+        _verified_tokens.set(digest, payload, ttl=exp - time.time() if exp else None)
+        return payload
+
+    @staticmethod
+    def get_request_claims(request: Request, token: str) -> TokenClaims:
+        """
+        Decodifica el token una sola vez por request y reutiliza el resultado
+        
+        Args:
+            request: Request actual
+            token: Token JWT
+            
+        Returns:
+            TokenClaims guardado en request.state
+        """
+        claims = getattr(request.state, 'token_claims', None)
+        if claims is None or claims.token != token:
+            claims = TokenClaims(token=token, payload=JWTUtils.decode_token(token))
+            request.state.token_claims = claims
+        return claims
     
     @staticmethod
     def extract_user_id(token: str) -> int:
@@ -61,16 +127,7 @@ class JWTUtils:
         Returns:
             ID del usuario
         """
-        payload = JWTUtils.decode_token(token)
-        user_id = payload.get('sub')
-        
-        if not user_id:
-            raise TokenInvalidException("Token no contiene ID de usuario válido")
-        
-        try:
-            return int(user_id)
-        except (ValueError, TypeError):
-            raise TokenInvalidException("ID de usuario inválido en token")
+        return TokenClaims(token=token, payload=JWTUtils.decode_token(token)).user_id
     
     @staticmethod
     def extract_username(token: str) -> str:
@@ -83,13 +140,7 @@ class JWTUtils:
         Returns:
             Username del usuario
         """
-        payload = JWTUtils.decode_token(token)
-        username = payload.get('username')
-        
-        if not username:
-            raise TokenInvalidException("Token no contiene username válido")
-        
-        return username
+        return TokenClaims(token=token, payload=JWTUtils.decode_token(token)).username
     
     @staticmethod
     def extract_session_id(token: str) -> Optional[int]:
@@ -102,16 +153,7 @@ class JWTUtils:
         Returns:
             ID de sesión o None si no está presente
         """
-        payload = JWTUtils.decode_token(token)
-        session_id = payload.get('session_id')
-        
-        if session_id:
-            try:
-                return int(session_id)
-            except (ValueError, TypeError):
-                return None
-        
-        return None
+        return TokenClaims(token=token, payload=JWTUtils.decode_token(token)).session_id
     
     @staticmethod
     def is_token_valid(token: str) -> bool:
@@ -1,10 +1,10 @@
 from abc import abstractmethod, ABC
-from typing import List, Tuple, Optional
+from typing import Any, AsyncIterator, Dict, List, Tuple, Optional
 
 from src.modules.lineas_entrada_salida_service.src.domain.entities import LineasEntrada
 from src.modules.lineas_entrada_salida_service.src.infrastructure.api.schemas.lineas_entrada import LineasEntradaUpdate
 from src.modules.lineas_entrada_salida_service.src.infrastructure.api.schemas.lineas_shared import \
-    LineasFilters
+    LineasFilters, LineasExportFilters, LineasExtractFilters
 
 
 class ILineasEntradaRepository(ABC):
@@ -26,4 +26,51 @@ class ILineasEntradaRepository(ABC):
 
     @abstractmethod
     def update_codigo_parrilla(self, linea_id: int, linea_num: int, valor_parrilla: str, valor_secuencia: str) -> Optional[LineasEntrada]:
-        pass
\ No newline at end of file
+        pass
+
+
+class IAsyncLineasEntradaRepository(ABC):
+    """Puerto de solo lectura sobre AsyncSession para los endpoints de consulta."""
+
+    @abstractmethod
+    async def count_by_filters(self, filters: LineasFilters, linea_num: int) -> int:
+        pass
+
+    @abstractmethod
+    async def get_paginated_by_filters(self, filters: LineasFilters, page: int, page_size: int, linea_num: int,
+                                       include_total: bool = True) -> Tuple[List[LineasEntrada], Optional[int], bool]:
+        """Página, total (None si include_total=False) y si el total es exacto o viene de la caché."""
+        pass
+
+    @abstractmethod
+    async def count_by_filters_cached(self, filters: LineasFilters, linea_num: int) -> Tuple[int, bool]:
+        """Total y si es exacto (False cuando proviene de la caché de conteos)."""
+        pass
+
+    @abstractmethod
+    async def get_page_by_cursor(self, filters: LineasFilters, page_size: int, linea_num: int, cursor: Optional[str]) -> Tuple[
+        List[LineasEntrada], Optional[str]]:
+        """Página ordenada por (fecha_p, id) descendente y el cursor de la siguiente (None si no hay más)."""
+        pass
+
+    @abstractmethod
+    async def get_paginated_multi_linea(self, filters: LineasFilters, lineas: List[int], page: int, page_size: int,
+                                        include_total: bool = True) -> Tuple[List[LineasEntrada], Optional[int]]:
+        pass
+
+    @abstractmethod
+    async def get_aggregates(self, filters: LineasFilters, lineas: List[int], group_by: List[str]) -> List[Dict[str, Any]]:
+        """Una fila por grupo con registros, peso_total_kg y peso_promedio_kg."""
+        pass
+
+    @abstractmethod
+    def stream_by_filters(self, filters: LineasExportFilters, linea_num: int,
+                          batch_size: int) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Generador async de lotes de filas para exportación."""
+        pass
+
+    @abstractmethod
+    def stream_extract(self, filters: LineasExtractFilters,
+                       batch_size: int) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Generador async de lotes grandes para la extracción columnar."""
+        pass
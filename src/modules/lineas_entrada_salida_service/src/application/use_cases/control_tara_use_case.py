@@ -4,6 +4,7 @@ from src.modules.auth_service.src.application.use_cases.audit_use_case import Au
 from src.modules.lineas_entrada_salida_service.src.application.ports.control_tara import IControlTaraRepository
 from src.modules.lineas_entrada_salida_service.src.infrastructure.api.schemas.control_tara import TaraCreate, TaraResponse
 from src.modules.lineas_entrada_salida_service.src.domain.entities import ControlTara
+from src.shared.common.reference_cache import reference_cache, TARAS
 from src.shared.exceptions import AlreadyExistsError, ValidationError
 
 
@@ -22,6 +23,7 @@ class ControlTaraUseCase:
         if tara_data.peso_kg <= 0:
             raise ValidationError("El peso de la tara debe ser mayor a cero")
         nueva_tara = self.control_tara_repository.create(tara_data)
+        reference_cache.invalidate(TARAS)
         self.audit_use_case.log_action(
             accion="CREATE",
             user_id=user_data.get("user_id"),
@@ -47,4 +49,6 @@ class ControlTaraUseCase:
             entidad_id=tara_id,
             datos_anteriores=datos_anteriores
         )
-        return  self.control_tara_repository.soft_delete(tara_id)
\ No newline at end of file
+        eliminado = self.control_tara_repository.soft_delete(tara_id)
+        reference_cache.invalidate(TARAS)
+        return eliminado
\ No newline at end of file
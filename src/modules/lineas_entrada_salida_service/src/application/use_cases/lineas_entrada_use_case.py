@@ -1,13 +1,14 @@
 from math import ceil
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, AsyncIterator, List
 
 from src.modules.auth_service.src.application.use_cases.audit_use_case import AuditUseCase
-from src.modules.lineas_entrada_salida_service.src.application.ports.lineas_entrada import ILineasEntradaRepository
+from src.modules.lineas_entrada_salida_service.src.application.ports.lineas_entrada import ILineasEntradaRepository, \
+    IAsyncLineasEntradaRepository
 from src.modules.lineas_entrada_salida_service.src.domain.entities import LineasEntrada
 from src.modules.lineas_entrada_salida_service.src.infrastructure.api.schemas.lineas_entrada import \
-    LineasEntradaPaginatedResponse, LineasEntradaUpdate, LineasEntradaResponse
+    LineasEntradaPaginatedResponse, LineasEntradaUpdate, LineasEntradaResponse, LineasEntradaAgregadoRequest
 from src.modules.lineas_entrada_salida_service.src.infrastructure.api.schemas.lineas_shared import \
-    LineasPagination
+    LineasPagination, LineasMultiPagination, LineasFilters, LineasExportFilters, LineasExtractFilters
 from src.shared.exceptions import NotFoundError, ValidationError
 
 
@@ -96,4 +97,99 @@ class LineasEntradaUseCase:
             datos_nuevos=LineasEntradaResponse.model_validate(updated).model_dump(mode="json"),
             datos_anteriores=LineasEntradaResponse.model_validate(linea).model_dump(mode="json")
         )
-        return updated
\ No newline at end of file
+        return updated
+
+
+class AsyncLineasEntradaUseCase:
+    """Consultas de solo lectura sobre AsyncSession (endpoints de alta concurrencia)."""
+
+    def __init__(self, lineas_entrada_repository: IAsyncLineasEntradaRepository):
+        self.lineas_entrada_repository = lineas_entrada_repository
+
+    async def get_lineas_entrada_paginated_by_filters(self, filters: LineasPagination, linea_num: int) -> LineasEntradaPaginatedResponse:
+        if filters.cursor_mode:
+            data, next_cursor = await self.lineas_entrada_repository.get_page_by_cursor(
+                filters=filters,
+                page_size=filters.page_size,
+                linea_num=linea_num,
+                cursor=filters.cursor
+            )
+            # En modo cursor no se cuenta el total: cada página cuesta lo mismo sin importar la profundidad
+            return {
+                "total_records": None,
+                "total_pages": None,
+                "page": None,
+                "page_size": filters.page_size,
+                "next_cursor": next_cursor,
+                "data": data
+            }
+
+        data, total_records, total_is_exact = await self.lineas_entrada_repository.get_paginated_by_filters(
+            filters=filters,
+            page=filters.page,
+            page_size=filters.page_size,
+            linea_num=linea_num,
+            include_total=filters.include_total
+        )
+
+        total_pages = None
+        if total_records is not None:
+            total_pages = ceil(total_records / filters.page_size) if total_records > 0 else 0
+
+        return {
+            "total_records": total_records,
+            "total_pages": total_pages,
+            "page": filters.page,
+            "page_size": filters.page_size,
+            "total_is_exact": total_is_exact if total_records is not None else None,
+            "data": data
+        }
+
+    async def get_lineas_entrada_multi_linea_paginated(self, filters: LineasMultiPagination) -> Dict[str, Any]:
+        data, total_records = await self.lineas_entrada_repository.get_paginated_multi_linea(
+            filters=filters,
+            lineas=filters.lineas,
+            page=filters.page,
+            page_size=filters.page_size,
+            include_total=filters.include_total
+        )
+
+        total_pages = None
+        if total_records is not None:
+            total_pages = ceil(total_records / filters.page_size) if total_records > 0 else 0
+
+        return {
+            "total_records": total_records,
+            "total_pages": total_pages,
+            "page": filters.page,
+            "page_size": filters.page_size,
+            "lineas": sorted(set(filters.lineas)),
+            "data": data
+        }
+
+    async def get_agregados_lineas_entrada(self, filters: LineasEntradaAgregadoRequest) -> Dict[str, Any]:
+        # dict.fromkeys conserva el orden pedido y descarta dimensiones repetidas
+        group_by = list(dict.fromkeys(filters.group_by))
+        lineas = sorted(set(filters.lineas))
+
+        rows = await self.lineas_entrada_repository.get_aggregates(filters, lineas, group_by)
+        for row in rows:
+            if row["peso_total_kg"] is not None:
+                row["peso_total_kg"] = round(row["peso_total_kg"], 3)
+            if row["peso_promedio_kg"] is not None:
+                row["peso_promedio_kg"] = round(row["peso_promedio_kg"], 3)
+
+        return {
+            "lineas": lineas,
+            "group_by": group_by,
+            "total_grupos": len(rows),
+            "data": rows
+        }
+
+    def stream_lineas_entrada(self, filters: LineasExportFilters, linea_num: int,
+                             batch_size: int) -> AsyncIterator[List[Dict[str, Any]]]:
+        return self.lineas_entrada_repository.stream_by_filters(filters, linea_num, batch_size)
+
+    def stream_extract_lineas_entrada(self, filters: LineasExtractFilters,
+                                     batch_size: int) -> AsyncIterator[List[Dict[str, Any]]]:
+        return self.lineas_entrada_repository.stream_extract(filters, batch_size)
@@ -1,15 +1,16 @@
 from decimal import Decimal, ROUND_HALF_UP
 from math import ceil
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, AsyncIterator, List, Tuple
 
 from src.modules.auth_service.src.application.use_cases.audit_use_case import AuditUseCase
 from src.modules.lineas_entrada_salida_service.src.application.ports.control_tara import IControlTaraRepository
-from src.modules.lineas_entrada_salida_service.src.application.ports.lineas_salida import ILineasSalidaRepository
+from src.modules.lineas_entrada_salida_service.src.application.ports.lineas_salida import ILineasSalidaRepository, \
+    IAsyncLineasSalidaRepository
 from src.modules.lineas_entrada_salida_service.src.domain.entities import LineasSalida
 from src.modules.lineas_entrada_salida_service.src.infrastructure.api.schemas.lineas_shared import LineasPagination, \
-    LineasFilters
+    LineasFilters, LineasMultiPagination, LineasExportFilters, LineasExtractFilters
 from src.modules.lineas_entrada_salida_service.src.infrastructure.api.schemas.lineas_salida import \
-    LineasSalidaPaginatedResponse, LineasSalidaUpdate, LineasSalidaResponse, PanzaRequest
+    LineasSalidaPaginatedResponse, LineasSalidaUpdate, LineasSalidaResponse, PanzaRequest, LineasSalidaAgregadoRequest
 from src.shared.exceptions import NotFoundError, ValidationError
 
 
@@ -149,43 +150,24 @@ class LineasSalidaUseCase:
         if data.peso_kg <= 0:
             raise ValidationError("El peso debe ser mayor que cero.")
 
-        # Obtener registros
-        lineas = self.lineas_salida_repository.get_all_by_filters(
+        # Un solo UPDATE sobre el lote; el peso anterior llega con cada fila actualizada
+        actualizaciones = self.lineas_salida_repository.agregar_panza_por_filtros(
             filters=LineasFilters(fecha=data.fecha, lote=data.lote),
-            linea_num=linea_num
+            linea_num=linea_num,
+            peso_kg=data.peso_kg
         )
-        if not lineas:
+        if not actualizaciones:
             raise NotFoundError("No se encontraron registros con los filtros proporcionados.")
 
-        peso_panza_dec = Decimal(str(data.peso_kg))
-
-        items_para_actualizar = []
-        datos_anteriores = {}
-
-        for linea in lineas:
-            peso_dec = Decimal(str(linea.peso_kg))
-            nuevo_peso = float(
-                (peso_dec + peso_panza_dec).quantize(Decimal("0.001"), rounding=ROUND_HALF_UP)
-            )
-
-            datos_anteriores[linea.id] = LineasSalidaResponse.model_validate(linea).model_dump(mode="json")
-
-            items_para_actualizar.append({
-                "linea_id": linea.id,
-                "linea_num": linea_num,
-                "nuevo_peso": nuevo_peso
-            })
-
-        lineas_actualizadas = self.lineas_salida_repository.agregar_panzas(items_para_actualizar)
-
         logs_batch = []
-        for updated_linea in lineas_actualizadas:
+        for peso_anterior, updated_linea in actualizaciones:
+            datos_nuevos = LineasSalidaResponse.model_validate(updated_linea).model_dump(mode="json")
             logs_batch.append({
                 "accion": "UPDATE",
                 "modelo": self._modelo_auditoria(linea_num),
                 "entidad_id": updated_linea.id,
-                "datos_nuevos": LineasSalidaResponse.model_validate(updated_linea).model_dump(mode="json"),
-                "datos_anteriores": datos_anteriores.get(updated_linea.id)
+                "datos_nuevos": datos_nuevos,
+                "datos_anteriores": {**datos_nuevos, "peso_kg": peso_anterior}
             })
 
         self.audit_use_case.log_actions_batch(
@@ -193,6 +175,104 @@ class LineasSalidaUseCase:
             user_id=user_data.get("user_id")
         )
 
-        return len(lineas_actualizadas)
+        return len(actualizaciones)
+
+
+class AsyncLineasSalidaUseCase:
+    """Consultas de solo lectura sobre AsyncSession (endpoints de alta concurrencia)."""
+
+    def __init__(self, lineas_salida_repository: IAsyncLineasSalidaRepository):
+        self.lineas_salida_repository = lineas_salida_repository
+
+    async def get_lineas_salida_paginated_by_filters(self, filters: LineasPagination,
+                                                     linea_num: int) -> LineasSalidaPaginatedResponse:
+        if filters.cursor_mode:
+            data, next_cursor = await self.lineas_salida_repository.get_page_by_cursor(
+                filters=filters,
+                page_size=filters.page_size,
+                linea_num=linea_num,
+                cursor=filters.cursor
+            )
+            # En modo cursor no se cuenta el total: cada página cuesta lo mismo sin importar la profundidad
+            return {
+                "total_records": None,
+                "total_pages": None,
+                "page": None,
+                "page_size": filters.page_size,
+                "next_cursor": next_cursor,
+                "data": data
+            }
+
+        data, total_records, total_is_exact = await self.lineas_salida_repository.get_paginated_by_filters(
+            filters=filters,
+            page=filters.page,
+            page_size=filters.page_size,
+            linea_num=linea_num,
+            include_total=filters.include_total
+        )
+
+        total_pages = None
+        if total_records is not None:
+            total_pages = ceil(total_records / filters.page_size) if total_records > 0 else 0
+
+        return {
+            "total_records": total_records,
+            "total_pages": total_pages,
+            "page": filters.page,
+            "page_size": filters.page_size,
+            "total_is_exact": total_is_exact if total_records is not None else None,
+            "data": data
+        }
+
+    async def get_lineas_salida_multi_linea_paginated(self, filters: LineasMultiPagination) -> Dict[str, Any]:
+        data, total_records = await self.lineas_salida_repository.get_paginated_multi_linea(
+            filters=filters,
+            lineas=filters.lineas,
+            page=filters.page,
+            page_size=filters.page_size,
+            include_total=filters.include_total
+        )
+
+        total_pages = None
+        if total_records is not None:
+            total_pages = ceil(total_records / filters.page_size) if total_records > 0 else 0
+
+        return {
+            "total_records": total_records,
+            "total_pages": total_pages,
+            "page": filters.page,
+            "page_size": filters.page_size,
+            "lineas": sorted(set(filters.lineas)),
+            "data": data
+        }
+
+    async def count_lineas_salida(self, filters: LineasFilters, linea_num: int) -> Tuple[int, bool]:
+        """Total de registros y si es exacto (False si proviene de la caché de conteos)."""
+        return await self.lineas_salida_repository.count_by_filters_cached(filters, linea_num)
+
+    async def get_agregados_lineas_salida(self, filters: LineasSalidaAgregadoRequest) -> Dict[str, Any]:
+        # dict.fromkeys conserva el orden pedido y descarta dimensiones repetidas
+        group_by = list(dict.fromkeys(filters.group_by))
+        lineas = sorted(set(filters.lineas))
+
+        rows = await self.lineas_salida_repository.get_aggregates(filters, lineas, group_by)
+        for row in rows:
+            if row["peso_total_kg"] is not None:
+                row["peso_total_kg"] = round(row["peso_total_kg"], 3)
+            if row["peso_promedio_kg"] is not None:
+                row["peso_promedio_kg"] = round(row["peso_promedio_kg"], 3)
+
+        return {
+            "lineas": lineas,
+            "group_by": group_by,
+            "total_grupos": len(rows),
+            "data": rows
+        }
 
+    def stream_lineas_salida(self, filters: LineasExportFilters, linea_num: int,
+                             batch_size: int) -> AsyncIterator[List[Dict[str, Any]]]:
+        return self.lineas_salida_repository.stream_by_filters(filters, linea_num, batch_size)
 
+    def stream_extract_lineas_salida(self, filters: LineasExtractFilters,
+                                     batch_size: int) -> AsyncIterator[List[Dict[str, Any]]]:
+        return self.lineas_salida_repository.stream_extract(filters, batch_size)
@@ -14,6 +14,8 @@ class LineasEntrada:
     p_lote: Optional[str]
     hora_inicio: Optional[time]
     guid: Optional[str]
+    # Solo en consultas multilínea: línea de origen del registro
+    linea_num: Optional[int] = None
 
 @dataclass
 class LineasSalida:
@@ -26,6 +28,8 @@ class LineasSalida:
     codigo_parrilla: Optional[str]
     codigo_obrero: Optional[str]
     guid: Optional[str]
+    # Solo en consultas multilínea: línea de origen del registro
+    linea_num: Optional[int] = None
 
 @dataclass
 class ControlTara:
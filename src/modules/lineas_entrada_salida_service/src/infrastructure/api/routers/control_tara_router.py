@@ -1,6 +1,6 @@
 from typing import Dict, Any
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Request, status
 from fastapi.params import Depends
 from sqlalchemy.orm import Session
 
@@ -10,6 +10,8 @@ from src.modules.lineas_entrada_salida_service.src.infrastructure.api.schemas.co
 from src.modules.lineas_entrada_salida_service.src.infrastructure.db.repositories.control_tara import ControlTaraRepository
 from src.shared.base import get_auth_db
 from src.shared.common.auditoria import get_audit_use_case
+from src.shared.common.http_cache import cached_success_response
+from src.shared.common.reference_cache import TARAS
 from src.shared.common.responses import success_response, error_response
 from src.shared.security import get_current_user_data
 
@@ -26,10 +28,12 @@ def get_tara_use_case(db: Session = Depends(get_auth_db),
 
 @router.get("/", status_code=status.HTTP_200_OK)
 def get_all_taras(
+        request: Request,
         use_case: ControlTaraUseCase = Depends(get_tara_use_case)
 ):
-    return success_response(
-        data=use_case.get_all_taras(),
+    return cached_success_response(
+        request, TARAS, "activas",
+        use_case.get_all_taras,
         message="Taras obtenidas"
     )
 
@@ -1,21 +1,30 @@
-from typing import Dict, Any
+from typing import Dict, Any, Literal
 
-from fastapi import APIRouter, Depends, status, Path
+from fastapi import APIRouter, Depends, status, Path, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from src.modules.auth_service.src.application.use_cases.audit_use_case import AuditUseCase
 from src.modules.lineas_entrada_salida_service.src.application.use_cases.lineas_entrada_use_case import \
-    LineasEntradaUseCase
+    LineasEntradaUseCase, AsyncLineasEntradaUseCase
 from src.modules.lineas_entrada_salida_service.src.infrastructure.api.schemas.lineas_entrada import \
-    LineasEntradaResponse, LineasEntradaUpdate
-from src.modules.lineas_entrada_salida_service.src.infrastructure.api.schemas.lineas_shared import LineasPagination, UpdateCodigoParrillaRequest
+    LineasEntradaResponse, LineasEntradaUpdate, LineasEntradaMultiLineaResponse, LineasEntradaAgregadoRequest
+from src.modules.lineas_entrada_salida_service.src.infrastructure.api.schemas.lineas_shared import LineasPagination, UpdateCodigoParrillaRequest, \
+    LineasMultiPagination, LineasExportFilters, LineasExtractFilters
+from src.modules.lineas_entrada_salida_service.src.infrastructure.export.columnar import ENTRADA_COLUMNS, \
+    columnar_response, pyarrow_available
+from src.modules.lineas_entrada_salida_service.src.infrastructure.db.repositories.lineas_entrada_async_repository import \
+    AsyncLineasEntradaRepository
 from src.modules.lineas_entrada_salida_service.src.infrastructure.db.repositories.lineas_entrada_repository import \
     LineasEntradaRepository
-from src.shared.base import get_db
+from src.shared.base import get_db, get_async_db
 from src.shared.common.auditoria import get_audit_use_case
 from src.shared.common.responses import success_response, error_response
+from src.shared.common.streaming import export_response
+from src.shared.config import settings
+from src.shared.database import AsyncSessionLocalMain
 from src.shared.exceptions import RepositoryError, NotFoundError
-from src.shared.security import get_current_user_data
+from src.shared.security import get_current_user_data, get_current_user_data_async
 
 router = APIRouter()
 
@@ -30,14 +39,119 @@ def get_lineas_entrada_use_case(
     )
 
 
+def get_async_lineas_entrada_use_case(
+        db_externa: AsyncSession = Depends(get_async_db)
+) -> AsyncLineasEntradaUseCase:
+    return AsyncLineasEntradaUseCase(
+        lineas_entrada_repository=AsyncLineasEntradaRepository(db_externa)
+    )
+
+
+@router.post("/agregados", status_code=status.HTTP_200_OK)
+async def get_agregados_lineas_entrada(
+        agregado_params: LineasEntradaAgregadoRequest,
+        use_case: AsyncLineasEntradaUseCase = Depends(get_async_lineas_entrada_use_case)
+):
+    """Registros, peso total y peso promedio (kg) agrupados por las dimensiones de group_by."""
+    try:
+        result = await use_case.get_agregados_lineas_entrada(agregado_params)
+        return success_response(
+            data=result,
+            message=f"Agregados de las Líneas {result['lineas']} obtenidos",
+        )
+
+    except RepositoryError as e:
+        return error_response(
+            message=str(e), status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+@router.post("/{linea_num}/agregados", status_code=status.HTTP_200_OK)
+async def get_agregados_linea_entrada(
+        agregado_params: LineasEntradaAgregadoRequest,
+        linea_num: int = Path(..., ge=1, le=6, description="Número de Línea (1 al 6)"),
+        use_case: AsyncLineasEntradaUseCase = Depends(get_async_lineas_entrada_use_case)
+):
+    try:
+        result = await use_case.get_agregados_lineas_entrada(
+            agregado_params.model_copy(update={"lineas": [linea_num]})
+        )
+        return success_response(
+            data=result,
+            message=f"Agregados de la Línea {linea_num} obtenidos",
+        )
+
+    except RepositoryError as e:
+        return error_response(
+            message=str(e), status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+@router.post("/extract", status_code=status.HTTP_200_OK)
+async def extract_lineas_entrada(
+        filters: LineasExtractFilters,
+        formato: Literal["arrow", "parquet"] = Query("parquet", description="Arrow IPC (stream) o Parquet"),
+        user_data: Dict[str, Any] = Depends(get_current_user_data_async)
+):
+    """Extracción columnar tipada de las líneas y rango de fechas indicados, en streaming."""
+    if not pyarrow_available():
+        return error_response(
+            message="La extracción Arrow/Parquet requiere el paquete pyarrow instalado en el servidor.",
+            status_code=status.HTTP_501_NOT_IMPLEMENTED
+        )
+
+    async def batches():
+        # La sesión vive dentro del generador: la de Depends se cierra antes de que termine el streaming
+        async with AsyncSessionLocalMain() as db:
+            use_case = AsyncLineasEntradaUseCase(lineas_entrada_repository=AsyncLineasEntradaRepository(db))
+            async for batch in use_case.stream_extract_lineas_entrada(filters, settings.EXTRACT_BATCH_SIZE):
+                yield batch
+
+    filename = f"lineas_entrada_{filters.fecha_desde}_{filters.fecha_hasta}"
+    return columnar_response(batches(), ENTRADA_COLUMNS, formato, filename)
+
+
+# Debe declararse antes de "/{linea_num}/paginated" para que "multilinea" no se tome como número de línea
+@router.post("/multilinea/paginated", status_code=status.HTTP_200_OK)
+async def get_lineas_entrada_multi_linea(
+        pagination_params: LineasMultiPagination,
+        use_case: AsyncLineasEntradaUseCase = Depends(get_async_lineas_entrada_use_case)
+):
+    try:
+        pagination_result = await use_case.get_lineas_entrada_multi_linea_paginated(pagination_params)
+
+        response_data = [
+            LineasEntradaMultiLineaResponse.model_validate(d).model_dump(mode="json")
+            for d in pagination_result["data"]
+        ]
+
+        response_data_with_meta = {
+            "total_records": pagination_result["total_records"],
+            "total_pages": pagination_result["total_pages"],
+            "page": pagination_result["page"],
+            "page_size": pagination_result["page_size"],
+            "lineas": pagination_result["lineas"],
+            "data": response_data,
+        }
+
+        return success_response(
+            data=response_data_with_meta,
+            message=f"Lineas paginadas de las Líneas {pagination_result['lineas']} obtenidas",
+        )
+
+    except RepositoryError as e:
+        return error_response(
+            message=str(e), status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
 @router.post("/{linea_num}/paginated", status_code=status.HTTP_200_OK)
-def get_all_lineas_entrada(
+async def get_all_lineas_entrada(
         pagination_params: LineasPagination,
         linea_num: int = Path(..., ge=1, le=6, description="Número de Línea (1 al 6)"),
-        use_case: LineasEntradaUseCase = Depends(get_lineas_entrada_use_case)
+        use_case: AsyncLineasEntradaUseCase = Depends(get_async_lineas_entrada_use_case)
 ):
     try:
-        pagination_result = use_case.get_lineas_entrada_paginated_by_filters(
+        pagination_result = await use_case.get_lineas_entrada_paginated_by_filters(
             filters=pagination_params,
             linea_num=linea_num
         )
@@ -54,6 +168,10 @@ def get_all_lineas_entrada(
             "page_size": pagination_result["page_size"],
             "data": response_data,
         }
+        if pagination_params.cursor_mode:
+            response_data_with_meta["next_cursor"] = pagination_result["next_cursor"]
+        else:
+            response_data_with_meta["total_is_exact"] = pagination_result["total_is_exact"]
 
         return success_response(
             data=response_data_with_meta,
@@ -66,6 +184,27 @@ def get_all_lineas_entrada(
         )
 
 
+
+@router.post("/{linea_num}/export", status_code=status.HTTP_200_OK)
+async def export_lineas_entrada(
+        filters: LineasExportFilters,
+        linea_num: int = Path(..., ge=1, le=6, description="Número de Línea (1 al 6)"),
+        formato: Literal["ndjson", "csv"] = Query("ndjson", description="Formato de salida"),
+        user_data: Dict[str, Any] = Depends(get_current_user_data_async)
+):
+    """Exporta en streaming (NDJSON o CSV) los registros de la línea que cumplen los filtros."""
+
+    async def batches():
+        # La sesión vive dentro del generador: la de Depends se cierra antes de que termine el streaming
+        async with AsyncSessionLocalMain() as db:
+            use_case = AsyncLineasEntradaUseCase(lineas_entrada_repository=AsyncLineasEntradaRepository(db))
+            async for batch in use_case.stream_lineas_entrada(filters, linea_num, settings.EXPORT_BATCH_SIZE):
+                yield batch
+
+    periodo = filters.fecha or f"{filters.lote}_{filters.fecha_desde}_{filters.fecha_hasta}"
+    filename = f"lineas_entrada_{linea_num}_{periodo}"
+    return export_response(batches(), formato, list(LineasEntradaResponse.model_fields), filename)
+
 @router.get("/{linea_num}/{linea_id}", response_model=LineasEntradaResponse, status_code=status.HTTP_200_OK)
 def get_linea_entrada_by_id(
         linea_id: int,
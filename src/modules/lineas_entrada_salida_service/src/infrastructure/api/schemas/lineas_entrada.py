@@ -1,6 +1,8 @@
 from datetime import date, datetime, time
-from pydantic import BaseModel
-from typing import Optional, List
+from pydantic import BaseModel, Field
+from typing import Optional, List, Literal
+
+from src.modules.lineas_entrada_salida_service.src.infrastructure.api.schemas.lineas_shared import LineasAgregadoFilters
 
 
 class LineasEntradaResponse(BaseModel):
@@ -18,14 +20,24 @@ class LineasEntradaResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class LineasEntradaMultiLineaResponse(LineasEntradaResponse):
+    linea_num: int
+
 class LineasEntradaUpdate(BaseModel):
     turno: Optional[int]
     p_lote: Optional[str]
     hora_inicio: Optional[time]
 
 class LineasEntradaPaginatedResponse(BaseModel):
-    total_records: int
-    total_pages: int
-    page: int
+    total_records: Optional[int] = None
+    total_pages: Optional[int] = None
+    page: Optional[int] = None
     page_size: int
+    next_cursor: Optional[str] = None
+    total_is_exact: Optional[bool] = None
     data: List[LineasEntradaResponse]
+
+AgrupacionEntrada = Literal["fecha_p", "p_lote", "turno", "hora", "hora_del_dia", "linea_num"]
+
+class LineasEntradaAgregadoRequest(LineasAgregadoFilters):
+    group_by: List[AgrupacionEntrada] = Field(default_factory=lambda: ["fecha_p"], min_length=1)
@@ -1,8 +1,8 @@
 from datetime import date, datetime
-from pydantic import BaseModel
-from typing import Optional, List
+from pydantic import BaseModel, Field
+from typing import Optional, List, Literal
 
-from src.modules.lineas_entrada_salida_service.src.infrastructure.api.schemas.lineas_shared import LineasFilters
+from src.modules.lineas_entrada_salida_service.src.infrastructure.api.schemas.lineas_shared import LineasFilters, LineasAgregadoFilters
 
 
 class LineasSalidaResponse(BaseModel):
@@ -19,15 +19,20 @@ class LineasSalidaResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class LineasSalidaMultiLineaResponse(LineasSalidaResponse):
+    linea_num: int
+
 class LineasSalidaUpdate(BaseModel):
     codigo_bastidor: Optional[str]
     p_lote: Optional[str]
 
 class LineasSalidaPaginatedResponse(BaseModel):
-    total_records: int
-    total_pages: int
-    page: int
+    total_records: Optional[int] = None
+    total_pages: Optional[int] = None
+    page: Optional[int] = None
     page_size: int
+    next_cursor: Optional[str] = None
+    total_is_exact: Optional[bool] = None
     data: List[LineasSalidaResponse]
 
 class TaraIdRequest(BaseModel):
@@ -35,3 +40,8 @@ class TaraIdRequest(BaseModel):
 
 class PanzaRequest(LineasFilters):
     peso_kg: float
+
+AgrupacionSalida = Literal["fecha_p", "p_lote", "codigo_obrero", "hora", "hora_del_dia", "linea_num"]
+
+class LineasSalidaAgregadoRequest(LineasAgregadoFilters):
+    group_by: List[AgrupacionSalida] = Field(default_factory=lambda: ["fecha_p"], min_length=1)
@@ -1,7 +1,7 @@
 from datetime import date
-from typing import Optional
+from typing import List, Optional
 
-from pydantic import BaseModel, conint
+from pydantic import BaseModel, Field, conint, model_validator
 
 
 class LineasFilters(BaseModel):
@@ -11,6 +11,57 @@ class LineasFilters(BaseModel):
 class LineasPagination(LineasFilters):
     page: conint(ge=1) = 1
     page_size: conint(ge=1) = 20
+    # False omite el conteo total (total_records/total_pages llegan como null)
+    include_total: bool = True
+    # Paginación por cursor (keyset sobre fecha_p, id): se activa con use_cursor
+    # en la primera página y enviando el next_cursor recibido en las siguientes.
+    use_cursor: bool = False
+    cursor: Optional[str] = None
+
+    @property
+    def cursor_mode(self) -> bool:
+        return self.use_cursor or self.cursor is not None
+
+
+class LineasMultiPagination(LineasFilters):
+    """Consulta de varias líneas a la vez (UNION ALL sobre las tablas reg_linea_*)."""
+    lineas: List[conint(ge=1, le=6)] = Field(default_factory=lambda: [1, 2, 3, 4, 5, 6], min_length=1)
+    page: conint(ge=1) = 1
+    page_size: conint(ge=1) = 20
+    include_total: bool = True
+
+
+class LineasAgregadoFilters(LineasFilters):
+    """Filtros comunes de los agregados de peso_kg; por defecto se consideran todas las líneas."""
+    lineas: List[conint(ge=1, le=6)] = Field(default_factory=lambda: [1, 2, 3, 4, 5, 6], min_length=1)
+
+
+class LineasExportFilters(LineasFilters):
+    """Exportación NDJSON/CSV: exige una fecha concreta o un lote acotado por rango de fechas."""
+    fecha_desde: Optional[date] = None
+    fecha_hasta: Optional[date] = None
+
+    @model_validator(mode="after")
+    def check_acotado(self):
+        if self.fecha is None and not (self.lote and self.fecha_desde and self.fecha_hasta):
+            raise ValueError("Se requiere fecha, o lote junto con fecha_desde y fecha_hasta")
+        if self.fecha_desde and self.fecha_hasta and self.fecha_desde > self.fecha_hasta:
+            raise ValueError("fecha_desde no puede ser posterior a fecha_hasta")
+        return self
+
+
+class LineasExtractFilters(BaseModel):
+    """Extracción columnar (Arrow/Parquet) por rango de fechas de producción; el rango es obligatorio."""
+    lineas: List[conint(ge=1, le=6)] = Field(default_factory=lambda: [1, 2, 3, 4, 5, 6], min_length=1)
+    fecha_desde: date
+    fecha_hasta: date
+    lote: Optional[str] = None
+
+    @model_validator(mode="after")
+    def check_rango(self):
+        if self.fecha_desde > self.fecha_hasta:
+            raise ValueError("fecha_desde no puede ser posterior a fecha_hasta")
+        return self
 
 
 class UpdateCodigoParrillaRequest(BaseModel):
@@ -1,7 +1,18 @@
-from sqlalchemy import Column, Integer, Date, DateTime, Float, String, Time, Boolean
+from sqlalchemy import Column, Integer, Date, DateTime, Float, String, Time, Boolean, Index
 
 from src.shared.database import _BaseAuth, _BaseMain
 
+
+def reg_linea_indexes(tablename: str) -> tuple:
+    """
+    Índice de las tablas reg_linea: lecturas y agregar_panza filtran por
+    fecha_p / p_lote. En SQL Server incluye peso_kg, así que los conteos, los
+    agregados de peso y la lectura previa de agregar_panza no tocan la tabla.
+    """
+    return (
+        Index(f"idx_{tablename}_fecha_p_lote", "fecha_p", "p_lote", "id", mssql_include=["peso_kg"]),
+    )
+
 #Lineas Entrada
 class LineaUnoEntradaORM(_BaseMain):
     __tablename__ = "reg_linea_uno_entrad"
@@ -17,6 +28,8 @@ class LineaUnoEntradaORM(_BaseMain):
     hora_inicio = Column(Time)
     guid = Column(String(255))
 
+    __table_args__ = reg_linea_indexes("reg_linea_uno_entrad")
+
 class LineaDosEntradaORM(_BaseMain):
     __tablename__ = "reg_linea_dos_entrad"
 
@@ -31,6 +44,8 @@ class LineaDosEntradaORM(_BaseMain):
     hora_inicio = Column(Time)
     guid = Column(String(255))
 
+    __table_args__ = reg_linea_indexes("reg_linea_dos_entrad")
+
 class LineaTresEntradaORM(_BaseMain):
     __tablename__ = "reg_linea_tres_entrad"
 
@@ -45,6 +60,8 @@ class LineaTresEntradaORM(_BaseMain):
     hora_inicio = Column(Time)
     guid = Column(String(255))
 
+    __table_args__ = reg_linea_indexes("reg_linea_tres_entrad")
+
 class LineaCuatroEntradaORM(_BaseMain):
     __tablename__ = "reg_linea_cuatro_entrad"
 
@@ -59,6 +76,8 @@ class LineaCuatroEntradaORM(_BaseMain):
     hora_inicio = Column(Time)
     guid = Column(String(255))
 
+    __table_args__ = reg_linea_indexes("reg_linea_cuatro_entrad")
+
 class LineaCincoEntradaORM(_BaseMain):
     __tablename__ = "reg_linea_cinco_entrad"
 
@@ -73,6 +92,8 @@ class LineaCincoEntradaORM(_BaseMain):
     hora_inicio = Column(Time)
     guid = Column(String(255))
 
+    __table_args__ = reg_linea_indexes("reg_linea_cinco_entrad")
+
 class LineaSeisEntradaORM(_BaseMain):
     __tablename__ = "reg_linea_seis_entrad"
 
@@ -87,6 +108,8 @@ class LineaSeisEntradaORM(_BaseMain):
     hora_inicio = Column(Time)
     guid = Column(String(255))
 
+    __table_args__ = reg_linea_indexes("reg_linea_seis_entrad")
+
 #Lineas Salida
 class LineaUnoSalidaORM(_BaseMain):
     __tablename__ = "reg_linea_uno_salid"
@@ -101,6 +124,8 @@ class LineaUnoSalidaORM(_BaseMain):
     codigo_obrero = Column(String(255))
     guid = Column(String(255))
 
+    __table_args__ = reg_linea_indexes("reg_linea_uno_salid")
+
 class LineaDosSalidaORM(_BaseMain):
     __tablename__ = "reg_linea_dos_salid"
 
@@ -114,6 +139,8 @@ class LineaDosSalidaORM(_BaseMain):
     codigo_obrero = Column(String(255))
     guid = Column(String(255))
 
+    __table_args__ = reg_linea_indexes("reg_linea_dos_salid")
+
 class LineaTresSalidaORM(_BaseMain):
     __tablename__ = "reg_linea_tres_salid"
 
@@ -127,6 +154,8 @@ class LineaTresSalidaORM(_BaseMain):
     codigo_obrero = Column(String(255))
     guid = Column(String(255))
 
+    __table_args__ = reg_linea_indexes("reg_linea_tres_salid")
+
 class LineaCuatroSalidaORM(_BaseMain):
     __tablename__ = "reg_linea_cuatro_salid"
 
@@ -140,6 +169,8 @@ class LineaCuatroSalidaORM(_BaseMain):
     codigo_obrero = Column(String(255))
     guid = Column(String(255))
 
+    __table_args__ = reg_linea_indexes("reg_linea_cuatro_salid")
+
 class LineaCincoSalidaORM(_BaseMain):
     __tablename__ = "reg_linea_cinco_salid"
 
@@ -153,6 +184,8 @@ class LineaCincoSalidaORM(_BaseMain):
     codigo_obrero = Column(String(255))
     guid = Column(String(255))
 
+    __table_args__ = reg_linea_indexes("reg_linea_cinco_salid")
+
 class LineaSeisSalidaORM(_BaseMain):
     __tablename__ = "reg_linea_seis_salid"
 
@@ -166,6 +199,8 @@ class LineaSeisSalidaORM(_BaseMain):
     codigo_obrero = Column(String(255))
     guid = Column(String(255))
 
+    __table_args__ = reg_linea_indexes("reg_linea_seis_salid")
+
 # Control Tara
 class ControlTaraOrm(_BaseAuth):
     __tablename__ = "control_tara"
@@ -8,6 +8,7 @@ from src.modules.lineas_entrada_salida_service.src.application.ports.control_tar
 from src.modules.lineas_entrada_salida_service.src.infrastructure.api.schemas.control_tara import TaraCreate
 from src.modules.lineas_entrada_salida_service.src.infrastructure.db.models import ControlTaraOrm
 from src.modules.lineas_entrada_salida_service.src.domain.entities import ControlTara
+from src.shared.common.reference_cache import reference_cache, TARAS
 from src.shared.exceptions import RepositoryError, NotFoundError
 
 
@@ -16,6 +17,12 @@ class ControlTaraRepository(IControlTaraRepository):
         self.db = db
 
     def get_all(self) -> List[ControlTara]:
+        return list(reference_cache.get_or_load(TARAS, "activas", self._get_all))
+
+    def get_by_id(self, tara_id: int) -> Optional[ControlTara]:
+        return reference_cache.get_or_load(TARAS, ("id", tara_id), lambda: self._get_by_id(tara_id))
+
+    def _get_all(self) -> List[ControlTara]:
         try:
             taras_orm = (
                 self.db.query(ControlTaraOrm)
@@ -60,7 +67,7 @@ class ControlTaraRepository(IControlTaraRepository):
             logging.error(f"FALLO DE DB DETALLADO: {e}")
             raise RepositoryError("Error al crear la tara.") from e
 
-    def get_by_id(self, tara_id: int) -> Optional[ControlTara]:
+    def _get_by_id(self, tara_id: int) -> Optional[ControlTara]:
         try:
             tara_orm = (
                 self.db.query(ControlTaraOrm)
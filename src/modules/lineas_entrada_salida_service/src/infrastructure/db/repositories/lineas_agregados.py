@@ -0,0 +1,70 @@
+from typing import Any, Callable, Dict, List, Sequence
+
+from sqlalchemy import DateTime, Integer, extract, func, literal, select, union_all
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+
+
+class hora_truncada(FunctionElement):
+    """Fecha y hora truncadas a la hora en punto (minutos y segundos a cero)."""
+    type = DateTime()
+    name = "hora_truncada"
+    inherit_cache = True
+
+
+@compiles(hora_truncada)
+def _hora_truncada_default(element, compiler, **kw):
+    return "date_trunc('hour', %s)" % compiler.process(element.clauses, **kw)
+
+
+@compiles(hora_truncada, "mssql")
+def _hora_truncada_mssql(element, compiler, **kw):
+    return "DATEADD(hour, DATEDIFF(hour, 0, %s), 0)" % compiler.process(element.clauses, **kw)
+
+
+@compiles(hora_truncada, "sqlite")
+def _hora_truncada_sqlite(element, compiler, **kw):
+    # Con segundos para que el tipo DateTime de SQLite lo lea como fecha y hora
+    return "strftime('%%Y-%%m-%%d %%H:00:00', %s)" % compiler.process(element.clauses, **kw)
+
+
+# Dimensiones comunes a las tablas de entrada y salida: "hora" agrupa por fecha y hora
+# de `fecha` (una fila por hora de cada día); "hora_del_dia" solo por la hora (0-23)
+COMMON_DIMENSIONS: Dict[str, Callable[[Any], Any]] = {
+    "fecha_p": lambda orm_model: orm_model.fecha_p,
+    "p_lote": lambda orm_model: orm_model.p_lote,
+    "hora": lambda orm_model: hora_truncada(orm_model.fecha),
+    "hora_del_dia": lambda orm_model: extract("hour", orm_model.fecha),
+}
+
+
+def build_aggregation_stmt(orm_models: Dict[int, Any], dimensions: Dict[str, Callable[[Any], Any]],
+                           group_by: Sequence[str], apply_filters: Callable[[Any, Any], Any]):
+    """
+    SELECT con COUNT/SUM/AVG de peso_kg agrupado por `group_by` sobre una o varias
+    líneas. Cada rama del UNION ALL aplica sus filtros antes de agrupar; la
+    dimensión "linea_num" agrupa por línea de origen.
+    """
+    branches = []
+    for linea_num, orm_model in orm_models.items():
+        columns = [literal(linea_num, Integer).label("linea_num")]
+        columns += [dimensions[name](orm_model).label(name) for name in group_by if name != "linea_num"]
+        columns.append(orm_model.peso_kg.label("peso_kg"))
+        branches.append(apply_filters(select(*columns), orm_model))
+
+    source = (union_all(*branches) if len(branches) > 1 else branches[0]).subquery("lineas")
+    keys = [source.c[name] for name in group_by]
+    return (
+        select(
+            *keys,
+            func.count().label("registros"),
+            func.sum(source.c.peso_kg).label("peso_total_kg"),
+            func.avg(source.c.peso_kg).label("peso_promedio_kg"),
+        )
+        .group_by(*keys)
+        .order_by(*keys)
+    )
+
+
+def rows_to_dicts(rows) -> List[Dict[str, Any]]:
+    return [dict(row._mapping) for row in rows]
@@ -12,6 +12,8 @@ from src.modules.lineas_entrada_salida_service.src.infrastructure.api.schemas.li
     LineasFilters
 from src.modules.lineas_entrada_salida_service.src.infrastructure.db.models import LineaUnoEntradaORM, LineaDosEntradaORM, \
     LineaTresEntradaORM, LineaCuatroEntradaORM, LineaCincoEntradaORM, LineaSeisEntradaORM
+from src.shared.common.count_cache import count_cache
+from src.shared.common.pagination import paginate
 from src.shared.exceptions import RepositoryError, NotFoundError
 
 LINEA_ORM_MAPPER = {
@@ -33,6 +35,9 @@ class LineasEntradaRepository(ILineasEntradaRepository):
             raise RepositoryError(f"Línea entrada {linea_num} no válida o no implementada.")
         return orm_model
 
+    def _invalidate_counts(self, linea_num: int) -> None:
+        count_cache.invalidate(self._get_orm_model(linea_num).__tablename__)
+
     def _apply_filters(self, query, filters: LineasFilters, orm_model):
         conditions = []
 
@@ -87,20 +92,12 @@ class LineasEntradaRepository(ILineasEntradaRepository):
         orm_model = self._get_orm_model(linea_num)
 
         try:
-            total_records = self.count_by_filters(filters, linea_num)
-
-            if total_records == 0:
-                return [], 0
-
             base_query = self.db.query(orm_model)
             data_query = self._apply_filters(base_query, filters, orm_model)
 
             data_query = data_query.order_by(orm_model.fecha_p.desc(), orm_model.hora_inicio.desc())
 
-            offset = (page - 1) * page_size
-            data_query = data_query.limit(page_size).offset(offset)
-
-            lineas_entrada_data = data_query.all()
+            lineas_entrada_data, total_records = paginate(data_query, page, page_size)
 
             domain_entities = [
                 LineasEntrada(
@@ -134,6 +131,7 @@ class LineasEntradaRepository(ILineasEntradaRepository):
 
         try:
             self.db.commit()
+            self._invalidate_counts(linea_num)
             self.db.refresh(orm_model)
             return LineasEntrada(
                 id=orm_model.id,
@@ -158,6 +156,7 @@ class LineasEntradaRepository(ILineasEntradaRepository):
                 raise NotFoundError(f"Producción de linea entrada con id={linea_id} no encontrado.")
             self.db.delete(linea_orm)
             self.db.commit()
+            self._invalidate_counts(linea_num)
             return True
         except SQLAlchemyError as e:
             self.db.rollback()
@@ -173,6 +172,7 @@ class LineasEntradaRepository(ILineasEntradaRepository):
             linea_orm.codigo_parrilla = valor_parrilla
             linea_orm.codigo_secuencia = valor_secuencia
             self.db.commit()
+            self._invalidate_counts(linea_num)
             self.db.refresh(linea_orm)
 
             return LineasEntrada(
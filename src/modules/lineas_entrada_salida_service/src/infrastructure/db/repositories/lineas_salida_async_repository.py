@@ -0,0 +1,251 @@
+import logging
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from sqlalchemy import Integer, and_, func, literal, select, union_all
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.modules.lineas_entrada_salida_service.src.application.ports.lineas_salida import IAsyncLineasSalidaRepository
+from src.modules.lineas_entrada_salida_service.src.domain.entities import LineasSalida
+from src.modules.lineas_entrada_salida_service.src.infrastructure.api.schemas.lineas_shared import LineasFilters, LineasExportFilters, LineasExtractFilters
+from src.modules.lineas_entrada_salida_service.src.infrastructure.db.repositories.lineas_salida_repository import \
+    LINEA_ORM_MAPPER
+from src.modules.lineas_entrada_salida_service.src.infrastructure.db.repositories.lineas_agregados import \
+    COMMON_DIMENSIONS, build_aggregation_stmt, rows_to_dicts
+from src.shared.common.count_cache import count_cache
+from src.shared.common.pagination import decode_cursor, encode_cursor, keyset_after, paginate_async
+from src.shared.exceptions import RepositoryError
+
+# Columnas comunes a las seis tablas reg_linea_*_salid
+_UNION_COLUMNS = (
+    "id", "fecha_p", "fecha", "peso_kg", "codigo_bastidor", "p_lote", "codigo_parrilla",
+    "codigo_obrero", "guid",
+)
+
+
+# Dimensiones de agrupación admitidas por get_aggregates
+_AGGREGATION_DIMENSIONS = {
+    **COMMON_DIMENSIONS,
+    "codigo_obrero": lambda orm_model: orm_model.codigo_obrero,
+}
+
+
+class AsyncLineasSalidaRepository(IAsyncLineasSalidaRepository):
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    def _get_orm_model(self, linea_num: int):
+        orm_model = LINEA_ORM_MAPPER.get(linea_num)
+        if not orm_model:
+            raise RepositoryError(f"Línea salida {linea_num} no válida o no implementada.")
+        return orm_model
+
+    def _apply_filters(self, stmt, filters: LineasFilters, orm_model):
+        conditions = []
+
+        if filters.fecha:
+            conditions.append(orm_model.fecha_p == filters.fecha)
+
+        if filters.lote:
+            conditions.append(orm_model.p_lote == filters.lote)
+
+        if conditions:
+            stmt = stmt.where(and_(*conditions))
+
+        return stmt
+
+    def _count_cache_filters(self, filters: LineasFilters) -> dict:
+        return {"fecha": filters.fecha, "lote": filters.lote}
+
+    async def count_by_filters(self, filters: LineasFilters, linea_num: int) -> int:
+        orm_model = self._get_orm_model(linea_num)
+        try:
+            stmt = self._apply_filters(select(func.count(orm_model.id)), filters, orm_model)
+            result = await self.db.execute(stmt)
+            return result.scalar() or 0
+        except SQLAlchemyError as e:
+            raise RepositoryError(f"Error al contar las lineas salida {linea_num}.") from e
+
+    async def count_by_filters_cached(self, filters: LineasFilters, linea_num: int) -> Tuple[int, bool]:
+        table = self._get_orm_model(linea_num).__tablename__
+        cache_filters = self._count_cache_filters(filters)
+        cached_total = count_cache.get(table, cache_filters)
+        if cached_total is not None:
+            return cached_total, False
+
+        total_records = await self.count_by_filters(filters, linea_num)
+        count_cache.set(table, cache_filters, total_records)
+        return total_records, True
+
+    async def get_paginated_by_filters(self, filters: LineasFilters, page: int, page_size: int, linea_num: int,
+                                       include_total: bool = True) -> Tuple[List[LineasSalida], Optional[int], bool]:
+        orm_model = self._get_orm_model(linea_num)
+        cache_filters = self._count_cache_filters(filters)
+        cached_total = count_cache.get(orm_model.__tablename__, cache_filters) if include_total else None
+
+        try:
+            stmt = self._apply_filters(select(orm_model), filters, orm_model)
+            stmt = stmt.order_by(orm_model.fecha_p.desc())
+
+            # Con el total en caché basta con pedir la página
+            rows, total_records = await paginate_async(
+                self.db, stmt, page, page_size, with_total=include_total and cached_total is None
+            )
+
+            domain_entities = [
+                LineasSalida(
+                    id=linea.id,
+                    fecha_p=linea.fecha_p,
+                    fecha=linea.fecha,
+                    peso_kg=linea.peso_kg,
+                    codigo_bastidor=linea.codigo_bastidor,
+                    p_lote=linea.p_lote,
+                    codigo_parrilla=linea.codigo_parrilla,
+                    codigo_obrero=linea.codigo_obrero,
+                    guid=linea.guid
+                )
+                for linea in rows
+            ]
+
+            if cached_total is not None:
+                return domain_entities, cached_total, False
+            if total_records is not None:
+                count_cache.set(orm_model.__tablename__, cache_filters, total_records)
+            return domain_entities, total_records, True
+        except SQLAlchemyError as e:
+            logging.error(f"FALLO DE DB DETALLADO: {e}")
+            raise RepositoryError("Error al obtener todas las líneas salida.") from e
+
+    async def get_page_by_cursor(self, filters: LineasFilters, page_size: int, linea_num: int, cursor: Optional[str]) -> Tuple[
+        List[LineasSalida], Optional[str]]:
+        orm_model = self._get_orm_model(linea_num)
+
+        try:
+            stmt = self._apply_filters(select(orm_model), filters, orm_model)
+            if cursor:
+                fecha, last_id = decode_cursor(cursor)
+                stmt = stmt.where(keyset_after(orm_model.fecha_p, orm_model.id, fecha, last_id))
+
+            # Se pide una fila extra para saber si existe una página siguiente
+            stmt = stmt.order_by(orm_model.fecha_p.desc(), orm_model.id.desc()).limit(page_size + 1)
+            result = await self.db.execute(stmt)
+            rows = result.scalars().all()
+
+            next_cursor = None
+            if len(rows) > page_size:
+                rows = rows[:page_size]
+                next_cursor = encode_cursor(rows[-1].fecha_p, rows[-1].id)
+
+            domain_entities = [
+                LineasSalida(
+                    id=linea.id,
+                    fecha_p=linea.fecha_p,
+                    fecha=linea.fecha,
+                    peso_kg=linea.peso_kg,
+                    codigo_bastidor=linea.codigo_bastidor,
+                    p_lote=linea.p_lote,
+                    codigo_parrilla=linea.codigo_parrilla,
+                    codigo_obrero=linea.codigo_obrero,
+                    guid=linea.guid
+                )
+                for linea in rows
+            ]
+            return domain_entities, next_cursor
+        except SQLAlchemyError as e:
+            logging.error(f"FALLO DE DB DETALLADO: {e}")
+            raise RepositoryError("Error al obtener las líneas salida por cursor.") from e
+
+    async def get_paginated_multi_linea(self, filters: LineasFilters, lineas: List[int], page: int, page_size: int,
+                                        include_total: bool = True) -> Tuple[List[LineasSalida], Optional[int]]:
+        """Pagina un UNION ALL de las líneas indicadas; cada rama aplica sus filtros y se etiqueta con linea_num."""
+        branches = []
+        for linea_num in sorted(set(lineas)):
+            orm_model = self._get_orm_model(linea_num)
+            branch = select(
+                literal(linea_num, Integer).label("linea_num"),
+                *(getattr(orm_model, column) for column in _UNION_COLUMNS)
+            )
+            branches.append(self._apply_filters(branch, filters, orm_model))
+
+        try:
+            union = union_all(*branches).subquery("lineas_salida")
+            stmt = select(union).order_by(union.c.fecha_p.desc(), union.c.linea_num, union.c.id.desc())
+
+            rows, total_records = await paginate_async(
+                self.db, stmt, page, page_size, with_total=include_total, scalars=False
+            )
+
+            domain_entities = [
+                LineasSalida(
+                    linea_num=row.linea_num,
+                    **{column: getattr(row, column) for column in _UNION_COLUMNS}
+                )
+                for row in rows
+            ]
+            return domain_entities, total_records
+        except SQLAlchemyError as e:
+            logging.error(f"FALLO DE DB DETALLADO: {e}")
+            raise RepositoryError("Error al obtener las líneas salida de varias líneas.") from e
+
+    async def get_aggregates(self, filters: LineasFilters, lineas: List[int], group_by: List[str]) -> List[Dict[str, Any]]:
+        """COUNT/SUM/AVG de peso_kg agrupado en la base de datos (una fila por grupo)."""
+        orm_models = {linea_num: self._get_orm_model(linea_num) for linea_num in sorted(set(lineas))}
+
+        try:
+            stmt = build_aggregation_stmt(
+                orm_models, _AGGREGATION_DIMENSIONS, group_by,
+                lambda branch, orm_model: self._apply_filters(branch, filters, orm_model)
+            )
+            result = await self.db.execute(stmt)
+            return rows_to_dicts(result.all())
+        except SQLAlchemyError as e:
+            logging.error(f"FALLO DE DB DETALLADO: {e}")
+            raise RepositoryError("Error al obtener los agregados de las líneas salida.") from e
+
+    async def stream_by_filters(self, filters: LineasExportFilters, linea_num: int,
+                                batch_size: int) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Lotes de filas (dict por columna) leídos con cursor de servidor; no carga todo el resultado."""
+        orm_model = self._get_orm_model(linea_num)
+        stmt = self._apply_filters(select(*orm_model.__table__.c), filters, orm_model)
+        if filters.fecha_desde:
+            stmt = stmt.where(orm_model.fecha_p >= filters.fecha_desde)
+        if filters.fecha_hasta:
+            stmt = stmt.where(orm_model.fecha_p <= filters.fecha_hasta)
+        stmt = stmt.order_by(orm_model.fecha_p, orm_model.id).execution_options(yield_per=batch_size)
+
+        try:
+            result = await self.db.stream(stmt)
+            try:
+                async for partition in result.mappings().partitions():
+                    yield [dict(row) for row in partition]
+            finally:
+                # Libera el cursor aunque el cliente corte la descarga a mitad
+                await result.close()
+        except SQLAlchemyError as e:
+            logging.error(f"FALLO DE DB DETALLADO: {e}")
+            raise RepositoryError(f"Error al exportar las líneas salida {linea_num}.") from e
+
+    async def stream_extract(self, filters: LineasExtractFilters,
+                             batch_size: int) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Lotes de filas de las líneas indicadas (una tras otra) dentro del rango de fechas."""
+        for linea_num in sorted(set(filters.lineas)):
+            orm_model = self._get_orm_model(linea_num)
+
+            conditions = [orm_model.fecha_p >= filters.fecha_desde, orm_model.fecha_p <= filters.fecha_hasta]
+            if filters.lote:
+                conditions.append(orm_model.p_lote == filters.lote)
+
+            stmt = select(literal(linea_num, Integer).label("linea_num"), *orm_model.__table__.c)
+            stmt = stmt.where(and_(*conditions))
+            stmt = stmt.order_by(orm_model.fecha_p, orm_model.id).execution_options(yield_per=batch_size)
+
+            try:
+                result = await self.db.stream(stmt)
+                try:
+                    async for partition in result.mappings().partitions():
+                        yield [dict(row) for row in partition]
+                finally:
+                    await result.close()
+            except SQLAlchemyError as e:
+                logging.error(f"FALLO DE DB DETALLADO: {e}")
+                raise RepositoryError(f"Error al extraer las líneas salida {linea_num}.") from e
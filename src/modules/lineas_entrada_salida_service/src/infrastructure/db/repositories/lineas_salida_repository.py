@@ -1,6 +1,6 @@
 import logging
 from typing import Tuple, List, Optional
-from sqlalchemy import func, and_
+from sqlalchemy import func, and_, literal_column, select, update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
@@ -10,6 +10,8 @@ from src.modules.lineas_entrada_salida_service.src.infrastructure.api.schemas.li
 from src.modules.lineas_entrada_salida_service.src.infrastructure.api.schemas.lineas_salida import LineasSalidaUpdate
 from src.modules.lineas_entrada_salida_service.src.infrastructure.db.models import LineaUnoSalidaORM, LineaDosSalidaORM, \
     LineaTresSalidaORM, LineaCuatroSalidaORM, LineaCincoSalidaORM, LineaSeisSalidaORM
+from src.shared.common.count_cache import count_cache
+from src.shared.common.pagination import paginate
 from src.shared.exceptions import RepositoryError, NotFoundError
 
 LINEA_ORM_MAPPER = {
@@ -31,6 +33,9 @@ class LineasSalidaRepository(ILineasSalidaRepository):
             raise RepositoryError(f"Línea salida {linea_num} no válida o no implementada.")
         return orm_model
 
+    def _invalidate_counts(self, linea_num: int) -> None:
+        count_cache.invalidate(self._get_orm_model(linea_num).__tablename__)
+
     def _apply_filters(self, query, filters: LineasFilters, orm_model):
         conditions = []
 
@@ -116,20 +121,12 @@ class LineasSalidaRepository(ILineasSalidaRepository):
         orm_model = self._get_orm_model(linea_num)
 
         try:
-            total_records = self.count_by_filters(filters, linea_num)
-
-            if total_records == 0:
-                return [], 0
-
             base_query = self.db.query(orm_model)
             data_query = self._apply_filters(base_query, filters, orm_model)
 
             data_query = data_query.order_by(orm_model.fecha_p.desc())
 
-            offset = (page - 1) * page_size
-            data_query = data_query.limit(page_size).offset(offset)
-
-            lineas_entrada_data = data_query.all()
+            lineas_entrada_data, total_records = paginate(data_query, page, page_size)
 
             domain_entities = [
                 LineasSalida(
@@ -162,6 +159,7 @@ class LineasSalidaRepository(ILineasSalidaRepository):
 
         try:
             self.db.commit()
+            self._invalidate_counts(linea_num)
             self.db.refresh(orm_model)
             return LineasSalida(
                 id=orm_model.id,
@@ -185,6 +183,7 @@ class LineasSalidaRepository(ILineasSalidaRepository):
                 raise NotFoundError(f"Producción de linea salida con id={linea_id} no encontrado.")
             self.db.delete(linea_orm)
             self.db.commit()
+            self._invalidate_counts(linea_num)
             return True
         except SQLAlchemyError as e:
             self.db.rollback()
@@ -201,6 +200,7 @@ class LineasSalidaRepository(ILineasSalidaRepository):
 
             linea_orm.peso_kg = peso_kg
             self.db.commit()
+            self._invalidate_counts(linea_num)
             self.db.refresh(linea_orm)
 
             return LineasSalida(
@@ -227,6 +227,7 @@ class LineasSalidaRepository(ILineasSalidaRepository):
 
             linea_orm.codigo_parrilla = valor_parrilla
             self.db.commit()
+            self._invalidate_counts(linea_num)
             self.db.refresh(linea_orm)
 
             return LineasSalida(
@@ -244,41 +245,61 @@ class LineasSalidaRepository(ILineasSalidaRepository):
             self.db.rollback()
             raise RepositoryError("Error al actualizar el código de parrilla de la línea salida.") from e
 
-    def agregar_panzas(self, items: list[dict]) -> list[LineasSalida]:
-        try:
-            linea_num = items[0]["linea_num"]
-            orm_model = self._get_orm_model(linea_num)
-
-            ids = [item["linea_id"] for item in items]
-            nuevos_pesos = {item["linea_id"]: item["nuevo_peso"] for item in items}
+    def agregar_panza_por_filtros(self, filters: LineasFilters, linea_num: int,
+                                  peso_kg: float) -> List[Tuple[Optional[float], LineasSalida]]:
+        """
+        Suma `peso_kg` a todos los registros que cumplen los filtros con un único
+        UPDATE ... SET peso_kg = ROUND(peso_kg + :delta, 3).
+
+        Devuelve, por registro actualizado, el peso anterior y el registro ya
+        actualizado. En SQL Server ambos salen del mismo UPDATE (OUTPUT deleted /
+        inserted); en el resto de motores el peso anterior se lee antes, en la
+        misma transacción.
+        """
+        orm_model = self._get_orm_model(linea_num)
+        columns = orm_model.__table__.c
 
-            registros = (
-                self.db.query(orm_model)
-                .filter(orm_model.id.in_(ids))
-                .all()
+        try:
+            stmt = self._apply_filters(update(orm_model), filters, orm_model)
+            stmt = (
+                stmt.where(orm_model.peso_kg.isnot(None))
+                .values(peso_kg=func.round(orm_model.peso_kg + peso_kg, 3))
+                .execution_options(synchronize_session=False)
             )
 
-            if len(registros) != len(ids):
-                raise NotFoundError("Uno o más registros no existen.")
-
-            for r in registros:
-                r.peso_kg = nuevos_pesos[r.id]
+            if self.db.get_bind().dialect.name == "mssql":
+                result = self.db.execute(
+                    stmt.returning(literal_column("deleted.peso_kg").label("peso_anterior"), *columns)
+                )
+                rows = result.all()
+                pesos_anteriores = {row.id: row.peso_anterior for row in rows}
+            else:
+                previos = self._apply_filters(
+                    select(orm_model.id, orm_model.peso_kg).where(orm_model.peso_kg.isnot(None)),
+                    filters, orm_model
+                ).with_for_update()
+                pesos_anteriores = dict(self.db.execute(previos).all())
+                rows = self.db.execute(stmt.returning(*columns)).all()
 
             self.db.commit()
+            self._invalidate_counts(linea_num)
 
             return [
-                LineasSalida(
-                    id=r.id,
-                    fecha_p=r.fecha_p,
-                    fecha=r.fecha,
-                    peso_kg=r.peso_kg,
-                    codigo_bastidor=r.codigo_bastidor,
-                    p_lote=r.p_lote,
-                    codigo_parrilla=r.codigo_parrilla,
-                    codigo_obrero=r.codigo_obrero,
-                    guid=r.guid,
+                (
+                    pesos_anteriores.get(r.id),
+                    LineasSalida(
+                        id=r.id,
+                        fecha_p=r.fecha_p,
+                        fecha=r.fecha,
+                        peso_kg=r.peso_kg,
+                        codigo_bastidor=r.codigo_bastidor,
+                        p_lote=r.p_lote,
+                        codigo_parrilla=r.codigo_parrilla,
+                        codigo_obrero=r.codigo_obrero,
+                        guid=r.guid,
+                    )
                 )
-                for r in registros
+                for r in rows
             ]
 
         except SQLAlchemyError as e:
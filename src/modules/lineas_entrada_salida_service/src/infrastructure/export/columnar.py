@@ -0,0 +1,144 @@
+import io
+from typing import Any, AsyncIterator, Dict, List, Sequence, Tuple
+
+from fastapi.responses import StreamingResponse
+
+# pyarrow viene en requirements.txt; el import protegido mantiene el resto de la API si falta en una instalación mínima
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+COLUMNAR_MEDIA_TYPES = {
+    "arrow": "application/vnd.apache.arrow.stream",
+    "parquet": "application/vnd.apache.parquet",
+}
+COLUMNAR_EXTENSIONS = {"arrow": "arrows", "parquet": "parquet"}
+
+# (columna, tipo lógico); los códigos se codifican como diccionario (pocos valores distintos)
+ENTRADA_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("linea_num", "int8"),
+    ("id", "int64"),
+    ("fecha_p", "date"),
+    ("fecha", "timestamp"),
+    ("peso_kg", "float64"),
+    ("turno", "int32"),
+    ("codigo_secuencia", "dictionary"),
+    ("codigo_parrilla", "dictionary"),
+    ("p_lote", "dictionary"),
+    ("hora_inicio", "time"),
+    ("guid", "string"),
+)
+
+SALIDA_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("linea_num", "int8"),
+    ("id", "int64"),
+    ("fecha_p", "date"),
+    ("fecha", "timestamp"),
+    ("peso_kg", "float64"),
+    ("codigo_bastidor", "dictionary"),
+    ("p_lote", "dictionary"),
+    ("codigo_parrilla", "dictionary"),
+    ("codigo_obrero", "dictionary"),
+    ("guid", "string"),
+)
+
+
+def pyarrow_available() -> bool:
+    return pyarrow is not None
+
+
+def _arrow_type(logical_type: str):
+    return {
+        "int8": pyarrow.int8(),
+        "int32": pyarrow.int32(),
+        "int64": pyarrow.int64(),
+        "date": pyarrow.date32(),
+        "timestamp": pyarrow.timestamp("us"),
+        "float64": pyarrow.float64(),
+        "dictionary": pyarrow.dictionary(pyarrow.int32(), pyarrow.string()),
+        "time": pyarrow.time64("us"),
+        "string": pyarrow.string(),
+    }[logical_type]
+
+
+def arrow_schema(columns: Sequence[Tuple[str, str]]):
+    return pyarrow.schema([(name, _arrow_type(logical_type)) for name, logical_type in columns])
+
+
+def to_record_batch(schema, rows: List[Dict[str, Any]]):
+    arrays = []
+    for field in schema:
+        values = [row.get(field.name) for row in rows]
+        if pyarrow.types.is_dictionary(field.type):
+            arrays.append(pyarrow.array(values, type=pyarrow.string()).dictionary_encode())
+        else:
+            arrays.append(pyarrow.array(values, type=field.type))
+    return pyarrow.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+class _ChunkSink(io.RawIOBase):
+    """Destino en memoria que se vacía tras cada lote; conserva la posición absoluta para los offsets de Parquet."""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _new_writer(sink, schema, formato: str):
+    if formato == "parquet":
+        return pyarrow.parquet.ParquetWriter(sink, schema, compression="zstd")
+    return pyarrow.ipc.new_stream(sink, schema)
+
+
+async def columnar_chunks(batches: AsyncIterator[List[Dict[str, Any]]], columns: Sequence[Tuple[str, str]],
+                          formato: str) -> AsyncIterator[bytes]:
+    """
+    Convierte lotes de filas en Arrow IPC (stream) o Parquet y emite los bytes
+    de cada lote en cuanto se escriben. En Parquet cada lote es un row group.
+    """
+    schema = arrow_schema(columns)
+    sink = _ChunkSink()
+    writer = _new_writer(sink, schema, formato)
+    try:
+        async for batch in batches:
+            if not batch:
+                continue
+            writer.write_batch(to_record_batch(schema, batch))
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+    except BaseException:
+        writer.close()
+        raise
+
+    writer.close()
+    yield sink.drain()
+
+
+def columnar_response(batches: AsyncIterator[List[Dict[str, Any]]], columns: Sequence[Tuple[str, str]],
+                      formato: str, filename: str) -> StreamingResponse:
+    return StreamingResponse(
+        columnar_chunks(batches, columns, formato),
+        media_type=COLUMNAR_MEDIA_TYPES[formato],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{COLUMNAR_EXTENSIONS[formato]}"'},
+    )
@@ -0,0 +1,78 @@
+"""
+Extracción columnar (Arrow IPC / Parquet) de las tablas reg_linea a un archivo local.
+
+Uso:
+    python -m src.modules.lineas_entrada_salida_service.src.infrastructure.export.extract_cli salida \\
+        --lineas 1 2 --desde 2025-01-01 --hasta 2025-01-31 --formato parquet -o salida_enero.parquet
+"""
+import argparse
+import asyncio
+import sys
+from datetime import date
+
+from src.modules.lineas_entrada_salida_service.src.application.use_cases.lineas_entrada_use_case import \
+    AsyncLineasEntradaUseCase
+from src.modules.lineas_entrada_salida_service.src.application.use_cases.lineas_salida_use_case import \
+    AsyncLineasSalidaUseCase
+from src.modules.lineas_entrada_salida_service.src.infrastructure.api.schemas.lineas_shared import \
+    LineasExtractFilters
+from src.modules.lineas_entrada_salida_service.src.infrastructure.db.repositories.lineas_entrada_async_repository import \
+    AsyncLineasEntradaRepository
+from src.modules.lineas_entrada_salida_service.src.infrastructure.db.repositories.lineas_salida_async_repository import \
+    AsyncLineasSalidaRepository
+from src.modules.lineas_entrada_salida_service.src.infrastructure.export.columnar import ENTRADA_COLUMNS, \
+    SALIDA_COLUMNS, columnar_chunks, pyarrow_available
+from src.shared.config import settings
+from src.shared.database import AsyncSessionLocalMain, dispose_async_engines
+
+
+async def extract_to_file(tipo: str, filters: LineasExtractFilters, formato: str, output: str,
+                          batch_size: int) -> None:
+    async def batches():
+        async with AsyncSessionLocalMain() as db:
+            if tipo == "entrada":
+                stream = AsyncLineasEntradaUseCase(AsyncLineasEntradaRepository(db)).stream_extract_lineas_entrada(
+                    filters, batch_size
+                )
+            else:
+                stream = AsyncLineasSalidaUseCase(AsyncLineasSalidaRepository(db)).stream_extract_lineas_salida(
+                    filters, batch_size
+                )
+            async for batch in stream:
+                yield batch
+
+    columns = ENTRADA_COLUMNS if tipo == "entrada" else SALIDA_COLUMNS
+    try:
+        with open(output, "wb") as output_file:
+            async for chunk in columnar_chunks(batches(), columns, formato):
+                output_file.write(chunk)
+    finally:
+        await dispose_async_engines()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Extracción Arrow/Parquet de las tablas reg_linea.")
+    parser.add_argument("tipo", choices=["entrada", "salida"])
+    parser.add_argument("--lineas", type=int, nargs="+", default=[1, 2, 3, 4, 5, 6])
+    parser.add_argument("--desde", type=date.fromisoformat, required=True, help="fecha_p inicial (YYYY-MM-DD)")
+    parser.add_argument("--hasta", type=date.fromisoformat, required=True, help="fecha_p final (YYYY-MM-DD)")
+    parser.add_argument("--lote", default=None)
+    parser.add_argument("--formato", choices=["arrow", "parquet"], default="parquet")
+    parser.add_argument("--batch-size", type=int, default=settings.EXTRACT_BATCH_SIZE)
+    parser.add_argument("-o", "--output", required=True)
+    args = parser.parse_args(argv)
+
+    if not pyarrow_available():
+        print("La extracción Arrow/Parquet requiere el paquete pyarrow.", file=sys.stderr)
+        return 1
+
+    filters = LineasExtractFilters(
+        lineas=args.lineas, fecha_desde=args.desde, fecha_hasta=args.hasta, lote=args.lote
+    )
+    asyncio.run(extract_to_file(args.tipo, filters, args.formato, args.output, args.batch_size))
+    print(f"[OK] Extracción {args.tipo} escrita en {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
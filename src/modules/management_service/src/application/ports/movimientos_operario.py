@@ -42,6 +42,13 @@ class IWorkerMovementRepository(ABC):
     ) -> int:
         """Cuenta el total de registros WorkerMovement según los filtros."""
         pass
+
+    @abstractmethod
+    def count_by_filters_cached(
+        self, filters: WorkerMovementFilters, allowed_lines: List[str], allowed_turnos: List[int]
+    ) -> Tuple[int, bool]:
+        """Total y si es exacto (False cuando proviene de la caché de conteos)."""
+        pass
     
     @abstractmethod
     def get_paginated_by_filters(
@@ -50,6 +57,23 @@ class IWorkerMovementRepository(ABC):
         """Obtiene una página de registros WorkerMovement y el conteo total."""
         pass
 
+class IAsyncWorkerMovementRepository(ABC):
+    """Puerto de solo lectura sobre AsyncSession para los endpoints de consulta."""
+
+    @abstractmethod
+    async def count_by_filters(
+        self, filters: WorkerMovementFilters, allowed_lines: List[str], allowed_turnos: List[int]
+    ) -> int:
+        pass
+
+    @abstractmethod
+    async def get_paginated_by_filters(
+        self, filters: WorkerMovementFilters, page: int, page_size: int, allowed_lines: List[str], allowed_turnos: List[int],
+        include_total: bool = True
+    ) -> Tuple[List[WorkerMovement], Optional[int], bool]:
+        """Página, total (None si include_total=False) y si el total es exacto o viene de la caché."""
+        pass
+
 class IRefMotivoRepository(ABC):
     """Puerto para la gestión de motivos de referencia."""
     
@@ -1,11 +1,12 @@
-from typing import List, Optional, Dict, Any # <-- Añadido Dict y Any
+from typing import List, Optional, Dict, Any, Tuple # <-- Añadido Dict y Any
 from datetime import date, datetime
 from math import ceil
 from src.shared.exceptions import NotFoundError
 
 # Importar el puerto y los schemas
 from src.modules.management_service.src.application.ports.movimientos_operario import (
-    IWorkerMovementRepository, IRefMotivoRepository, IRefDestinoMotivoRepository
+    IWorkerMovementRepository, IRefMotivoRepository, IRefDestinoMotivoRepository,
+    IAsyncWorkerMovementRepository
 )
 from src.modules.management_service.src.infrastructure.api.schemas.movimientos_operario import (
     WorkerMovementCreate,
@@ -98,15 +99,15 @@ class WorkerMovementUseCases:
 
     def count_movements_by_filters(
         self, filters: WorkerMovementFilters, allowed_lines: List[int], allowed_turnos: List[int]
-    ) -> int:
-        """Caso de uso para contar movimientos, filtrado por líneas permitidas."""
+    ) -> Tuple[int, bool]:
+        """Caso de uso para contar movimientos, filtrado por líneas permitidas. Retorna (total, es_exacto)."""
 
         if not allowed_lines or not allowed_turnos:
-            return 0
+            return 0, True
             
         allowed_lines_str = [str(line_id) for line_id in allowed_lines]
 
-        return self.repository.count_by_filters(filters, allowed_lines_str, allowed_turnos)
+        return self.repository.count_by_filters_cached(filters, allowed_lines_str, allowed_turnos)
 
     def get_movements_paginated_by_filters(
         self, filters: WorkerMovementPagination, allowed_lines: List[int], allowed_turnos: List[int]
@@ -139,6 +140,58 @@ class WorkerMovementUseCases:
             "data": data, # Lista de entidades de dominio
         }
 
+class AsyncWorkerMovementUseCases:
+    """Consultas de solo lectura sobre AsyncSession (endpoints de alta concurrencia)."""
+
+    def __init__(self, repository: IAsyncWorkerMovementRepository):
+        self.repository = repository
+
+    async def count_movements_by_filters(
+        self, filters: WorkerMovementFilters, allowed_lines: List[int], allowed_turnos: List[int]
+    ) -> int:
+        """Caso de uso para contar movimientos, filtrado por líneas permitidas."""
+        if not allowed_lines or not allowed_turnos:
+            return 0
+
+        allowed_lines_str = [str(line_id) for line_id in allowed_lines]
+
+        return await self.repository.count_by_filters(filters, allowed_lines_str, allowed_turnos)
+
+    async def get_movements_paginated_by_filters(
+        self, filters: WorkerMovementPagination, allowed_lines: List[int], allowed_turnos: List[int]
+    ) -> WorkerMovementPaginatedResponse:
+        """Caso de uso para obtener movimientos paginados con metadatos, filtrado por líneas permitidas."""
+        if not allowed_lines or not allowed_turnos:
+            return {
+                "total_records": 0, "total_pages": 0,
+                "page": filters.page, "page_size": filters.page_size, "total_is_exact": True, "data": [],
+            }
+
+        allowed_lines_str = [str(line_id) for line_id in allowed_lines]
+
+        data, total_records, total_is_exact = await self.repository.get_paginated_by_filters(
+            filters=filters,
+            page=filters.page,
+            page_size=filters.page_size,
+            allowed_lines=allowed_lines_str,
+            allowed_turnos=allowed_turnos,
+            include_total=filters.include_total
+        )
+
+        total_pages = None
+        if total_records is not None:
+            total_pages = ceil(total_records / filters.page_size) if total_records > 0 else 0
+
+        return {
+            "total_records": total_records,
+            "total_pages": total_pages,
+            "page": filters.page,
+            "page_size": filters.page_size,
+            "total_is_exact": total_is_exact if total_records is not None else None,
+            "data": data,
+        }
+
+
 class RefMotivoUseCases:
     def __init__(self, repository: IRefMotivoRepository):
         self.repository = repository
@@ -1,17 +1,22 @@
 from fastapi import APIRouter, Depends, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Dict, Any
-from src.shared.base import get_db
+from src.shared.base import get_db, get_async_db
 from math import ceil
 from src.shared.common.responses import success_response, error_response
 from src.shared.exceptions import RepositoryError, NotFoundError
-from src.shared.security import get_current_user_data
+from src.modules.auth_service.src.domain.entities import ModuloEnum
+from src.modules.auth_service.src.infrastructure.middleware import require_read_access, require_write_access
 # Importar el repositorio y casos de uso del movimiento
 from src.modules.management_service.src.infrastructure.db.repositories.movimientos_operario import (
     WorkerMovementRepository, RefMotivoRepository, RefDestinoMotivoRepository
 )
+from src.modules.management_service.src.infrastructure.db.repositories.movimientos_operario_async import (
+    AsyncWorkerMovementRepository
+)
 from src.modules.management_service.src.application.use_cases.movimientos_operario import (
-    WorkerMovementUseCases, RefMotivoUseCases, RefDestinoMotivoUseCases
+    WorkerMovementUseCases, RefMotivoUseCases, RefDestinoMotivoUseCases, AsyncWorkerMovementUseCases
 )
 # Importar los schemas del movimiento
 from src.modules.management_service.src.infrastructure.api.schemas.movimientos_operario import (
@@ -29,6 +34,7 @@ from src.modules.management_service.src.infrastructure.api.schemas.movimientos_o
     RefMotivoFilters
 )
 from src.shared.common.auditoria import get_audit_use_case
+from src.shared.common.count_cache import TOTAL_SOURCE_HEADER, total_source
 from src.modules.auth_service.src.application.use_cases.audit_use_case import AuditUseCase
 
 router = APIRouter()
@@ -37,6 +43,9 @@ router = APIRouter()
 def get_movement_use_cases(db: Session = Depends(get_db), audit_uc: AuditUseCase = Depends(get_audit_use_case)) -> WorkerMovementUseCases:
     repository = WorkerMovementRepository(db)
     return WorkerMovementUseCases(repository, audit_uc)
+def get_async_movement_use_cases(db: AsyncSession = Depends(get_async_db)) -> AsyncWorkerMovementUseCases:
+    repository = AsyncWorkerMovementRepository(db)
+    return AsyncWorkerMovementUseCases(repository)
 def get_ref_motivo_use_cases(db: Session = Depends(get_db)) -> RefMotivoUseCases:
     repository = RefMotivoRepository(db)
     return RefMotivoUseCases(repository)
@@ -50,7 +59,7 @@ def get_ref_destino_motivo_use_cases(db: Session = Depends(get_db)) -> RefDestin
 def create_movement(
     movement_data: WorkerMovementCreate,
     use_cases: WorkerMovementUseCases = Depends(get_movement_use_cases),
-    user_data: Dict[str, Any] = Depends(get_current_user_data)
+    user_data: Dict[str, Any] = Depends(require_write_access(ModuloEnum.MOVIMIENTOS))
 ):
     new_data = use_cases.create_movement(movement_data, user_data)
     return success_response(
@@ -84,7 +93,7 @@ def update_movement_controller(
     movement_id: int,
     movement_data: WorkerMovementUpdate,
     use_cases: WorkerMovementUseCases = Depends(get_movement_use_cases),
-    user_data: Dict[str, Any] = Depends(get_current_user_data)
+    user_data: Dict[str, Any] = Depends(require_write_access(ModuloEnum.MOVIMIENTOS))
 ):
     try:
         updated_data = use_cases.update_movement(movement_id, movement_data, user_data)
@@ -106,7 +115,7 @@ def update_movement_controller(
 @router.delete("/{movement_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_movement_controller(
     movement_id: int, use_cases: WorkerMovementUseCases = Depends(get_movement_use_cases),
-    user_data: Dict[str, Any] = Depends(get_current_user_data)
+    user_data: Dict[str, Any] = Depends(require_write_access(ModuloEnum.MOVIMIENTOS))
 ):
     try:
         use_cases.delete_movement(movement_id, user_data)
@@ -133,7 +142,7 @@ def delete_movement_controller(
 def get_total_movements_by_filters(
     filters: WorkerMovementFilters,
     use_cases: WorkerMovementUseCases = Depends(get_movement_use_cases),
-    user_data: Dict[str, Any] = Depends(get_current_user_data)
+    user_data: Dict[str, Any] = Depends(require_read_access(ModuloEnum.MOVIMIENTOS))
 ):
     try:
         allowed_lines_ids = user_data.get("lineas", [])
@@ -141,15 +150,17 @@ def get_total_movements_by_filters(
         print("$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$")
         print(allowed_turnos_ids)
         print("$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$")
-        total_records = use_cases.count_movements_by_filters(
+        total_records, total_is_exact = use_cases.count_movements_by_filters(
             filters=filters, 
             allowed_lines=allowed_lines_ids,
             allowed_turnos=allowed_turnos_ids
         )
-        return success_response(
+        response = success_response(
             data=total_records,
             message="Total de movimientos obtenido",
         )
+        response.headers[TOTAL_SOURCE_HEADER] = total_source(total_is_exact)
+        return response
     except RepositoryError as e:
         return error_response(
             message=str(e), status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -159,15 +170,15 @@ def get_total_movements_by_filters(
 # 4. Controlador para OBTENER REGISTROS PAGINADOS POR FILTROS (POST)
 # Usamos POST para pasar los filtros y parámetros de paginación en el cuerpo.
 @router.post("/paginated", status_code=status.HTTP_200_OK)
-def get_movements_paginated(
+async def get_movements_paginated(
     pagination_params: WorkerMovementPagination,
-    use_cases: WorkerMovementUseCases = Depends(get_movement_use_cases),
-    user_data: Dict[str, Any] = Depends(get_current_user_data)
+    use_cases: AsyncWorkerMovementUseCases = Depends(get_async_movement_use_cases),
+    user_data: Dict[str, Any] = Depends(require_read_access(ModuloEnum.MOVIMIENTOS))
 ):
     try:
         allowed_lines_ids = user_data.get("lineas", [])
         allowed_turnos_ids = user_data.get("turnos", [])
-        pagination_result = use_cases.get_movements_paginated_by_filters(
+        pagination_result = await use_cases.get_movements_paginated_by_filters(
             filters=pagination_params,
             allowed_lines=allowed_lines_ids,
             allowed_turnos=allowed_turnos_ids
@@ -185,6 +196,7 @@ def get_movements_paginated(
             "total_pages": pagination_result["total_pages"],
             "page": pagination_result["page"],
             "page_size": pagination_result["page_size"],
+            "total_is_exact": pagination_result["total_is_exact"],
             "data": response_data,
         }
         
@@ -47,14 +47,16 @@ class WorkerMovementFilters(BaseModel):
 class WorkerMovementPagination(WorkerMovementFilters):
     page: conint(ge=1) = 1 # Página actual (mínimo 1)
     page_size: conint(ge=1) = 20 # Tamaño de página (mínimo 1)
+    include_total: bool = True # False omite el conteo total (total_records/total_pages en null)
 
 
 # Schema de respuesta para la paginación (útil para el front-end)
 class WorkerMovementPaginatedResponse(BaseModel):
-    total_records: int
-    total_pages: int
+    total_records: Optional[int] = None
+    total_pages: Optional[int] = None
     page: int
     page_size: int
+    total_is_exact: Optional[bool] = None
     data: List[WorkerMovementResponse]
 
 # Schemas de RefMotivo
@@ -32,7 +32,12 @@ class WorkerMovementORM(_BaseMain):
     hora = Column(DateTime, nullable=False)
     observacion = Column(String(255))
 
-    __table_args__ = (Index('idx_fecha_p_linea_operario', 'fecha_p', 'linea', 'codigo_operario'),)
+    __table_args__ = (
+        Index('idx_fecha_p_linea_operario', 'fecha_p', 'linea', 'codigo_operario'),
+        # Sostiene el ORDER BY fecha_p DESC, hora DESC de la paginación sin ordenar en memoria
+        Index('idx_fm_movimientos_operarios_fecha_p_hora', fecha_p.desc(), hora.desc(),
+              mssql_include=['linea', 'codigo_operario']),
+    )
 
 class RefMotivosORM(_BaseMain):
     __tablename__ = "ref_motivos"
@@ -91,4 +96,7 @@ class OperariosORM(_BaseMain):
     # Relacion Operaro - Linea -> 1 Operario trabaja 1 Linea
     linea = relationship("LineaORM", backref="operario", uselist=False)
     # Relacion con CtrlDefectosORM (uno a muchos)
-    #defectos: Mapped[List["CtrlDefectosORM"]] = relationship("CtrlDefectosORM", back_populates="operario")
\ No newline at end of file
+    #defectos: Mapped[List["CtrlDefectosORM"]] = relationship("CtrlDefectosORM", back_populates="operario")
+
+    # Semi-join de movimientos: búsqueda por código con el turno en el propio índice
+    __table_args__ = (Index('idx_fm_gestion_operarios_codigo_turno', 'OPER_CODIGO', 'OPER_TURNO'),)
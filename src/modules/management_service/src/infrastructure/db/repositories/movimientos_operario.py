@@ -1,7 +1,7 @@
 # repositories.py
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
-from sqlalchemy import func, and_
+from sqlalchemy import func, and_, select
 from datetime import date, datetime
 from typing import List, Optional, Tuple
 
@@ -18,6 +18,8 @@ from src.modules.management_service.src.application.ports.movimientos_operario i
 )
 
 # Importar las excepciones de tu capa de aplicación
+from src.shared.common.count_cache import count_cache
+from src.shared.common.pagination import paginate
 from src.shared.exceptions import AlreadyExistsError, NotFoundError, RepositoryError
 
 
@@ -77,6 +79,7 @@ class WorkerMovementRepository(IWorkerMovementRepository):
             new_movement_orm = WorkerMovementORM(**movement_data.model_dump())
             self.db.add(new_movement_orm)
             self.db.commit()
+            count_cache.invalidate(WorkerMovementORM.__tablename__)
             self.db.refresh(new_movement_orm)
             return self._to_domain_entity(new_movement_orm)
         except IntegrityError as e:
@@ -99,6 +102,7 @@ class WorkerMovementRepository(IWorkerMovementRepository):
             
         try:
             self.db.commit()
+            count_cache.invalidate(WorkerMovementORM.__tablename__)
             self.db.refresh(movement_orm)
             return self._to_domain_entity(movement_orm)
         except SQLAlchemyError as e:
@@ -113,6 +117,7 @@ class WorkerMovementRepository(IWorkerMovementRepository):
         try:
             self.db.delete(movement_orm)
             self.db.commit()
+            count_cache.invalidate(WorkerMovementORM.__tablename__)
             return True
         except SQLAlchemyError as e:
             self.db.rollback()
@@ -130,12 +135,17 @@ class WorkerMovementRepository(IWorkerMovementRepository):
         # El usuario solo puede consultar las líneas que tiene asignadas.
         conditions.append(WorkerMovementORM.linea.in_(allowed_lines))
 
-        # Hacemos el JOIN con la tabla de operarios
-        query = query.join(
-            OperariosORM,
-            WorkerMovementORM.codigo_operario == OperariosORM.OPER_CODIGO
+        # Turnos permitidos: semi-join (EXISTS) contra operarios en lugar de JOIN.
+        # Se resuelve con un seek por (OPER_CODIGO, OPER_TURNO) y no duplica filas
+        # si un código de operario aparece más de una vez en la tabla de operarios.
+        conditions.append(
+            select(OperariosORM.OPER_ID)
+            .where(
+                OperariosORM.OPER_CODIGO == WorkerMovementORM.codigo_operario,
+                OperariosORM.OPER_TURNO.in_(allowed_turnos),
+            )
+            .exists()
         )
-        conditions.append(OperariosORM.OPER_TURNO.in_(allowed_turnos))
 
         # 2. FILTROS OPCIONALES DEL USUARIO
         
@@ -177,30 +187,39 @@ class WorkerMovementRepository(IWorkerMovementRepository):
         except SQLAlchemyError as e:
             raise RepositoryError("Error al contar los movimientos por filtros.") from e
 
+    def count_by_filters_cached(
+        self, filters: WorkerMovementFilters, allowed_lines: List[str], allowed_turnos: List[int]
+    ) -> Tuple[int, bool]:
+        """Igual que count_by_filters, pero reutiliza el total de la caché de conteos si existe."""
+        table = WorkerMovementORM.__tablename__
+        # Las líneas/turnos permitidos forman parte de la clave: el total depende del usuario
+        cache_filters = {
+            **filters.model_dump(include=set(WorkerMovementFilters.model_fields)),
+            "allowed_lines": allowed_lines,
+            "allowed_turnos": allowed_turnos,
+        }
+        cached_total = count_cache.get(table, cache_filters)
+        if cached_total is not None:
+            return cached_total, False
+
+        total_records = self.count_by_filters(filters, allowed_lines, allowed_turnos)
+        count_cache.set(table, cache_filters, total_records)
+        return total_records, True
+
     def get_paginated_by_filters(
         self, filters: WorkerMovementFilters, page: int, page_size: int, allowed_lines: List[str], allowed_turnos: List[int]
     ) -> Tuple[List[WorkerMovement], int]:
         """Obtiene movimientos paginados aplicando filtros de seguridad y de usuario."""
         try:
-            # 1. Obtener el conteo total con los filtros
-            # (Llama al método de conteo que ya tiene la lógica de filtros)
-            total_records = self.count_by_filters(filters, allowed_lines, allowed_turnos)
-            
-            if total_records == 0:
-                return [], 0
-            
-            # 2. Aplicar filtros, paginación y ordenamiento para los datos
+            # 1. Aplicar filtros y ordenamiento para los datos
             base_query = self.db.query(WorkerMovementORM)
             data_query = self._apply_filters(base_query, filters, allowed_lines, allowed_turnos)
             
             # Ordenar por hora/fecha para paginación consistente
             data_query = data_query.order_by(WorkerMovementORM.fecha_p.desc(), WorkerMovementORM.hora.desc())
             
-            # Aplicar paginación
-            offset = (page - 1) * page_size
-            data_query = data_query.limit(page_size).offset(offset)
-            
-            orm_list = data_query.all()
+            # 2. Página y conteo total en una sola consulta
+            orm_list, total_records = paginate(data_query, page, page_size)
             
             domain_entities = [self._to_domain_entity(orm) for orm in orm_list]
             
@@ -237,23 +256,9 @@ class RefMotivoRepository(IRefMotivoRepository):
                 RefMotivosORM.estado == self.ACTIVE_STATUS
             )
             
-            # 2. Conteo Total
-            # (Modificado para usar func.count para eficiencia)
-            total_records = base_query.session.query(func.count(RefMotivosORM.id_motivo)).filter(
-                RefMotivosORM.estado == self.ACTIVE_STATUS
-            ).scalar() or 0
-            
-            if total_records == 0:
-                return [], 0
-            
-            # 3. Paginación y Datos (Ordenado por descripción)
-            offset = (page - 1) * page_size
-            orm_list = (
-                base_query
-                .order_by(RefMotivosORM.descripcion.asc())
-                .limit(page_size)
-                .offset(offset)
-                .all()
+            # 2. Paginación, datos y conteo total (Ordenado por descripción)
+            orm_list, total_records = paginate(
+                base_query.order_by(RefMotivosORM.descripcion.asc()), page, page_size
             )
             
             domain_entities = [self._to_domain_entity(orm) for orm in orm_list]
@@ -287,23 +292,9 @@ class RefDestinoMotivoRepository(IRefDestinoMotivoRepository):
                 RefDestinosMotivosORM.id_motivo == id_motivo
             )
             
-            # 2. Conteo Total
-            # (Modificado para usar func.count para eficiencia)
-            total_records = base_query.session.query(func.count(RefDestinosMotivosORM.id_destino)).filter(
-                RefDestinosMotivosORM.id_motivo == id_motivo
-            ).scalar() or 0
-            
-            if total_records == 0:
-                return [], 0
-            
-            # 3. Paginación y Datos (Ordenado por nombre de destino)
-            offset = (page - 1) * page_size
-            orm_list = (
-                base_query
-                .order_by(RefDestinosMotivosORM.nombre_destino.asc())
-                .limit(page_size)
-                .offset(offset)
-                .all()
+            # 2. Paginación, datos y conteo total (Ordenado por nombre de destino)
+            orm_list, total_records = paginate(
+                base_query.order_by(RefDestinosMotivosORM.nombre_destino.asc()), page, page_size
             )
             
             domain_entities = [self._to_domain_entity(orm) for orm in orm_list]
@@ -0,0 +1,109 @@
+from typing import List, Optional, Tuple
+
+from sqlalchemy import and_, func, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.modules.management_service.src.application.ports.movimientos_operario import IAsyncWorkerMovementRepository
+from src.modules.management_service.src.domain.entities import WorkerMovement
+from src.modules.management_service.src.infrastructure.api.schemas.movimientos_operario import WorkerMovementFilters
+from src.modules.management_service.src.infrastructure.db.models import WorkerMovementORM, OperariosORM
+from src.shared.common.count_cache import count_cache
+from src.shared.common.pagination import paginate_async
+from src.shared.exceptions import RepositoryError
+
+
+class AsyncWorkerMovementRepository(IAsyncWorkerMovementRepository):
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    def _to_domain_entity(self, orm_model: WorkerMovementORM) -> WorkerMovement:
+        """Mapea un objeto ORM a una entidad de Dominio."""
+        return WorkerMovement(
+            id=orm_model.id,
+            linea=orm_model.linea,
+            fecha_p=orm_model.fecha_p,
+            tipo_movimiento=orm_model.tipo_movimiento,
+            motivo=orm_model.motivo,
+            codigo_operario=orm_model.codigo_operario,
+            destino=orm_model.destino,
+            hora=orm_model.hora,
+            observacion=orm_model.observacion,
+        )
+
+    def _apply_filters(
+        self, stmt, filters: WorkerMovementFilters, allowed_lines: List[str], allowed_turnos: List[int]
+    ):
+        """Mismos filtros que WorkerMovementRepository._apply_filters (seguridad + usuario)."""
+        conditions = [WorkerMovementORM.linea.in_(allowed_lines)]
+
+        conditions.append(
+            select(OperariosORM.OPER_ID)
+            .where(
+                OperariosORM.OPER_CODIGO == WorkerMovementORM.codigo_operario,
+                OperariosORM.OPER_TURNO.in_(allowed_turnos),
+            )
+            .exists()
+        )
+
+        if filters.fecha_inicial and filters.fecha_final:
+            conditions.append(
+                WorkerMovementORM.fecha_p.between(filters.fecha_inicial, filters.fecha_final)
+            )
+
+        if filters.codigo_operario:
+            conditions.append(
+                WorkerMovementORM.codigo_operario == filters.codigo_operario
+            )
+
+        if filters.linea:
+            conditions.append(
+                WorkerMovementORM.linea == filters.linea
+            )
+
+        return stmt.where(and_(*conditions))
+
+    def _count_cache_filters(
+        self, filters: WorkerMovementFilters, allowed_lines: List[str], allowed_turnos: List[int]
+    ) -> dict:
+        # Las líneas/turnos permitidos forman parte de la clave: el total depende del usuario
+        return {
+            **filters.model_dump(include=set(WorkerMovementFilters.model_fields)),
+            "allowed_lines": allowed_lines,
+            "allowed_turnos": allowed_turnos,
+        }
+
+    async def count_by_filters(self, filters: WorkerMovementFilters, allowed_lines: List[str], allowed_turnos: List[int]) -> int:
+        """Cuenta movimientos aplicando filtros de seguridad y de usuario."""
+        try:
+            stmt = select(func.count(WorkerMovementORM.id)).select_from(WorkerMovementORM)
+            stmt = self._apply_filters(stmt, filters, allowed_lines, allowed_turnos)
+            result = await self.db.execute(stmt)
+            return result.scalar() or 0
+        except SQLAlchemyError as e:
+            raise RepositoryError("Error al contar los movimientos por filtros.") from e
+
+    async def get_paginated_by_filters(
+        self, filters: WorkerMovementFilters, page: int, page_size: int, allowed_lines: List[str], allowed_turnos: List[int],
+        include_total: bool = True
+    ) -> Tuple[List[WorkerMovement], Optional[int], bool]:
+        """Obtiene movimientos paginados aplicando filtros de seguridad y de usuario."""
+        table = WorkerMovementORM.__tablename__
+        cache_filters = self._count_cache_filters(filters, allowed_lines, allowed_turnos)
+        cached_total = count_cache.get(table, cache_filters) if include_total else None
+        try:
+            stmt = self._apply_filters(select(WorkerMovementORM), filters, allowed_lines, allowed_turnos)
+            stmt = stmt.order_by(WorkerMovementORM.fecha_p.desc(), WorkerMovementORM.hora.desc())
+
+            orm_list, total_records = await paginate_async(
+                self.db, stmt, page, page_size, with_total=include_total and cached_total is None
+            )
+            domain_entities = [self._to_domain_entity(orm) for orm in orm_list]
+
+            if cached_total is not None:
+                return domain_entities, cached_total, False
+            if total_records is not None:
+                count_cache.set(table, cache_filters, total_records)
+            return domain_entities, total_records, True
+        except SQLAlchemyError as e:
+            raise RepositoryError("Error al obtener movimientos paginados.") from e
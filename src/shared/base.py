@@ -1,4 +1,4 @@
-from .database import SessionLocalMain, SessionLocalAuth
+from .database import SessionLocalMain, SessionLocalAuth, AsyncSessionLocalMain, AsyncSessionLocalAuth
 
 
 def get_db():
@@ -12,4 +12,14 @@ def get_auth_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocalMain() as db:
+        yield db
+
+
+async def get_async_auth_db():
+    async with AsyncSessionLocalAuth() as db:
+        yield db
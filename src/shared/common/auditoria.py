@@ -1,15 +1,47 @@
 ## INICIO BLOQUE DE AUDITORIA
+from typing import Any, Dict, List
+
 from fastapi import Depends
 from sqlalchemy.orm import Session
 from src.modules.auth_service.src.application.use_cases.audit_use_case import AuditUseCase
+from src.modules.auth_service.src.infrastructure.audit.audit_writer import AuditLogWriter
 from src.modules.auth_service.src.infrastructure.db.repositories.auditoria_log_repository import AuditoriaLogRepository
 from src.modules.auth_service.src.infrastructure.db.repositories.usuario_repository import UsuarioRepository
 from src.shared.base import get_auth_db
+from src.shared.config import settings
+from src.shared.database import SessionLocalAuth
+
+
+def _persist_audit_batch(logs: List[Dict[str, Any]]) -> bool:
+    """Escribe un lote desde el hilo de auditoría con su propia sesión."""
+    db = SessionLocalAuth()
+    try:
+        return AuditUseCase(
+            log_repository=AuditoriaLogRepository(db),
+            user_repository=UsuarioRepository(db)
+        ).persist_logs(logs)
+    finally:
+        db.close()
+
+
+# Escritor global (uno por proceso)
+audit_writer = AuditLogWriter(
+    persist_batch=_persist_audit_batch,
+    max_queue_size=settings.AUDIT_QUEUE_MAX_SIZE,
+    batch_size=settings.AUDIT_BATCH_SIZE,
+    flush_interval_seconds=settings.AUDIT_FLUSH_INTERVAL_SECONDS,
+    put_timeout_seconds=settings.AUDIT_ENQUEUE_TIMEOUT_SECONDS,
+    spill_path=settings.AUDIT_SPILL_PATH,
+    spill_replay_interval_seconds=settings.AUDIT_SPILL_REPLAY_INTERVAL_SECONDS,
+)
+
+
 def get_audit_use_case(
     db_auth: Session = Depends(get_auth_db)
 ) -> AuditUseCase:
     """Dependencia para el caso de uso de Auditoría"""
     return AuditUseCase(
         log_repository=AuditoriaLogRepository(db_auth),
-        user_repository=UsuarioRepository(db_auth)
+        user_repository=UsuarioRepository(db_auth),
+        log_writer=audit_writer if settings.AUDIT_ASYNC_ENABLED else None
     )
@@ -0,0 +1,62 @@
+from datetime import date
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from src.shared.common.cache import TTLCache
+from src.shared.config import settings
+
+
+class CountCache:
+    """
+    Caché de totales (COUNT) por tabla y conjunto de filtros normalizado.
+
+    Los repositorios invalidan la tabla completa en cada escritura que pasa por
+    ellos; las inserciones externas (tabletas, PLC) solo se reflejan al vencer
+    el TTL, por eso un total servido desde aquí se informa como aproximado.
+    """
+
+    def __init__(self, ttl_seconds: float, max_size: int):
+        self._cache = TTLCache(ttl_seconds=ttl_seconds, max_size=max_size)
+
+    @staticmethod
+    def _normalize(value: Any) -> Hashable:
+        if isinstance(value, (list, tuple, set)):
+            return tuple(sorted(str(v) for v in value))
+        if isinstance(value, date):
+            return value.isoformat()
+        return value
+
+    def _key(self, table: str, filters: Dict[str, Any]) -> Tuple[str, Tuple]:
+        normalized = tuple(sorted(
+            (name, self._normalize(value))
+            for name, value in filters.items()
+            if value is not None and value != ""
+        ))
+        return table, normalized
+
+    def get(self, table: str, filters: Dict[str, Any]) -> Optional[int]:
+        return self._cache.get(self._key(table, filters))
+
+    def set(self, table: str, filters: Dict[str, Any], total: int) -> None:
+        self._cache.set(self._key(table, filters), total)
+
+    def invalidate(self, table: str) -> None:
+        self._cache.delete_where(lambda key, _: key[0] == table)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+# Los endpoints /total devuelven el número directamente en `data`; el origen
+# del conteo se informa en esta cabecera para no romper el contrato.
+TOTAL_SOURCE_HEADER = "X-Total-Source"
+
+
+def total_source(total_is_exact: bool) -> str:
+    return "exact" if total_is_exact else "cached"
+
+
+count_cache = CountCache(
+    ttl_seconds=settings.COUNT_CACHE_TTL_SECONDS,
+    max_size=settings.COUNT_CACHE_MAX_SIZE,
+)
+
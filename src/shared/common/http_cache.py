@@ -0,0 +1,67 @@
+import hashlib
+from typing import Any, Callable, Hashable, Optional
+
+from fastapi import Request, status
+from fastapi.responses import Response
+
+from src.shared.common.cache import TTLCache
+from src.shared.common.reference_cache import reference_cache
+from src.shared.common.responses import dumps_json
+from src.shared.config import settings
+
+# Cuerpos ya serializados por (entidad, clave); cada entrada guarda la versión
+# de la entidad con la que se generó y vive como máximo el TTL de la entidad.
+_body_cache = TTLCache(ttl_seconds=24 * 3600, max_size=settings.HTTP_CACHE_MAX_SIZE)
+
+
+def _etag(body: bytes) -> str:
+    """ETag fuerte a partir del contenido: igual en todos los workers para el mismo cuerpo."""
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Comparación débil de If-None-Match (RFC 9110): se ignora el prefijo W/."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (value.strip() for value in if_none_match.split(","))
+    return any(value.removeprefix("W/") == etag for value in candidates)
+
+
+def _cache_headers(etag: str) -> dict:
+    return {
+        "ETag": etag,
+        "Cache-Control": f"private, max-age={settings.HTTP_CACHE_MAX_AGE_SECONDS}, must-revalidate",
+    }
+
+
+def cached_success_response(request: Request, entity: Optional[str], key: Hashable,
+                            build_data: Callable[[], Any], message: str) -> Response:
+    """
+    Equivalente a `success_response` para endpoints de datos de referencia, con
+    ETag / If-None-Match / Cache-Control.
+
+    Mientras la versión de `entity` en la caché de referencia no cambie, el
+    cuerpo serializado se reutiliza: un 304 no llama a `build_data` (ni a la
+    base de datos) ni vuelve a serializar. Con `entity=None` (datos estáticos o
+    sin caché de referencia) el cuerpo se genera en cada petición y solo se
+    ahorra la transferencia cuando el cliente ya lo tiene.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    cache_key = (entity, key)
+
+    cached = _body_cache.get(cache_key) if entity else None
+    if cached is not None and cached[0] == reference_cache.version(entity):
+        _, etag, body = cached
+    else:
+        version = reference_cache.version(entity) if entity else None
+        body = dumps_json({"success": True, "message": message, "data": build_data()})
+        etag = _etag(body)
+        if entity and version == reference_cache.version(entity):
+            _body_cache.set(cache_key, (version, etag, body), ttl=reference_cache.ttl(entity))
+
+    headers = _cache_headers(etag)
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,95 @@
+import base64
+import binascii
+import json
+from datetime import date
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import and_, func, or_, select
+
+from src.shared.exceptions import ValidationError
+
+
+def paginate(query, page: int, page_size: int, with_total: bool = True) -> Tuple[List[Any], Optional[int]]:
+    """
+    Obtiene una página de un `Query` (ya filtrado y ordenado) y el total de
+    registros en un solo round-trip usando COUNT(*) OVER().
+
+    Con `with_total=False` no se calcula el total y se devuelve None.
+    """
+    offset = (page - 1) * page_size
+    if not with_total:
+        return query.limit(page_size).offset(offset).all(), None
+
+    rows = (
+        query.add_columns(func.count().over().label("total_count"))
+        .limit(page_size)
+        .offset(offset)
+        .all()
+    )
+    if rows:
+        return [row[0] for row in rows], rows[0][-1]
+    if page == 1:
+        return [], 0
+    # Página fuera de rango: la ventana no devuelve filas, se cuenta aparte
+    return [], query.order_by(None).count()
+
+
+async def paginate_async(db, stmt, page: int, page_size: int, with_total: bool = True,
+                         scalars: bool = True) -> Tuple[List[Any], Optional[int]]:
+    """
+    Equivalente de `paginate` para un `select()` ejecutado sobre AsyncSession.
+
+    Con `scalars=False` se devuelven las filas completas (p. ej. columnas de un
+    UNION) en lugar de la primera entidad de cada fila.
+    """
+    offset = (page - 1) * page_size
+    if not with_total:
+        result = await db.execute(stmt.limit(page_size).offset(offset))
+        return list(result.scalars().all() if scalars else result.all()), None
+
+    result = await db.execute(
+        stmt.add_columns(func.count().over().label("total_count"))
+        .limit(page_size)
+        .offset(offset)
+    )
+    rows = result.all()
+    if rows:
+        return [row[0] if scalars else row for row in rows], rows[0][-1]
+    if page == 1:
+        return [], 0
+    total = await db.execute(select(func.count()).select_from(stmt.order_by(None).subquery()))
+    return [], total.scalar() or 0
+
+
+def encode_cursor(fecha: Optional[date], last_id: int) -> str:
+    """Cursor opaco (base64 url-safe) con la última clave (fecha, id) entregada."""
+    payload = {"f": fecha.isoformat() if fecha else None, "i": last_id}
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Optional[date], int]:
+    """Inverso de `encode_cursor`; lanza ValidationError si el cursor no es válido."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        fecha = date.fromisoformat(payload["f"]) if payload["f"] else None
+        return fecha, int(payload["i"])
+    except (ValueError, KeyError, TypeError, binascii.Error, UnicodeEncodeError):
+        raise ValidationError("Cursor de paginación inválido.")
+
+
+def keyset_after(fecha_col, id_col, fecha: Optional[date], last_id: int):
+    """
+    Condición "siguiente página" para el orden (fecha DESC, id DESC).
+
+    SQL Server y SQLite ordenan los NULL como el menor valor, por lo que en
+    orden descendente las filas sin fecha quedan al final.
+    """
+    if fecha is None:
+        return and_(fecha_col.is_(None), id_col < last_id)
+    return or_(
+        fecha_col < fecha,
+        and_(fecha_col == fecha, id_col < last_id),
+        fecha_col.is_(None),
+    )
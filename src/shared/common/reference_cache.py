@@ -0,0 +1,85 @@
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+from src.shared.common.cache import TTLCache
+from src.shared.config import settings
+
+# Entidades de referencia (catálogos que cambian pocas veces al mes)
+ESPECIES = "especies"
+PLANTAS = "plantas"
+LINEAS = "lineas"
+AREAS_OPERARIOS = "areas_operarios"
+TURNOS = "turnos"
+TARAS = "taras"
+
+
+class ReferenceCache:
+    """
+    Caché read-through para datos de referencia, con TTL por entidad y versión.
+
+    - `get_or_load(entidad, clave, loader)` devuelve el valor cacheado o ejecuta
+      `loader` y guarda el resultado con el TTL de la entidad.
+    - Cada entidad tiene un número de versión que `invalidate` incrementa. Un
+      valor solo se guarda si la versión no cambió mientras se cargaba, así una
+      escritura concurrente no deja en caché datos anteriores a ella.
+    - La invalidación es local al proceso: con varios workers, los demás sirven
+      el valor anterior como máximo hasta que vence su TTL.
+    - Un TTL <= 0 deshabilita la caché para esa entidad.
+    """
+
+    def __init__(self, ttls: Dict[str, float], max_size: int):
+        self._ttls = dict(ttls)
+        self._cache = TTLCache(ttl_seconds=max(self._ttls.values(), default=0), max_size=max_size)
+        self._versions: Dict[str, int] = {entity: 0 for entity in self._ttls}
+        self._lock = threading.Lock()
+
+    def ttl(self, entity: str) -> float:
+        return self._ttls.get(entity, 0)
+
+    def version(self, entity: str) -> int:
+        with self._lock:
+            return self._versions.get(entity, 0)
+
+    def get_or_load(self, entity: str, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Los valores None no se cachean (p. ej. un get_by_id sin resultado)."""
+        ttl = self.ttl(entity)
+        if ttl <= 0:
+            return loader()
+
+        cache_key = (entity, key)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            version, value = cached
+            if version == self.version(entity):
+                return value
+
+        version = self.version(entity)
+        value = loader()
+        if value is not None and version == self.version(entity):
+            self._cache.set(cache_key, (version, value), ttl=ttl)
+        return value
+
+    def invalidate(self, entity: str) -> None:
+        """Descarta todas las entradas de la entidad y avanza su versión."""
+        with self._lock:
+            self._versions[entity] = self._versions.get(entity, 0) + 1
+        self._cache.delete_where(lambda key, _: key[0] == entity)
+
+    def clear(self) -> None:
+        with self._lock:
+            for entity in self._versions:
+                self._versions[entity] += 1
+        self._cache.clear()
+
+
+reference_cache = ReferenceCache(
+    ttls={
+        ESPECIES: settings.REFERENCE_CACHE_ESPECIES_TTL_SECONDS,
+        PLANTAS: settings.REFERENCE_CACHE_PLANTAS_TTL_SECONDS,
+        LINEAS: settings.REFERENCE_CACHE_LINEAS_TTL_SECONDS,
+        AREAS_OPERARIOS: settings.REFERENCE_CACHE_AREAS_TTL_SECONDS,
+        TURNOS: settings.REFERENCE_CACHE_TURNOS_TTL_SECONDS,
+        TARAS: settings.REFERENCE_CACHE_TARAS_TTL_SECONDS,
+    },
+    max_size=settings.REFERENCE_CACHE_MAX_SIZE,
+)
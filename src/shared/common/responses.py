@@ -1,8 +1,16 @@
+import json
 from fastapi import status
 from fastapi.responses import JSONResponse
+from pydantic import BaseModel
 from typing import List, Dict, Any
 from decimal import Decimal
-from datetime import datetime, date
+from datetime import datetime, date, time
+from uuid import UUID
+
+try:
+    import orjson
+except ImportError:  # Dependencia opcional: sin ella se usa el encoder json de la stdlib
+    orjson = None
 
 
 def convert_decimals(obj):
@@ -34,16 +42,52 @@ def convert_non_serializable(obj):
         return obj
 
 
+def _json_default(obj):
+    """
+    Tipos que el encoder no serializa por sí mismo. Solo se invoca para esos
+    valores, sin recorrer de antemano todo el payload.
+    """
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, UUID):
+        return str(obj)
+    if hasattr(obj, "__dict__"):
+        # Dataclasses de dominio y otros objetos simples (sin atributos internos)
+        return {k: v for k, v in vars(obj).items() if not k.startswith("_")}
+    raise TypeError(f"Objeto de tipo {type(obj).__name__} no serializable a JSON")
+
+
+def dumps_json(content: Any) -> bytes:
+    """Serializa en una sola pasada con orjson si está instalado, o con json en su defecto."""
+    if orjson is not None:
+        return orjson.dumps(content, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        content,
+        default=_json_default,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse que serializa Pydantic, dataclasses, Decimal y fechas directamente."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps_json(content)
+
+
 def success_response(data: Any, message: str, status_code: int = 200) -> JSONResponse:
     """
     Genera una respuesta JSON exitosa.
     """
-    # Convierte todos los Decimal a float antes de serializar
-    cleaned_data = convert_non_serializable(data)
-
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=status_code,
-        content={"success": True, "message": message, "data": cleaned_data},
+        content={"success": True, "message": message, "data": data},
     )
 
 
@@ -0,0 +1,57 @@
+import csv
+import io
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, AsyncIterator, Dict, List, Sequence
+
+from fastapi.responses import StreamingResponse
+
+from src.shared.common.responses import dumps_json
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
+async def ndjson_chunks(batches: AsyncIterator[List[Dict[str, Any]]]) -> AsyncIterator[bytes]:
+    """Un objeto JSON por línea; cada lote se emite como un único chunk."""
+    async for batch in batches:
+        if batch:
+            yield b"".join(dumps_json(row) + b"\n" for row in batch)
+
+
+async def csv_chunks(batches: AsyncIterator[List[Dict[str, Any]]], columns: Sequence[str]) -> AsyncIterator[bytes]:
+    """Cabecera con `columns` y luego un chunk por lote."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    writer.writerow(columns)
+    yield buffer.getvalue().encode("utf-8")
+
+    async for batch in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows([_csv_value(row.get(column)) for column in columns] for row in batch)
+        yield buffer.getvalue().encode("utf-8")
+
+
+def export_response(batches: AsyncIterator[List[Dict[str, Any]]], formato: str, columns: Sequence[str],
+                    filename: str) -> StreamingResponse:
+    """StreamingResponse NDJSON o CSV a partir de un generador de lotes de filas."""
+    chunks = csv_chunks(batches, columns) if formato == "csv" else ndjson_chunks(batches)
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[formato],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{formato}"'},
+    )
@@ -0,0 +1,199 @@
+"""
+Compresión negociada (brotli / gzip) de las respuestas del gateway.
+"""
+import zlib
+from typing import Iterable, Optional
+
+from fastapi import FastAPI
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .config import settings
+
+try:
+    import brotli
+except ImportError:  # Dependencia opcional: sin ella solo se negocia gzip
+    brotli = None
+
+# Tipos que vale la pena comprimir; Parquet ya viaja comprimido (zstd)
+COMPRESSIBLE_MEDIA_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/vnd.apache.arrow.stream",
+    "text/",
+)
+
+
+class _GzipEncoder:
+    def __init__(self, level: int):
+        # wbits=31: formato gzip (cabecera + CRC) en lugar de zlib
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class _BrotliEncoder:
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """Elige "br" o "gzip" según Accept-Encoding (con pesos q); None si ninguno es aceptable."""
+    supported = ("br", "gzip") if brotli is not None else ("gzip",)
+    weights = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name] = q
+
+    best, best_q = None, 0.0
+    for encoding in supported:  # en empate gana el primero (br)
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+class CompressionMiddleware:
+    """
+    Middleware ASGI que comprime con brotli o gzip las respuestas compresibles.
+
+    - Respuestas completas: solo se comprimen a partir de `minimum_size` bytes.
+    - StreamingResponse: cada fragmento se comprime y se vacía al cliente en
+      cuanto llega (la exportación sigue siendo progresiva).
+    - No toca respuestas ya codificadas, 204/304, ni `Cache-Control: no-transform`.
+    - El ETag de una respuesta comprimida se marca como débil (W/), ya que la
+      representación cambia; If-None-Match lo compara de forma débil.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, gzip_level: int = 6,
+                 brotli_quality: int = 4, media_types: Iterable[str] = COMPRESSIBLE_MEDIA_TYPES):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.media_types = tuple(media_types)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+    def new_encoder(self, encoding: str):
+        if encoding == "br":
+            return _BrotliEncoder(self.brotli_quality)
+        return _GzipEncoder(self.gzip_level)
+
+
+class _CompressionResponder:
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self._start_message: Optional[Message] = None
+        self._encoder = None
+        self._passthrough = False
+
+    def _is_compressible(self, headers: Headers, status: int) -> bool:
+        if status in (204, 304) or "content-encoding" in headers:
+            return False
+        if "no-transform" in headers.get("cache-control", "").lower():
+            return False
+        content_type = headers.get("content-type", "").lower()
+        return content_type.startswith(self.middleware.media_types)
+
+    def _prepare_headers(self) -> MutableHeaders:
+        headers = MutableHeaders(raw=self._start_message["headers"])
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = "W/" + etag
+        return headers
+
+    async def send(self, message: Message) -> None:
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            self._start_message = message
+            return
+        if message_type != "http.response.body" or self._passthrough:
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self._encoder is None:
+            headers = Headers(raw=self._start_message["headers"])
+            compressible = self._is_compressible(headers, self._start_message["status"])
+            if not compressible or (not more_body and len(body) < self.middleware.minimum_size):
+                self._passthrough = True
+                await self._send(self._start_message)
+                await self._send(message)
+                return
+
+            self._encoder = self.middleware.new_encoder(self.encoding)
+            mutable_headers = self._prepare_headers()
+            if not more_body:
+                compressed = self._encoder.compress(body) + self._encoder.finish()
+                mutable_headers["Content-Length"] = str(len(compressed))
+                await self._send(self._start_message)
+                await self._send({"type": "http.response.body", "body": compressed, "more_body": False})
+                return
+
+            # Streaming: la longitud final no se conoce
+            del mutable_headers["Content-Length"]
+            await self._send(self._start_message)
+
+        if more_body:
+            chunk = self._encoder.compress(body) + self._encoder.flush()
+        else:
+            chunk = self._encoder.compress(body) + self._encoder.finish()
+        await self._send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+
+def configure_compression(app: FastAPI, service_name: str = "API") -> None:
+    """Instala la compresión de respuestas según la configuración."""
+    if not settings.COMPRESSION_ENABLED:
+        return
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+    )
+    encodings = "br, gzip" if brotli is not None else "gzip"
+    print(f"[{service_name}] Compresión configurada: {encodings} (mínimo {settings.COMPRESSION_MINIMUM_SIZE} bytes)")
@@ -46,6 +46,20 @@ class Settings(BaseSettings):
     AUTH_DB_TRUST_CERTIFICATE: str 
     AUTH_DATABASE_URL: Optional[str] = None
 
+    # --- Capa async (aioodbc / aiosqlite); si no se definen se derivan de las URLs síncronas ---
+    ASYNC_DATABASE_URL: Optional[str] = None
+    ASYNC_AUTH_DATABASE_URL: Optional[str] = None
+
+    # --- Pool de conexiones (aplica a ambas bases de datos) ---
+    DB_POOL_SIZE: int = 10
+    DB_POOL_MAX_OVERFLOW: int = 20
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_USE_LIFO: bool = True
+    DB_FAST_EXECUTEMANY: bool = True
+    DB_ODBC_POOLING: bool = True
+
     # Servicios
     MANAGEMENT_SERVICE_HOST: str = "localhost"
     MANAGEMENT_SERVICE_PORT: int = 8001
@@ -76,6 +90,74 @@ class Settings(BaseSettings):
     JWT_SECRET_KEY: str
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRATION_MINUTES: int
+    # Caché de firmas JWT ya verificadas (0 deshabilita)
+    JWT_VERIFIED_CACHE_TTL_SECONDS: int = 300
+    JWT_VERIFIED_CACHE_MAX_SIZE: int = 4096
+
+    # Caché de sesiones verificadas (0 deshabilita)
+    AUTH_SESSION_CACHE_TTL_SECONDS: int = 30
+    AUTH_SESSION_CACHE_MAX_SIZE: int = 2048
+
+    # Caché del snapshot de usuario usado por la auditoría (0 deshabilita)
+    USER_SNAPSHOT_CACHE_TTL_SECONDS: int = 600
+    USER_SNAPSHOT_CACHE_MAX_SIZE: int = 1024
+
+    # Caché de totales de paginación por (tabla, filtros) (0 deshabilita)
+    COUNT_CACHE_TTL_SECONDS: int = 15
+    COUNT_CACHE_MAX_SIZE: int = 1024
+
+    # Caché de datos de referencia (especies, plantas, líneas, áreas, turnos, taras); 0 deshabilita
+    REFERENCE_CACHE_MAX_SIZE: int = 512
+    REFERENCE_CACHE_ESPECIES_TTL_SECONDS: int = 3600
+    REFERENCE_CACHE_PLANTAS_TTL_SECONDS: int = 3600
+    REFERENCE_CACHE_LINEAS_TTL_SECONDS: int = 900
+    REFERENCE_CACHE_AREAS_TTL_SECONDS: int = 3600
+    REFERENCE_CACHE_TURNOS_TTL_SECONDS: int = 900
+    REFERENCE_CACHE_TARAS_TTL_SECONDS: int = 900
+
+    # Compresión de respuestas (br si está instalado brotli, si no gzip)
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+
+    # Métricas Prometheus (latencia por ruta, pools, consultas SQL). Desactivadas por
+    # defecto: el endpoint expone rutas, tráfico y tiempos de BD; con METRICS_TOKEN
+    # solo responde a `Authorization: Bearer <token>`
+    METRICS_ENABLED: bool = False
+    METRICS_PATH: str = "/metrics"
+    METRICS_TOKEN: Optional[str] = None
+
+    # Perfilador SQL por petición (ENABLED = todas; ALLOW_HEADER = solo con `X-SQL-Profile: 1`)
+    SQL_PROFILER_ENABLED: bool = False
+    SQL_PROFILER_ALLOW_HEADER: bool = False
+    SQL_PROFILER_N_PLUS_ONE_THRESHOLD: int = 5
+    SQL_PROFILER_SLOWEST_LIMIT: int = 5
+    SQL_PROFILER_HISTORY_SIZE: int = 200
+
+    # HTTP caching (ETag / Cache-Control) de los endpoints de datos de referencia
+    HTTP_CACHE_MAX_AGE_SECONDS: int = 0
+    HTTP_CACHE_MAX_SIZE: int = 256
+
+    # Exportación en streaming (filas por lote leído del cursor del servidor)
+    EXPORT_BATCH_SIZE: int = 1000
+    # Extracción Arrow/Parquet: lotes grandes, cada uno es un record batch / row group
+    EXTRACT_BATCH_SIZE: int = 50000
+
+    # Escritura de auditoría en segundo plano (False = síncrona dentro de la petición)
+    AUDIT_ASYNC_ENABLED: bool = True
+    AUDIT_QUEUE_MAX_SIZE: int = 10000
+    AUDIT_BATCH_SIZE: int = 500
+    AUDIT_FLUSH_INTERVAL_SECONDS: float = 1.0
+    AUDIT_ENQUEUE_TIMEOUT_SECONDS: float = 0.5
+    # Nombre base: cada proceso escribe en su propio archivo (audit_spill.<pid>.jsonl)
+    AUDIT_SPILL_PATH: str = "logs/audit_spill.jsonl"
+    AUDIT_SPILL_REPLAY_INTERVAL_SECONDS: int = 60
+    AUDIT_SHUTDOWN_TIMEOUT_SECONDS: int = 10
+
+    # Autorización sin estado: bitmask de permisos por módulo dentro del JWT
+    AUTH_PERMISSION_CLAIMS_ENABLED: bool = False
+    AUTH_REVOCATION_CACHE_TTL_SECONDS: int = 15
 
     @property
     def database_url(self) -> str:
@@ -98,6 +180,28 @@ class Settings(BaseSettings):
             f"?driver={self.AUTH_DB_DRIVER}&TrustServerCertificate={self.AUTH_DB_TRUST_CERTIFICATE}"
         )
 
+    @staticmethod
+    def _to_async_url(url: str) -> str:
+        """Cambia el driver síncrono por su equivalente async."""
+        for sync_prefix, async_prefix in (
+            ("mssql+pyodbc://", "mssql+aioodbc://"),
+            ("sqlite+pysqlite://", "sqlite+aiosqlite://"),
+            ("sqlite://", "sqlite+aiosqlite://"),
+        ):
+            if url.startswith(sync_prefix):
+                return async_prefix + url[len(sync_prefix):]
+        return url
+
+    @property
+    def async_database_url(self) -> str:
+        """URL async para la base de datos principal."""
+        return self.ASYNC_DATABASE_URL or self._to_async_url(self.database_url)
+
+    @property
+    def async_auth_database_url(self) -> str:
+        """URL async para la base de datos de autenticación."""
+        return self.ASYNC_AUTH_DATABASE_URL or self._to_async_url(self.auth_database_url)
+
     @property
     def management_service_url(self) -> str:
         return f"http://{self.MANAGEMENT_SERVICE_HOST}:{self.MANAGEMENT_SERVICE_PORT}"
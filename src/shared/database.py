@@ -1,19 +1,75 @@
+from typing import Any, Dict
+
 from sqlalchemy import create_engine, Column, DateTime, Boolean
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.sql import func
 from .config import settings
+from .db_pool import engine_kwargs, instrument_engine, pool_metrics
+from .metrics import instrument_queries
+from .sql_profiler import instrument_profiler
 
-# Configuración específica para SQL Server
-engine_main = create_engine(settings.database_url, pool_pre_ping=True)
+# Configuración específica para SQL Server (pool configurable desde Settings)
+engine_main = create_engine(settings.database_url, **engine_kwargs(settings.database_url))
+instrument_engine(engine_main)
+instrument_queries(engine_main, "main")
+instrument_profiler(engine_main, "main")
 SessionLocalMain = sessionmaker(autocommit=False, autoflush=False, bind=engine_main)
 BaseMain = declarative_base()
 
 # --- Conexión a la Base de Datos de Autenticación (NUEVO) ---
-engine_auth = create_engine(settings.auth_database_url, pool_pre_ping=True)
+engine_auth = create_engine(settings.auth_database_url, **engine_kwargs(settings.auth_database_url))
+instrument_engine(engine_auth)
+instrument_queries(engine_auth, "auth")
+instrument_profiler(engine_auth, "auth")
 SessionLocalAuth = sessionmaker(autocommit=False, autoflush=False, bind=engine_auth)
 BaseAuth = declarative_base()
 
 # Clase base declarativa
 _BaseMain = BaseMain
-_BaseAuth = BaseAuth
\ No newline at end of file
+_BaseAuth = BaseAuth
+
+# --- Capa async ---
+# Los engines async se crean al primer uso para no exigir aioodbc/aiosqlite
+# en procesos que solo usan la capa síncrona (alembic, scripts).
+_async_engines: Dict[str, AsyncEngine] = {}
+_async_sessionmakers: Dict[str, async_sessionmaker] = {}
+
+
+def _get_async_sessionmaker(name: str, url: str) -> async_sessionmaker:
+    if name not in _async_sessionmakers:
+        engine = create_async_engine(url, **engine_kwargs(url, is_async=True))
+        instrument_engine(engine.sync_engine)
+        instrument_queries(engine.sync_engine, f"{name}_async")
+        instrument_profiler(engine.sync_engine, f"{name}_async")
+        _async_engines[name] = engine
+        _async_sessionmakers[name] = async_sessionmaker(
+            bind=engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+        )
+    return _async_sessionmakers[name]
+
+
+def AsyncSessionLocalMain() -> AsyncSession:
+    return _get_async_sessionmaker("main", settings.async_database_url)()
+
+
+def AsyncSessionLocalAuth() -> AsyncSession:
+    return _get_async_sessionmaker("auth", settings.async_auth_database_url)()
+
+
+async def dispose_async_engines() -> None:
+    """Cierra las conexiones de los engines async (shutdown de la aplicación)."""
+    for engine in _async_engines.values():
+        await engine.dispose()
+
+
+def get_pool_metrics() -> Dict[str, Any]:
+    """Métricas de los pools de conexiones de ambas bases de datos."""
+    metrics = {
+        "main": pool_metrics(engine_main),
+        "auth": pool_metrics(engine_auth),
+    }
+    for name, engine in _async_engines.items():
+        metrics[f"{name}_async"] = pool_metrics(engine.sync_engine)
+    return metrics
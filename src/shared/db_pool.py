@@ -0,0 +1,142 @@
+import threading
+import time
+from typing import Any, Dict
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from .config import settings
+
+
+class PoolStats:
+    """Contadores de uso del pool de conexiones de un engine."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.checkout_wait_seconds_total = 0.0
+        self.checkout_wait_seconds_max = 0.0
+        self.checkout_timeouts = 0
+        self.overflow_events = 0
+        self.connections_created = 0
+        self.invalidations = 0
+
+    def record_checkout(self, wait_seconds: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.checkout_wait_seconds_total += wait_seconds
+            if wait_seconds > self.checkout_wait_seconds_max:
+                self.checkout_wait_seconds_max = wait_seconds
+
+    def increment(self, field: str) -> None:
+        with self._lock:
+            setattr(self, field, getattr(self, field) + 1)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "checkout_wait_seconds_total": round(self.checkout_wait_seconds_total, 6),
+                "checkout_wait_seconds_max": round(self.checkout_wait_seconds_max, 6),
+                "checkout_timeouts": self.checkout_timeouts,
+                "overflow_events": self.overflow_events,
+                "connections_created": self.connections_created,
+                "invalidations": self.invalidations,
+            }
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool que mide el tiempo de espera de cada checkout."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.stats.increment("checkout_timeouts")
+            raise
+        self.stats.record_checkout(time.perf_counter() - start)
+        return connection
+
+    def recreate(self):
+        # Conservar los contadores al recrear el pool (p. ej. tras una desconexión)
+        new_pool = super().recreate()
+        new_pool.stats = self.stats
+        return new_pool
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool, InstrumentedQueuePool):
+    """Variante para AsyncEngine (aioodbc / aiosqlite)."""
+
+
+def _configure_pyodbc() -> None:
+    """Pooling del driver manager ODBC; debe fijarse antes de la primera conexión."""
+    try:
+        import pyodbc
+    except ImportError:
+        return
+    pyodbc.pooling = settings.DB_ODBC_POOLING
+
+
+def engine_kwargs(url: str, is_async: bool = False) -> Dict[str, Any]:
+    """Argumentos de create_engine / create_async_engine según Settings y el dialecto de la URL."""
+    parsed = make_url(url)
+    kwargs: Dict[str, Any] = {"pool_pre_ping": settings.DB_POOL_PRE_PING}
+
+    # SQLite en memoria usa SingletonThreadPool y no acepta parámetros de QueuePool
+    if parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:"):
+        return kwargs
+
+    kwargs.update(
+        poolclass=InstrumentedAsyncAdaptedQueuePool if is_async else InstrumentedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_POOL_MAX_OVERFLOW,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_use_lifo=settings.DB_POOL_USE_LIFO,
+    )
+    if parsed.get_backend_name() == "mssql" and parsed.get_driver_name() in ("pyodbc", "aioodbc"):
+        _configure_pyodbc()
+        kwargs["fast_executemany"] = settings.DB_FAST_EXECUTEMANY
+    return kwargs
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Registra los eventos del pool que alimentan PoolStats."""
+    stats = getattr(engine.pool, "stats", None)
+    if stats is None:
+        return
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        stats.increment("connections_created")
+        if engine.pool.overflow() > 0:
+            stats.increment("overflow_events")
+
+    @event.listens_for(engine, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception):
+        stats.increment("invalidations")
+
+
+def pool_metrics(engine: Engine) -> Dict[str, Any]:
+    """Estado actual del pool y contadores acumulados."""
+    pool = engine.pool
+    metrics: Dict[str, Any] = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        metrics.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+            max_overflow=pool._max_overflow,
+        )
+    stats = getattr(pool, "stats", None)
+    if stats is not None:
+        metrics.update(stats.snapshot())
+    return metrics
@@ -0,0 +1,339 @@
+"""
+Métricas en formato de exposición de Prometheus (texto 0.0.4), sin dependencias externas.
+
+- Latencia, tamaño de petición/respuesta y peticiones en curso por ruta.
+- Ocupación del threadpool de anyio (rutas síncronas).
+- Estado de los pools de SQLAlchemy (`get_pool_metrics`).
+- Número y duración de las consultas SQL, globales y por petición.
+"""
+import contextvars
+import hmac
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from fastapi import FastAPI, Request
+from fastapi.responses import Response
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .config import settings
+
+CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+QUERY_DURATION_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 10.0)
+QUERIES_PER_REQUEST_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 250)
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    metric_type = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.metric_type}"]
+
+
+class Counter(_Metric):
+    metric_type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, labels: Tuple[str, ...] = (), amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def collect(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return self.header() + [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            for labels, value in items
+        ]
+
+
+class Gauge(Counter):
+    metric_type = "gauge"
+
+    def dec(self, labels: Tuple[str, ...] = (), amount: float = 1) -> None:
+        self.inc(labels, -amount)
+
+    def set(self, labels: Tuple[str, ...], value: float) -> None:
+        with self._lock:
+            self._values[labels] = value
+
+
+class Histogram(_Metric):
+    metric_type = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Por etiqueta: (conteo por bucket no acumulado, suma, total)
+        self._values: Dict[Tuple[str, ...], List] = {}
+
+    def observe(self, labels: Tuple[str, ...], value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(labels)
+            if state is None:
+                state = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    def collect(self) -> List[str]:
+        with self._lock:
+            items = sorted((labels, (list(s[0]), s[1], s[2])) for labels, s in self._values.items())
+        lines = self.header()
+        for labels, (bucket_counts, total_sum, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), bucket_counts):
+                cumulative += bucket_count
+                le = 'le="' + _format_value(bound) + '"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}")
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(total_sum)}")
+            lines.append(f"{self.name}_count{label_text} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def collect(self) -> Iterable[str]:
+        for metric in self._metrics:
+            yield from metric.collect()
+
+
+registry = MetricsRegistry()
+
+HTTP_REQUESTS = registry.register(Counter(
+    "http_requests_total", "Peticiones HTTP atendidas.", ("method", "route", "status")))
+HTTP_LATENCY = registry.register(Histogram(
+    "http_request_duration_seconds", "Latencia de las peticiones HTTP.", ("method", "route")))
+HTTP_REQUEST_SIZE = registry.register(Histogram(
+    "http_request_size_bytes", "Tamaño del cuerpo de la petición.", ("method", "route"), SIZE_BUCKETS))
+HTTP_RESPONSE_SIZE = registry.register(Histogram(
+    "http_response_size_bytes", "Bytes de respuesta enviados (tras compresión).", ("method", "route"),
+    SIZE_BUCKETS))
+HTTP_IN_FLIGHT = registry.register(Gauge(
+    "http_requests_in_flight", "Peticiones HTTP en curso."))
+DB_QUERIES = registry.register(Counter(
+    "db_queries_total", "Consultas SQL ejecutadas.", ("database",)))
+DB_QUERY_DURATION = registry.register(Histogram(
+    "db_query_duration_seconds", "Duración de las consultas SQL.", ("database",), QUERY_DURATION_BUCKETS))
+DB_QUERIES_PER_REQUEST = registry.register(Histogram(
+    "http_request_db_queries", "Consultas SQL por petición.", ("method", "route"), QUERIES_PER_REQUEST_BUCKETS))
+DB_TIME_PER_REQUEST = registry.register(Histogram(
+    "http_request_db_duration_seconds", "Tiempo total en base de datos por petición.", ("method", "route")))
+
+
+class RequestQueryStats:
+    """Consultas de la petición en curso; se comparte con los hilos del threadpool vía contextvars."""
+
+    __slots__ = ("count", "duration")
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+
+_request_query_stats: contextvars.ContextVar[Optional[RequestQueryStats]] = contextvars.ContextVar(
+    "request_query_stats", default=None
+)
+
+
+def instrument_queries(engine: Engine, database: str) -> None:
+    """Cuenta y mide las consultas de `engine` (globales y por petición)."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("metrics_query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("metrics_query_start")
+        if not starts:
+            return
+        elapsed = time.perf_counter() - starts.pop()
+        DB_QUERIES.inc((database,))
+        DB_QUERY_DURATION.observe((database,), elapsed)
+        stats = _request_query_stats.get()
+        if stats is not None:
+            stats.count += 1
+            stats.duration += elapsed
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(exception_context):
+        connection = exception_context.connection
+        if connection is not None and connection.info.get("metrics_query_start"):
+            connection.info["metrics_query_start"].pop()
+
+
+class MetricsMiddleware:
+    """Middleware ASGI que registra latencia, tamaños y consultas SQL por ruta."""
+
+    def __init__(self, app: ASGIApp, metrics_path: str = "/metrics"):
+        self.app = app
+        self.metrics_path = metrics_path
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] == self.metrics_path:
+            await self.app(scope, receive, send)
+            return
+
+        state = {"status": 500, "request_bytes": 0, "response_bytes": 0}
+        stats = RequestQueryStats()
+        token = _request_query_stats.set(stats)
+
+        async def receive_wrapper() -> Message:
+            message = await receive()
+            if message["type"] == "http.request":
+                state["request_bytes"] += len(message.get("body", b""))
+            return message
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                state["status"] = message["status"]
+            elif message["type"] == "http.response.body":
+                state["response_bytes"] += len(message.get("body", b""))
+            await send(message)
+
+        HTTP_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive_wrapper, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            HTTP_IN_FLIGHT.dec()
+            _request_query_stats.reset(token)
+
+            # Se usa la plantilla de la ruta (no la URL) para acotar la cardinalidad
+            route = scope.get("route")
+            route_label = getattr(route, "path", None) or UNMATCHED_ROUTE
+            labels = (scope["method"], route_label)
+            HTTP_REQUESTS.inc(labels + (str(state["status"]),))
+            HTTP_LATENCY.observe(labels, elapsed)
+            HTTP_REQUEST_SIZE.observe(labels, state["request_bytes"])
+            HTTP_RESPONSE_SIZE.observe(labels, state["response_bytes"])
+            DB_QUERIES_PER_REQUEST.observe(labels, stats.count)
+            DB_TIME_PER_REQUEST.observe(labels, stats.duration)
+
+
+def _threadpool_lines() -> List[str]:
+    """Ocupación del limitador de hilos de anyio (se ejecuta dentro del event loop)."""
+    from anyio import to_thread
+
+    limiter = to_thread.current_default_thread_limiter()
+    statistics = limiter.statistics()
+    samples = (
+        ("threadpool_threads_limit", "Hilos máximos del threadpool de rutas síncronas.", limiter.total_tokens),
+        ("threadpool_threads_busy", "Hilos del threadpool ocupados.", limiter.borrowed_tokens),
+        ("threadpool_tasks_waiting", "Tareas esperando un hilo libre.", statistics.tasks_waiting),
+    )
+    lines = []
+    for name, documentation, value in samples:
+        lines += [f"# HELP {name} {documentation}", f"# TYPE {name} gauge", f"{name} {_format_value(value)}"]
+    return lines
+
+
+# Métricas de get_pool_metrics: (clave, tipo, descripción)
+_POOL_SAMPLES = (
+    ("size", "gauge", "Tamaño configurado del pool."),
+    ("checked_in", "gauge", "Conexiones libres en el pool."),
+    ("checked_out", "gauge", "Conexiones en uso."),
+    ("overflow", "gauge", "Conexiones de overflow abiertas."),
+    ("max_overflow", "gauge", "Máximo de conexiones de overflow."),
+    ("checkouts", "counter", "Checkouts de conexión."),
+    ("checkout_wait_seconds_total", "counter", "Tiempo total esperando un checkout."),
+    ("checkout_wait_seconds_max", "gauge", "Mayor espera de un checkout."),
+    ("checkout_timeouts", "counter", "Checkouts que agotaron DB_POOL_TIMEOUT."),
+    ("overflow_events", "counter", "Conexiones abiertas por encima del pool."),
+    ("connections_created", "counter", "Conexiones físicas creadas."),
+    ("invalidations", "counter", "Conexiones invalidadas."),
+)
+
+
+def _pool_lines() -> List[str]:
+    from .database import get_pool_metrics
+
+    pools = get_pool_metrics()
+    lines = []
+    for key, metric_type, documentation in _POOL_SAMPLES:
+        name = f"db_pool_{key}"
+        if metric_type == "counter" and not name.endswith("_total"):
+            name += "_total"
+        samples = [
+            f'{name}{{pool="{_escape(pool)}"}} {_format_value(values[key])}'
+            for pool, values in pools.items()
+            if isinstance(values.get(key), (int, float))
+        ]
+        if samples:
+            lines += [f"# HELP {name} {documentation}", f"# TYPE {name} {metric_type}"] + samples
+    return lines
+
+
+def render_metrics() -> str:
+    lines = list(registry.collect())
+    lines += _threadpool_lines()
+    lines += _pool_lines()
+    return "\n".join(lines) + "\n"
+
+
+def configure_metrics(app: FastAPI, service_name: str = "API") -> None:
+    """Registra el middleware de métricas y el endpoint de exposición."""
+    if not settings.METRICS_ENABLED:
+        return
+    metrics_path = settings.METRICS_PATH
+    app.add_middleware(MetricsMiddleware, metrics_path=metrics_path)
+
+    expected_authorization = f"Bearer {settings.METRICS_TOKEN}" if settings.METRICS_TOKEN else None
+
+    @app.get(metrics_path, include_in_schema=False)
+    async def metrics(request: Request):
+        if expected_authorization and not hmac.compare_digest(
+            request.headers.get("authorization", "").encode(), expected_authorization.encode()
+        ):
+            return Response(status_code=401, headers={"WWW-Authenticate": "Bearer"})
+        return Response(content=render_metrics(), media_type=CONTENT_TYPE_LATEST)
+
+    protection = "con token" if expected_authorization else "sin autenticación"
+    print(f"[{service_name}] Métricas expuestas en {metrics_path} ({protection})")
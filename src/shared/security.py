@@ -1,12 +1,24 @@
 from fastapi import Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordBearer
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from src.modules.auth_service.src.infrastructure.api.routers.auth import get_auth_use_case
 from src.modules.auth_service.src.application.use_cases.auth_use_cases import AuthUseCase
+from src.modules.auth_service.src.infrastructure.cache.session_cache import session_cache
+from src.shared.database import SessionLocalAuth
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
+
+def _unauthorized() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Token inválido o sesión expirada",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
 def get_current_user_data(
     token: str = Depends(oauth2_scheme),
     auth_use_case: AuthUseCase = Depends(get_auth_use_case)
@@ -19,9 +31,28 @@ def get_current_user_data(
     """
     user_data = auth_use_case.verify_token(token)
     if not user_data:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Token inválido o sesión expirada",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    return user_data
\ No newline at end of file
+        raise _unauthorized()
+    return user_data
+
+
+def _verify_token_sync(token: str) -> Optional[Dict[str, Any]]:
+    db = SessionLocalAuth()
+    try:
+        return get_auth_use_case(db).verify_token(token)
+    finally:
+        db.close()
+
+
+async def get_current_user_data_async(token: str = Depends(oauth2_scheme)) -> Dict[str, Any]:
+    """
+    Variante de `get_current_user_data` para endpoints async.
+
+    Con la sesión en caché no toca el threadpool; si no está, la verificación
+    contra la BD de autenticación se ejecuta en el threadpool.
+    """
+    user_data = session_cache.get(token)
+    if user_data is None:
+        user_data = await run_in_threadpool(_verify_token_sync, token)
+    if not user_data:
+        raise _unauthorized()
+    return user_data
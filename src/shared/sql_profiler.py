@@ -0,0 +1,242 @@
+"""
+Perfilador de consultas SQL por petición con detección de patrones N+1.
+
+Se activa para todas las peticiones con SQL_PROFILER_ENABLED o, si
+SQL_PROFILER_ALLOW_HEADER está habilitado, solo para las que envían la
+cabecera `X-SQL-Profile: 1`. El resumen viaja en la cabecera de respuesta
+`X-SQL-Profile` y el detalle queda disponible en /debug/sql-profiles.
+"""
+import contextvars
+import itertools
+import logging
+import re
+import threading
+import time
+from collections import Counter, deque
+from typing import Any, Dict, List, Optional
+
+from fastapi import FastAPI
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .config import settings
+from .exceptions import NotFoundError
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = "X-SQL-Profile"
+
+_WHITESPACE = re.compile(r"\s+")
+_STRING_LITERAL = re.compile(r"N?'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_BIND_PARAM = re.compile(r"\?|%\(\w+\)s|(?<!:):\w+|__\[POSTCOMPILE_\w+\]")
+_PARAM_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+
+
+def fingerprint(statement: str) -> str:
+    """Normaliza la sentencia: literales y parámetros como `?`, listas IN colapsadas."""
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _BIND_PARAM.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _PARAM_LIST.sub("(?)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+class QueryProfile:
+    """Consultas ejecutadas durante una petición."""
+
+    _ids = itertools.count(1)
+
+    def __init__(self, method: str, path: str):
+        self.id = next(self._ids)
+        self.method = method
+        self.path = path
+        self.route: Optional[str] = None
+        self.status: Optional[int] = None
+        self.started_at = time.time()
+        self.duration = 0.0
+        self.queries: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def record(self, database: str, statement: str, duration: float) -> None:
+        with self._lock:
+            self.queries.append({"database": database, "statement": statement, "duration": duration})
+
+    @property
+    def db_time(self) -> float:
+        return sum(q["duration"] for q in self.queries)
+
+    def duplicates(self) -> List[Dict[str, Any]]:
+        """Sentencias (por fingerprint) ejecutadas más de una vez, de mayor a menor."""
+        counts = Counter(fingerprint(q["statement"]) for q in self.queries)
+        return [
+            {"fingerprint": fp, "count": count}
+            for fp, count in counts.most_common()
+            if count > 1
+        ]
+
+    def n_plus_one(self) -> List[Dict[str, Any]]:
+        """SELECT repetidos al menos SQL_PROFILER_N_PLUS_ONE_THRESHOLD veces: probable carga perezosa en bucle."""
+        threshold = settings.SQL_PROFILER_N_PLUS_ONE_THRESHOLD
+        return [
+            duplicate for duplicate in self.duplicates()
+            if duplicate["count"] >= threshold and duplicate["fingerprint"].upper().startswith("SELECT")
+        ]
+
+    def slowest(self, limit: int) -> List[Dict[str, Any]]:
+        return [
+            {"database": q["database"], "duration_ms": round(q["duration"] * 1000, 3),
+             "statement": q["statement"]}
+            for q in sorted(self.queries, key=lambda q: q["duration"], reverse=True)[:limit]
+        ]
+
+    def header_value(self) -> str:
+        return (
+            f"id={self.id}; queries={len(self.queries)}; db_ms={self.db_time * 1000:.1f}; "
+            f"duplicates={len(self.duplicates())}; n_plus_one={len(self.n_plus_one())}"
+        )
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "method": self.method,
+            "path": self.path,
+            "route": self.route,
+            "status": self.status,
+            "duration_ms": round(self.duration * 1000, 3),
+            "queries": len(self.queries),
+            "db_time_ms": round(self.db_time * 1000, 3),
+            "duplicates": len(self.duplicates()),
+            "n_plus_one": len(self.n_plus_one()),
+        }
+
+    def detail(self) -> Dict[str, Any]:
+        return {
+            **self.summary(),
+            "n_plus_one_candidates": self.n_plus_one(),
+            "duplicate_statements": self.duplicates(),
+            "slowest": self.slowest(settings.SQL_PROFILER_SLOWEST_LIMIT),
+        }
+
+
+_current_profile: contextvars.ContextVar[Optional[QueryProfile]] = contextvars.ContextVar(
+    "sql_profile", default=None
+)
+_profiles: "deque[QueryProfile]" = deque(maxlen=settings.SQL_PROFILER_HISTORY_SIZE)
+_profiles_lock = threading.Lock()
+
+
+def instrument_profiler(engine: Engine, database: str) -> None:
+    """Registra las consultas de `engine` en el perfil de la petición activa (si lo hay)."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if _current_profile.get() is not None:
+            conn.info.setdefault("profiler_query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        profile = _current_profile.get()
+        starts = conn.info.get("profiler_query_start")
+        if profile is None or not starts:
+            return
+        profile.record(database, statement, time.perf_counter() - starts.pop())
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(exception_context):
+        connection = exception_context.connection
+        if connection is not None and connection.info.get("profiler_query_start"):
+            connection.info["profiler_query_start"].pop()
+
+
+class SQLProfilerMiddleware:
+    """
+    Abre un QueryProfile por petición perfilada y añade la cabecera de resumen.
+
+    La cabecera refleja las consultas hechas hasta el inicio de la respuesta;
+    las de un StreamingResponse solo aparecen en el detalle de /debug/sql-profiles.
+    """
+
+    def __init__(self, app: ASGIApp, always: bool, allow_header: bool):
+        self.app = app
+        self.always = always
+        self.allow_header = allow_header
+
+    def _should_profile(self, scope: Scope) -> bool:
+        if scope["path"].startswith("/debug/sql-profiles"):
+            return False
+        if self.always:
+            return True
+        return self.allow_header and Headers(scope=scope).get(PROFILE_HEADER.lower(), "") in ("1", "true")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._should_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        profile = QueryProfile(scope["method"], scope["path"])
+        token = _current_profile.set(profile)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                profile.status = message["status"]
+                MutableHeaders(scope=message)[PROFILE_HEADER] = profile.header_value()
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current_profile.reset(token)
+            profile.duration = time.perf_counter() - start
+            profile.route = getattr(scope.get("route"), "path", None)
+            with _profiles_lock:
+                _profiles.append(profile)
+            candidates = profile.n_plus_one()
+            if candidates:
+                logger.warning(
+                    "Posible N+1 en %s %s: %s",
+                    profile.method, profile.path,
+                    "; ".join(f"{c['count']}x {c['fingerprint'][:120]}" for c in candidates),
+                )
+
+
+def get_profile(profile_id: int) -> Optional[QueryProfile]:
+    with _profiles_lock:
+        return next((p for p in _profiles if p.id == profile_id), None)
+
+
+def list_profiles() -> List[QueryProfile]:
+    with _profiles_lock:
+        return list(reversed(_profiles))
+
+
+def configure_sql_profiler(app: FastAPI, service_name: str = "API") -> None:
+    """Instala el perfilador si está habilitado por configuración o por cabecera."""
+    if not (settings.SQL_PROFILER_ENABLED or settings.SQL_PROFILER_ALLOW_HEADER):
+        return
+    app.add_middleware(
+        SQLProfilerMiddleware,
+        always=settings.SQL_PROFILER_ENABLED,
+        allow_header=settings.SQL_PROFILER_ALLOW_HEADER,
+    )
+
+    @app.get("/debug/sql-profiles", include_in_schema=False)
+    async def sql_profiles(only_n_plus_one: bool = False):
+        """Perfiles recientes (el más nuevo primero)."""
+        profiles = list_profiles()
+        if only_n_plus_one:
+            profiles = [p for p in profiles if p.n_plus_one()]
+        return {"profiles": [p.summary() for p in profiles]}
+
+    @app.get("/debug/sql-profiles/{profile_id}", include_in_schema=False)
+    async def sql_profile_detail(profile_id: int):
+        profile = get_profile(profile_id)
+        if profile is None:
+            raise NotFoundError(f"No existe el perfil SQL {profile_id}")
+        return profile.detail()
+
+    mode = "todas las peticiones" if settings.SQL_PROFILER_ENABLED else f"cabecera {PROFILE_HEADER}: 1"
+    print(f"[{service_name}] Perfilador SQL activo ({mode})")